@@ -8,58 +8,13 @@ Usage:
 """
 
 import argparse
-import gzip
-import io
-import pickle
 import sys
-import zipfile
 from pathlib import Path
 from typing import Any, Dict
 
-import joblib
 import numpy as np
 
-
-def _decode_pickle(contents: bytes) -> Any:
-    """Decode pickle using multiple methods (plain, joblib, gzip, zip)."""
-    buffer = io.BytesIO(contents)
-
-    # 1) Plain pickle
-    try:
-        return pickle.load(buffer)
-    except Exception as e:
-        print(f"  Plain pickle failed: {e}")
-        buffer.seek(0)
-
-    # 2) Joblib (handles joblib/zlib wrapped pickles)
-    try:
-        return joblib.load(buffer)
-    except Exception as e:
-        print(f"  Joblib pickle failed: {e}")
-        buffer.seek(0)
-
-    # 3) gzip-compressed pickle
-    try:
-        with gzip.GzipFile(fileobj=buffer) as gz:
-            return pickle.load(gz)
-    except Exception as e:
-        print(f"  Gzip pickle failed: {e}")
-        buffer.seek(0)
-
-    # 4) Zip archive containing a pickle
-    try:
-        with zipfile.ZipFile(buffer) as zf:
-            for name in zf.namelist():
-                with zf.open(name) as inner:
-                    data = inner.read()
-                    try:
-                        return pickle.loads(data)
-                    except Exception:
-                        continue
-    except Exception as e:
-        print(f"  Zip pickle failed: {e}")
-
-    raise ValueError("Unable to decode pickle: unknown format")
+from smpl_service.decoding import decode_payload
 
 
 def _inspect_value(value: Any, indent: int = 0, max_depth: int = 3, current_depth: int = 0) -> None:
@@ -122,8 +77,8 @@ def debug_pickle(file_path: Path) -> None:
     try:
         with open(file_path, "rb") as f:
             contents = f.read()
-        data = _decode_pickle(contents)
-        print("✓ Successfully decoded pickle!")
+        data, source_format = decode_payload(contents)
+        print(f"✓ Successfully decoded pickle! (format: {source_format})")
     except Exception as e:
         print(f"✗ Failed to decode pickle: {e}")
         sys.exit(1)
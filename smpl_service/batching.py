@@ -0,0 +1,149 @@
+import asyncio
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from smpl_service.workers import WorkerPool
+
+
+class _Queue:
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        # (item, size, future, enqueued at), oldest first.
+        self.items: List[Tuple[Any, int, Future, float]] = []
+        self.size = 0
+        # A batch of this queue is waiting for a worker (or for max_wait); new jobs join it.
+        self.scheduled = False
+        self.timer: Optional[asyncio.TimerHandle] = None
+
+
+class MicroBatcher:
+    """Fuse concurrent small jobs that share a key into one call on the worker pool.
+
+    :meth:`submit` is awaited from the event loop, so a queued job holds no
+    worker. Jobs queue per key, and each queue has at most one batch waiting
+    for the pool. When a worker picks that batch up, it takes every job queued
+    by then (up to ``max_batch`` units) and runs ``fuse(key, items)`` once;
+    later arrivals start the next batch. An idle pool therefore runs a lone job
+    straight away, while a busy one fuses everything that arrives as long as
+    the workers are occupied, however many workers there are. ``max_wait``
+    optionally holds a new batch back that long before it is submitted (unless
+    it fills up first). Jobs of ``max_batch`` units or more bypass the queue.
+
+    Batches are submitted with :meth:`WorkerPool.submit_admitted`: the callers
+    were admitted by the pool for their earlier stages, and with at most one
+    waiting batch per key the batcher adds little backlog of its own.
+    """
+
+    def __init__(
+        self,
+        fuse: Callable[[Hashable, List[Any]], List[Any]],
+        pool: WorkerPool,
+        max_wait: float,
+        max_batch: int,
+    ):
+        self.fuse = fuse
+        self.pool = pool
+        self.max_wait = max_wait
+        self.max_batch = max_batch
+        self._queues: Dict[Hashable, _Queue] = {}
+        self._lock = threading.Lock()
+        self._counters = {
+            "batches": 0,
+            "jobs": 0,
+            "units": 0,
+            "bypassed": 0,
+            "flushed_full": 0,
+            "wait_seconds": 0.0,
+        }
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_batch > 0
+
+    async def submit(self, key: Hashable, item: Any, size: int) -> Any:
+        """Evaluate ``item`` (``size`` units) as part of a fused batch and return its own output."""
+        if not self.enabled or size >= self.max_batch:
+            with self._lock:
+                self._counters["bypassed"] += 1
+            return (await self.pool.run_admitted(self.fuse, key, [item]))[0]
+
+        loop = asyncio.get_running_loop()
+        future: Future = Future()
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue is None:
+                queue = self._queues[key] = _Queue(loop)
+            queue.loop = loop
+            queue.items.append((item, size, future, time.perf_counter()))
+            queue.size += size
+            start_batch = not queue.scheduled
+            queue.scheduled = True
+            full = queue.size >= self.max_batch
+
+        # Timers are only touched here and in _dispatch, both on the event loop.
+        if start_batch and self.max_wait > 0 and not full:
+            queue.timer = loop.call_later(self.max_wait, self._dispatch, key)
+        elif start_batch or (full and queue.timer is not None):
+            self._dispatch(key)
+        return await asyncio.wrap_future(future)
+
+    def _dispatch(self, key: Hashable) -> None:
+        """Hand the key's open batch to the pool (event loop side)."""
+        queue = self._queues[key]
+        if queue.timer is not None:
+            queue.timer.cancel()
+            queue.timer = None
+        self.pool.submit_admitted(self._run, key)
+
+    def _run(self, key: Hashable) -> None:
+        """Take the queued jobs and evaluate them together (worker side)."""
+        with self._lock:
+            queue = self._queues[key]
+            batch: List[Tuple[Any, int, Future, float]] = []
+            units = 0
+            while queue.items and (not batch or units + queue.items[0][1] <= self.max_batch):
+                batch.append(queue.items.pop(0))
+                units += batch[-1][1]
+            queue.size -= units
+            # Jobs that did not fit start the next batch at once.
+            queue.scheduled = bool(queue.items)
+            redispatch = queue.scheduled
+            loop = queue.loop
+            if batch:
+                self._record(batch, units)
+        if redispatch:
+            loop.call_soon_threadsafe(self._dispatch, key)
+
+        # Requests that went away while queued are dropped from the batch.
+        batch = [entry for entry in batch if entry[2].set_running_or_notify_cancel()]
+        if not batch:
+            return
+        try:
+            outputs = self.fuse(key, [item for item, _, _, _ in batch])
+        except BaseException as exc:
+            for _, _, future, _ in batch:
+                future.set_exception(exc)
+            return
+        for (_, _, future, _), output in zip(batch, outputs):
+            future.set_result(output)
+
+    def _record(self, batch: List[Tuple[Any, int, Future, float]], units: int) -> None:
+        self._counters["batches"] += 1
+        self._counters["jobs"] += len(batch)
+        self._counters["units"] += units
+        if units >= self.max_batch:
+            self._counters["flushed_full"] += 1
+        self._counters["wait_seconds"] += time.perf_counter() - batch[0][3]
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._counters)
+        batches = stats["batches"]
+        stats["max_wait_ms"] = self.max_wait * 1000.0
+        stats["max_batch"] = self.max_batch
+        stats["mean_jobs_per_batch"] = stats["jobs"] / batches if batches else 0.0
+        stats["mean_batch_fill"] = stats["units"] / (batches * self.max_batch) if batches else 0.0
+        stats["mean_wait_ms"] = stats.pop("wait_seconds") * 1000.0 / batches if batches else 0.0
+        return stats
@@ -0,0 +1,97 @@
+"""Compact binary framing for SMPL sequence responses.
+
+Layout (all integers little-endian)::
+
+    b"SMPLBIN1"            8-byte magic
+    uint32 header_length   length of the JSON header in bytes (padding included)
+    header                 UTF-8 JSON, space-padded so the body starts 16-byte aligned
+    body                   raw array buffers, each starting on a 16-byte boundary
+
+The header holds the scalar metadata of the JSON response plus a ``buffers``
+map of ``name -> {"dtype", "shape", "offset", "byteLength"}`` where ``offset`` is
+relative to the start of the body. Alignment lets browsers wrap each buffer in a
+typed array view without copying.
+
+Streaming responses concatenate such payloads, each prefixed with its uint32 length.
+"""
+
+import json
+import struct
+from typing import Dict, Iterator, Tuple
+
+import numpy as np
+
+
+SMPL_BINARY_MEDIA_TYPE = "application/vnd.opencap.smpl-sequence"
+SMPL_BINARY_STREAM_MEDIA_TYPE = "application/vnd.opencap.smpl-sequence-stream"
+SMPL_BINARY_MAGIC = b"SMPLBIN1"
+SMPL_BINARY_ALIGNMENT = 16
+
+_PREFIX = struct.Struct("<8sI")
+_FRAME_LENGTH = struct.Struct("<I")
+
+
+def _align(size: int) -> int:
+    return (size + SMPL_BINARY_ALIGNMENT - 1) // SMPL_BINARY_ALIGNMENT * SMPL_BINARY_ALIGNMENT
+
+
+def encode_binary(header: Dict, arrays: Dict[str, np.ndarray]) -> bytes:
+    """Pack metadata and arrays into a single buffer, copying each array once."""
+    contiguous = {}
+    buffers = {}
+    offset = 0
+    for name, array in arrays.items():
+        arr = np.asarray(array)
+        arr = np.ascontiguousarray(arr, dtype=arr.dtype.newbyteorder("<"))
+        contiguous[name] = arr
+        buffers[name] = {
+            "dtype": arr.dtype.name,
+            "shape": [int(dim) for dim in arr.shape],
+            "offset": offset,
+            "byteLength": int(arr.nbytes),
+        }
+        offset = _align(offset + arr.nbytes)
+
+    header_bytes = json.dumps({**header, "buffers": buffers}, separators=(",", ":")).encode("utf-8")
+    header_length = _align(_PREFIX.size + len(header_bytes)) - _PREFIX.size
+    parts = [_PREFIX.pack(SMPL_BINARY_MAGIC, header_length), header_bytes.ljust(header_length, b" ")]
+    for arr in contiguous.values():
+        parts.append(memoryview(arr).cast("B"))
+        padding = _align(arr.nbytes) - arr.nbytes
+        if padding:
+            parts.append(b"\0" * padding)
+    return b"".join(parts)
+
+
+def decode_binary(data: bytes) -> Tuple[Dict, Dict[str, np.ndarray]]:
+    """Inverse of :func:`encode_binary`; arrays are read-only views into ``data``."""
+    magic, header_length = _PREFIX.unpack_from(data, 0)
+    if magic != SMPL_BINARY_MAGIC:
+        raise ValueError("Not an SMPL binary payload")
+    body_start = _PREFIX.size + header_length
+    header = json.loads(bytes(data[_PREFIX.size:body_start]).decode("utf-8"))
+
+    arrays = {}
+    for name, spec in header.pop("buffers").items():
+        dtype = np.dtype(spec["dtype"]).newbyteorder("<")
+        count = spec["byteLength"] // dtype.itemsize
+        flat = np.frombuffer(data, dtype=dtype, count=count, offset=body_start + spec["offset"])
+        arrays[name] = flat.reshape(spec["shape"])
+    return header, arrays
+
+
+def encode_stream_frame(header: Dict, arrays: Dict[str, np.ndarray]) -> bytes:
+    """Encode one length-prefixed message of a binary stream."""
+    payload = encode_binary(header, arrays)
+    return _FRAME_LENGTH.pack(len(payload)) + payload
+
+
+def iter_stream_frames(data: bytes) -> Iterator[Tuple[Dict, Dict[str, np.ndarray]]]:
+    """Decode every message of a complete binary stream body."""
+    offset = 0
+    view = memoryview(data)
+    while offset < len(data):
+        (length,) = _FRAME_LENGTH.unpack_from(data, offset)
+        offset += _FRAME_LENGTH.size
+        yield decode_binary(view[offset:offset + length])
+        offset += length
@@ -0,0 +1,285 @@
+import hashlib
+import os
+import pickle
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+import numpy as np
+
+
+def _estimate_nbytes(value: Any) -> int:
+    """Rough in-memory size of a cached result (numpy buffers dominate)."""
+    if isinstance(value, np.ndarray):
+        return int(value.nbytes)
+    if isinstance(value, dict):
+        return sum(_estimate_nbytes(item) for item in value.values())
+    if isinstance(value, (list, tuple)):
+        return sum(_estimate_nbytes(item) for item in value)
+    if isinstance(value, (bytes, str)):
+        return len(value)
+    return 64
+
+
+class ResultCache:
+    """Content-addressed cache with a bounded in-memory LRU tier and an optional disk tier.
+
+    Keys are hex digests built with :meth:`make_key`. Values are kept as-is in
+    memory (callers must treat them as read-only) and pickled on disk. The disk
+    tier evicts the least recently used files once ``max_disk_bytes`` is exceeded.
+    """
+
+    def __init__(
+        self,
+        max_entries: int,
+        max_memory_bytes: int,
+        disk_dir: Optional[Path] = None,
+        max_disk_bytes: int = 0,
+    ):
+        self.max_entries = max_entries
+        self.max_memory_bytes = max_memory_bytes
+        self.disk_dir = disk_dir
+        self.max_disk_bytes = max_disk_bytes
+        self._entries: "OrderedDict[str, Any]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._counters = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "memory_evictions": 0,
+            "disk_evictions": 0,
+        }
+        if self.disk_dir is not None:
+            self.disk_dir.mkdir(parents=True, exist_ok=True)
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0 or self.disk_dir is not None
+
+    @staticmethod
+    def make_key(*parts: Optional[bytes]) -> str:
+        """Hash each part separately so (a, b) and (a + b, None) never collide."""
+        return ResultCache.make_key_from_digests(
+            *(hashlib.sha256(part).digest() if part is not None else None for part in parts)
+        )
+
+    @staticmethod
+    def make_key_from_digests(*digests: Optional[bytes]) -> str:
+        """Same key as :meth:`make_key`, from the parts' SHA-256 digests (e.g. hashed while streaming)."""
+        digest = hashlib.sha256()
+        for part_digest in digests:
+            digest.update(part_digest if part_digest is not None else b"\0" * 32)
+        return digest.hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self._counters["memory_hits"] += 1
+                return self._entries[key]
+
+        value = self._read_disk(key)
+        with self._lock:
+            if value is None:
+                self._counters["misses"] += 1
+                return None
+            self._counters["disk_hits"] += 1
+            self._store_memory(key, value)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        with self._lock:
+            self._store_memory(key, value)
+        self._write_disk(key, value)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats: Dict[str, Any] = dict(self._counters)
+            lookups = stats["memory_hits"] + stats["disk_hits"] + stats["misses"]
+            stats["hit_ratio"] = (stats["memory_hits"] + stats["disk_hits"]) / lookups if lookups else 0.0
+            stats["memory_entries"] = len(self._entries)
+            stats["memory_bytes"] = self._memory_bytes
+            stats["max_entries"] = self.max_entries
+            stats["max_memory_bytes"] = self.max_memory_bytes
+        if self.disk_dir is not None:
+            files = list(self.disk_dir.glob("*.pkl"))
+            stats["disk_entries"] = len(files)
+            stats["disk_bytes"] = sum(path.stat().st_size for path in files if path.exists())
+            stats["max_disk_bytes"] = self.max_disk_bytes
+        return stats
+
+    def _store_memory(self, key: str, value: Any) -> None:
+        if self.max_entries <= 0:
+            return
+        size = _estimate_nbytes(value)
+        if size > self.max_memory_bytes:
+            return
+
+        if key in self._entries:
+            self._memory_bytes -= self._sizes[key]
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        self._sizes[key] = size
+        self._memory_bytes += size
+
+        while len(self._entries) > self.max_entries or self._memory_bytes > self.max_memory_bytes:
+            evicted_key, _ = self._entries.popitem(last=False)
+            self._memory_bytes -= self._sizes.pop(evicted_key)
+            self._counters["memory_evictions"] += 1
+
+    def _disk_path(self, key: str) -> Path:
+        return self.disk_dir / f"{key}.pkl"
+
+    def _read_disk(self, key: str) -> Optional[Any]:
+        if self.disk_dir is None:
+            return None
+        path = self._disk_path(key)
+        try:
+            with open(path, "rb") as handle:
+                value = pickle.load(handle)
+            os.utime(path)  # Bump mtime so eviction stays least-recently-used
+            return value
+        except FileNotFoundError:
+            return None
+        except Exception as exc:
+            print(f"Warning: Dropping unreadable cache entry {path.name}: {exc}")
+            path.unlink(missing_ok=True)
+            return None
+
+    def _write_disk(self, key: str, value: Any) -> None:
+        if self.disk_dir is None or self.max_disk_bytes <= 0:
+            return
+        path = self._disk_path(key)
+        tmp_path = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            with open(tmp_path, "wb") as handle:
+                pickle.dump(value, handle, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, path)
+        except Exception as exc:
+            print(f"Warning: Failed to write cache entry {path.name}: {exc}")
+            tmp_path.unlink(missing_ok=True)
+            return
+        self._evict_disk()
+
+    def _evict_disk(self) -> None:
+        entries = []
+        total = 0
+        for path in self.disk_dir.glob("*.pkl"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_disk_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+            with self._lock:
+                self._counters["disk_evictions"] += 1
+
+
+class SequenceStore:
+    """In-memory store of uploaded sequences addressed by random ids, with idle expiry and LRU eviction.
+
+    An entry expires ``ttl`` seconds after it was last added, read or updated;
+    the least recently used entries are also evicted once ``max_entries`` or
+    ``max_memory_bytes`` is exceeded. Values are kept as-is: callers treat them
+    as read-only and :meth:`put` a new value to extend an entry, so its size is
+    re-counted.
+    """
+
+    def __init__(self, max_entries: int, max_memory_bytes: int, ttl: float):
+        self.max_entries = max_entries
+        self.max_memory_bytes = max_memory_bytes
+        self.ttl = ttl
+        # id -> (value, size, last used); ordered from least to most recently used.
+        self._entries: "OrderedDict[str, Tuple[Any, int, float]]" = OrderedDict()
+        self._memory_bytes = 0
+        self._lock = threading.Lock()
+        self._counters = {"created": 0, "hits": 0, "misses": 0, "expired": 0, "evictions": 0, "rejected": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def add(self, value: Any) -> Optional[str]:
+        """Store a new value and return its id (None when the value alone exceeds the memory budget)."""
+        size = _estimate_nbytes(value)
+        with self._lock:
+            if size > self.max_memory_bytes:
+                self._counters["rejected"] += 1
+                return None
+            key = secrets.token_urlsafe(16)
+            self._store(key, value, size)
+            self._counters["created"] += 1
+        return key
+
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            self._expire()
+            entry = self._entries.get(key)
+            if entry is None:
+                self._counters["misses"] += 1
+                return None
+            value, size, _ = entry
+            self._entries[key] = (value, size, time.monotonic())
+            self._entries.move_to_end(key)
+            self._counters["hits"] += 1
+            return value
+
+    def put(self, key: str, value: Any) -> bool:
+        """Replace an existing entry; False (entry unchanged) if it is gone or the new value does not fit."""
+        size = _estimate_nbytes(value)
+        with self._lock:
+            self._expire()
+            if key not in self._entries or size > self.max_memory_bytes:
+                return False
+            self._memory_bytes -= self._entries.pop(key)[1]
+            self._store(key, value, size)
+        return True
+
+    def delete(self, key: str) -> bool:
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return False
+            self._memory_bytes -= entry[1]
+        return True
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            self._expire()
+            stats: Dict[str, Any] = dict(self._counters)
+            stats["entries"] = len(self._entries)
+            stats["memory_bytes"] = self._memory_bytes
+            stats["max_entries"] = self.max_entries
+            stats["max_memory_bytes"] = self.max_memory_bytes
+            stats["ttl_seconds"] = self.ttl
+        return stats
+
+    def _store(self, key: str, value: Any, size: int) -> None:
+        self._entries[key] = (value, size, time.monotonic())
+        self._memory_bytes += size
+        while len(self._entries) > self.max_entries or self._memory_bytes > self.max_memory_bytes:
+            _, (_, evicted_size, _) = self._entries.popitem(last=False)
+            self._memory_bytes -= evicted_size
+            self._counters["evictions"] += 1
+
+    def _expire(self) -> None:
+        deadline = time.monotonic() - self.ttl
+        while self._entries:
+            key, (_, size, last_used) = next(iter(self._entries.items()))
+            if last_used > deadline:
+                break
+            del self._entries[key]
+            self._memory_bytes -= size
+            self._counters["expired"] += 1
@@ -0,0 +1,87 @@
+"""Convert SMPL sequence pickles to uncompressed ``.npz`` bundles.
+
+The service memory-maps the arrays of an uncompressed ``.npz`` upload instead
+of unpickling them, so converted archives are evaluated chunk by chunk straight
+from the spooled file. Keys are kept as they are (``poses``, ``betas``,
+``trans``, ``cam_R``, ...); floating point arrays are stored as float32, which
+is what the service evaluates in, so they are used without a cast. Values that
+are not plain arrays, strings or numbers are skipped with a warning.
+
+Run it with::
+
+    python -m smpl_service.convert archive/*.pkl --output-dir archive_npz
+"""
+
+import argparse
+from pathlib import Path
+from typing import Any, Dict, Optional, Sequence
+
+import numpy as np
+
+from smpl_service.decoding import decode_payload, extract_sequence_dict
+
+
+def _as_array(value: Any) -> Optional[np.ndarray]:
+    if isinstance(value, (str, bytes)):
+        return np.asarray(value.decode() if isinstance(value, bytes) else value)
+    try:
+        array = np.asarray(value)
+    except (TypeError, ValueError):
+        return None
+    if array.dtype.hasobject:
+        return None
+    if np.issubdtype(array.dtype, np.floating):
+        array = array.astype(np.float32, copy=False)
+    return array
+
+
+def sequence_arrays(raw: Any) -> Dict[str, np.ndarray]:
+    """The arrays to store for a decoded sequence pickle."""
+    sequence = extract_sequence_dict(raw)
+    if not isinstance(sequence, dict):
+        raise ValueError("SMPL pickle must contain a dictionary.")
+
+    arrays = {}
+    for key, value in sequence.items():
+        if value is None:
+            continue
+        array = _as_array(value)
+        if array is None:
+            print(f"Warning: Skipping '{key}': {type(value).__name__} cannot be stored as an array.")
+            continue
+        arrays[str(key)] = array
+    return arrays
+
+
+def convert_file(source: Path, destination: Path) -> Dict[str, np.ndarray]:
+    with source.open("rb") as handle:
+        raw, _ = decode_payload(handle)
+    arrays = sequence_arrays(raw)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    np.savez(destination, **arrays)
+    return arrays
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Convert SMPL sequence pickles to memory-mappable .npz files.")
+    parser.add_argument("inputs", type=Path, nargs="+", help="Pickle files to convert.")
+    parser.add_argument("--output-dir", type=Path, default=None, help="Directory for the .npz files (default: next to each input).")
+    args = parser.parse_args(argv)
+
+    failures = 0
+    for source in args.inputs:
+        destination = (args.output_dir or source.parent) / f"{source.stem}.npz"
+        try:
+            arrays = convert_file(source, destination)
+        except Exception as exc:
+            failures += 1
+            print(f"Error: {source}: {exc}")
+            continue
+        frames = arrays["poses"].shape[0] if "poses" in arrays and arrays["poses"].ndim else "?"
+        print(f"{source} -> {destination} ({len(arrays)} arrays, {frames} frames)")
+    if failures:
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,225 @@
+"""Container sniffing and decoding for uploaded SMPL / OpenCap pickles.
+
+The container is identified from its leading magic bytes and decoded directly,
+instead of attempting one full parse per known format and keeping the first
+that does not raise. Sources may be bytes or a seekable binary file (e.g. a
+spooled upload); files are decoded as streams, and ``.npy`` payloads in a real
+file, as well as the members of an uncompressed ``.npz`` bundle, are
+memory-mapped rather than read. Shared by the service, ``debug_pkl.py`` and
+the ``smpl_service.convert`` CLI, so it must stay free of torch and FastAPI.
+"""
+
+import bz2
+import gzip
+import io
+import lzma
+import pickle
+import struct
+import zipfile
+import zlib
+from typing import Any, BinaryIO, Optional, Tuple, Union
+
+import joblib
+import numpy as np
+
+
+# (format, magic prefix) in match order; joblib's compressed dumps use these same headers.
+_MAGIC_PREFIXES = (
+    ("gzip", b"\x1f\x8b"),
+    ("zip", b"PK\x03\x04"),
+    ("zip", b"PK\x05\x06"),
+    ("bz2", b"BZh"),
+    ("xz", b"\xfd7zXZ\x00"),
+    ("lz4", b"\x04\x22\x4d\x18"),
+    ("joblib", b"ZF"),
+)
+_NUMPY_MAGIC = b"\x93NUMPY"
+
+Source = Union[bytes, bytearray, memoryview, BinaryIO]
+
+
+def _as_file(source: Source) -> BinaryIO:
+    if isinstance(source, (bytes, bytearray, memoryview)):
+        return io.BytesIO(source)
+    source.seek(0)
+    return source
+
+
+def sniff_format(source: Source) -> str:
+    """Name the container of an upload from its first bytes.
+
+    Returns ``gzip``, ``zip``, ``npz``, ``bz2``, ``xz``, ``lz4``, ``joblib``,
+    ``zlib``, ``npy``, ``pickle`` (protocol 2+ header) or ``unknown``.
+    """
+    handle = _as_file(source)
+    head = handle.read(8)
+    handle.seek(0)
+    for name, magic in _MAGIC_PREFIXES:
+        if head.startswith(magic):
+            if name == "zip" and _is_npz(handle):
+                return "npz"
+            return name
+    if head.startswith(_NUMPY_MAGIC):
+        return "npy"
+    if len(head) >= 2 and head[0] == 0x78 and (head[0] << 8 | head[1]) % 31 == 0:
+        return "zlib"
+    if len(head) >= 2 and head[0] == 0x80 and 2 <= head[1] <= pickle.HIGHEST_PROTOCOL:
+        return "pickle"
+    return "unknown"
+
+
+def _is_npz(handle: BinaryIO) -> bool:
+    try:
+        with zipfile.ZipFile(handle) as archive:
+            names = archive.namelist()
+    except zipfile.BadZipFile:
+        return False
+    finally:
+        handle.seek(0)
+    return bool(names) and all(name.endswith(".npy") for name in names)
+
+
+def _load_pickle_or_joblib(handle: BinaryIO) -> Any:
+    # Uncompressed joblib dumps share the pickle header but need joblib's unpickler for their arrays.
+    try:
+        return pickle.load(handle)
+    except Exception:
+        handle.seek(0)
+        return joblib.load(handle)
+
+
+def _load_compressed(opener, handle: BinaryIO) -> Any:
+    """Stream-decompress a pickle; joblib dumps in the same container go through joblib instead."""
+    try:
+        with opener(handle) as stream:
+            return pickle.load(stream)
+    except Exception:
+        handle.seek(0)
+        return joblib.load(handle)
+
+
+def _decode_zip(handle: BinaryIO) -> Any:
+    with zipfile.ZipFile(handle) as archive:
+        for name in archive.namelist():
+            with archive.open(name) as inner:
+                data = inner.read()
+            try:
+                return decode_payload(data)[0]
+            except ValueError:
+                continue
+    raise ValueError("zip archive contains no readable pickle")
+
+
+def _has_fileno(handle: BinaryIO) -> bool:
+    try:
+        handle.fileno()
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        return False
+    return True
+
+
+def _map_npy(handle: BinaryIO, offset: int) -> Optional[np.ndarray]:
+    """Memory-map the ``.npy`` array starting at ``offset`` of a real file (None if its header version is unsupported).
+
+    The map is copy-on-write, so the array is writable (torch accepts it without
+    a copy) while the file itself is never modified.
+    """
+    handle.seek(offset)
+    version = np.lib.format.read_magic(handle)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(handle)
+    elif version == (2, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(handle)
+    else:
+        return None
+    if dtype.hasobject:
+        raise ValueError("Object arrays are not supported in .npy/.npz uploads")
+    order = "F" if fortran_order else "C"
+    return np.memmap(handle, dtype=dtype, mode="c", offset=handle.tell(), shape=shape, order=order)
+
+
+def _zip_member_offset(handle: BinaryIO, info: zipfile.ZipInfo) -> int:
+    """Offset of a member's data: its local header is 30 bytes plus the name and extra field."""
+    handle.seek(info.header_offset)
+    local_header = handle.read(30)
+    name_length, extra_length = struct.unpack("<HH", local_header[26:30])
+    return info.header_offset + 30 + name_length + extra_length
+
+
+def _decode_npz(handle: BinaryIO) -> dict:
+    """Arrays of an ``.npz`` bundle; stored (uncompressed) members of a real file are memory-mapped in place."""
+    arrays = {}
+    mappable = _has_fileno(handle)
+    with zipfile.ZipFile(handle) as archive:
+        for info in archive.infolist():
+            name = info.filename[:-len(".npy")]
+            if mappable and info.compress_type == zipfile.ZIP_STORED:
+                array = _map_npy(handle, _zip_member_offset(handle, info))
+                if array is not None:
+                    arrays[name] = array
+                    continue
+            with archive.open(info) as member:
+                arrays[name] = np.lib.format.read_array(member, allow_pickle=False)
+    return arrays
+
+
+def _decode_npy(handle: BinaryIO) -> np.ndarray:
+    if _has_fileno(handle):
+        array = _map_npy(handle, 0)
+        if array is not None:
+            return array
+    handle.seek(0)
+    return np.load(handle, allow_pickle=False)
+
+
+def _decode_as(container: str, handle: BinaryIO) -> Any:
+    if container == "gzip":
+        return _load_compressed(lambda fileobj: gzip.GzipFile(fileobj=fileobj, mode="rb"), handle)
+    if container == "bz2":
+        return _load_compressed(bz2.BZ2File, handle)
+    if container == "xz":
+        return _load_compressed(lzma.LZMAFile, handle)
+    if container == "zlib":
+        try:
+            return joblib.load(handle)
+        except Exception:
+            handle.seek(0)
+            return _load_pickle_or_joblib(io.BytesIO(zlib.decompress(handle.read())))
+    if container in ("joblib", "lz4"):
+        return joblib.load(handle)
+    if container == "npz":
+        return _decode_npz(handle)
+    if container == "npy":
+        return _decode_npy(handle)
+    if container == "zip":
+        return _decode_zip(handle)
+    return _load_pickle_or_joblib(handle)
+
+
+def decode_payload(source: Source) -> Tuple[Any, str]:
+    """Decode an uploaded file (bytes or a seekable binary file) and return ``(data, format)``.
+
+    Raises ValueError (prefixed "Unable to decode pickle") when the detected
+    container cannot be decoded.
+    """
+    handle = _as_file(source)
+    container = sniff_format(handle)
+    try:
+        return _decode_as(container, handle), container
+    except Exception as exc:
+        if container == "unknown":
+            raise ValueError(f"Unable to decode pickle: unknown format ({exc})") from exc
+        raise ValueError(f"Unable to decode pickle: invalid {container} data ({exc})") from exc
+
+
+def decode_pickle(source: Source) -> Any:
+    return decode_payload(source)[0]
+
+
+def extract_sequence_dict(raw: Any) -> Any:
+    """Some pickles wrap the sequence in a single-key dict (e.g. {'0': {...}})."""
+    if isinstance(raw, dict) and len(raw) == 1:
+        candidate = next(iter(raw.values()))
+        if isinstance(candidate, dict):
+            return candidate
+    return raw
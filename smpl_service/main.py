@@ -1,24 +1,97 @@
+import asyncio
 import base64
-import gzip
-import io
-import pickle
-import zipfile
+import hashlib
+import json
+import os
+import threading
+import time
+from contextlib import asynccontextmanager
 from pathlib import Path
-from typing import Dict, Optional, Tuple
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
 
-import joblib
 import numpy as np
 import torch
-from fastapi import FastAPI, File, HTTPException, UploadFile
+from fastapi import FastAPI, File, HTTPException, Query, Request, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from starlette.concurrency import run_in_threadpool
 from smplx import SMPLLayer
-from smplx.lbs import batch_rodrigues
-
+from smplx.lbs import batch_rigid_transform, batch_rodrigues, blend_shapes, vertices2joints
+
+from smpl_service.batching import MicroBatcher
+from smpl_service.binary_format import (
+    SMPL_BINARY_MEDIA_TYPE,
+    SMPL_BINARY_STREAM_MEDIA_TYPE,
+    encode_binary,
+    encode_stream_frame,
+)
+from smpl_service.cache import ResultCache, SequenceStore
+from smpl_service.decoding import decode_payload, decode_pickle, extract_sequence_dict
+from smpl_service.mesh_lod import simplify_vertex_subset
+from smpl_service.projection import project_points, project_points_chunked
+from smpl_service.quantization import VERTEX_ENCODINGS, encode_vertices
+from smpl_service.resampling import (
+    interpolation_weights,
+    lerp,
+    resample_axis_angle,
+    resample_rotation_matrices,
+    resample_times,
+)
+from smpl_service.skeleton import load_json, opencap_joints, openpose_keypoints, time_values
+from smpl_service.tuning import calibrate, load_tuning, resolve_tuning, save_tuning
+from smpl_service.uploads import UploadSizeLimitMiddleware, upload_digest, upload_file
+from smpl_service.workers import WorkerPool, WorkerPoolFull
 
 ROOT_DIR = Path(__file__).resolve().parents[1]
 SMPL_MODEL_DIR = ROOT_DIR / "body_models" / "smpl"
-SMPL_BATCH_SIZE = 128
+SMPL_BATCH_SIZE = int(os.environ.get("SMPL_BATCH_SIZE", "128"))
+
+# Batch size / torch threads calibration (see smpl_service/tuning.py). Explicit
+# SMPL_BATCH_SIZE / SMPL_TORCH_THREADS take precedence over the tuning file.
+SMPL_TUNING_FILE = Path(os.environ.get("SMPL_TUNING_FILE", str(ROOT_DIR / "body_models" / "smpl_tuning.json")))
+SMPL_AUTOTUNE = os.environ.get("SMPL_AUTOTUNE", "0") == "1"
+SMPL_TORCH_THREADS = int(os.environ.get("SMPL_TORCH_THREADS", "0"))
+SMPL_PROCESS_COUNT = int(os.environ.get("WEB_CONCURRENCY", "1"))
+
+# Result cache for /api/smpl/sequence. Set SMPL_CACHE_DIR to enable the disk tier.
+SMPL_CACHE_MAX_ENTRIES = int(os.environ.get("SMPL_CACHE_MAX_ENTRIES", "16"))
+SMPL_CACHE_MAX_BYTES = int(os.environ.get("SMPL_CACHE_MAX_BYTES", str(1024 ** 3)))
+SMPL_CACHE_DIR = os.environ.get("SMPL_CACHE_DIR")
+SMPL_CACHE_DISK_MAX_BYTES = int(os.environ.get("SMPL_CACHE_DISK_MAX_BYTES", str(10 * 1024 ** 3)))
+
+# Upload-once sequence handles (/api/smpl/sequences). SMPL_SEQUENCE_STORE_MAX_ENTRIES=0 disables them.
+SMPL_SEQUENCE_STORE_MAX_ENTRIES = int(os.environ.get("SMPL_SEQUENCE_STORE_MAX_ENTRIES", "64"))
+SMPL_SEQUENCE_STORE_MAX_BYTES = int(os.environ.get("SMPL_SEQUENCE_STORE_MAX_BYTES", str(2 * 1024 ** 3)))
+SMPL_SEQUENCE_STORE_TTL = float(os.environ.get("SMPL_SEQUENCE_STORE_TTL", "1800"))
+
+# Heavy stages (decoding, SMPL forward, projection) run on this pool instead of the event loop.
+SMPL_WORKER_THREADS = int(os.environ.get("SMPL_WORKER_THREADS", "2"))
+SMPL_WORKER_QUEUE_SIZE = int(os.environ.get("SMPL_WORKER_QUEUE_SIZE", "8"))
+SMPL_WORKER_RETRY_AFTER = os.environ.get("SMPL_WORKER_RETRY_AFTER", "5")
+# A streaming response whose client reads nothing for this long gives its worker back.
+SMPL_STREAM_IDLE_TIMEOUT = float(os.environ.get("SMPL_STREAM_IDLE_TIMEOUT", "60"))
+
+# Genders whose layers are loaded and warmed up at startup (empty disables preloading);
+# /api/readyz answers 503 until that has finished. SMPL_PRELOAD_LODS=1 also builds the LOD meshes.
+SMPL_PRELOAD_GENDERS = [
+    gender.strip().lower() for gender in os.environ.get("SMPL_PRELOAD_GENDERS", "neutral,male,female").split(",")
+    if gender.strip()
+]
+SMPL_PRELOAD_LODS = os.environ.get("SMPL_PRELOAD_LODS", "0") == "1"
+
+# Cross-request micro-batching of small forward passes (SMPL_MICROBATCH_MAX_FRAMES=0 disables it).
+# Requests queued while the workers are busy are fused anyway; a wait only holds idle-pool batches back.
+SMPL_MICROBATCH_MAX_WAIT_MS = float(os.environ.get("SMPL_MICROBATCH_MAX_WAIT_MS", "0"))
+SMPL_MICROBATCH_MAX_FRAMES = int(os.environ.get("SMPL_MICROBATCH_MAX_FRAMES", "512"))
+
+# Request bodies above this size are refused with 413 before they are parsed (0 disables the limit).
+SMPL_MAX_UPLOAD_BYTES = int(os.environ.get("SMPL_MAX_UPLOAD_BYTES", str(2 * 1024 ** 3)))
+
+# Upper bound on the number of sequence files accepted by /api/smpl/sequence/batch.
+SMPL_BATCH_MAX_FILES = int(os.environ.get("SMPL_BATCH_MAX_FILES", "512"))
+
+# Target vertex counts of the simplified meshes served as ?lod=1 and ?lod=2 (lod 0 is the full mesh).
+SMPL_LOD_VERTEX_COUNTS = {1: 3445, 2: 1723}
 
 SMPL_SKELETON_EDGES = [
     (0, 1),
@@ -50,42 +123,192 @@ SMPL_SKELETON_EDGES = [
 class SMPLProcessor:
     """Utility wrapper that keeps SMPL layers cached per gender and runs batched FK."""
 
-    def __init__(self, model_dir: Path):
+    def __init__(self, model_dir: Path, batch_size: int = SMPL_BATCH_SIZE):
         self.model_dir = model_dir
+        self.batch_size = batch_size
         self._layers: Dict[str, SMPLLayer] = {}
+        self._layer_lock = threading.Lock()
+        self._topologies: Dict[Tuple[str, int], Dict] = {}
+        self._lod_meshes: Dict[str, Dict[int, Tuple[np.ndarray, np.ndarray]]] = {}
+        self._lod_lock = threading.Lock()
 
-    def _get_layer(self, gender: str) -> SMPLLayer:
+    @staticmethod
+    def _gender_key(gender: str) -> str:
         gender_key = (gender or "NEUTRAL").upper()
         if gender_key not in {"MALE", "FEMALE", "NEUTRAL"}:
             gender_key = "NEUTRAL"
+        return gender_key
 
-        if gender_key not in self._layers:
-            if not self.model_dir.exists():
-                raise FileNotFoundError(f"SMPL model directory not found: {self.model_dir}")
-            self._layers[gender_key] = SMPLLayer(model_path=str(self.model_dir), gender=gender_key, batch_size=1)
-        return self._layers[gender_key]
+    def _get_layer(self, gender: str) -> SMPLLayer:
+        gender_key = self._gender_key(gender)
+
+        with self._layer_lock:
+            if gender_key not in self._layers:
+                if not self.model_dir.exists():
+                    raise FileNotFoundError(f"SMPL model directory not found: {self.model_dir}")
+                self._layers[gender_key] = SMPLLayer(model_path=str(self.model_dir), gender=gender_key, batch_size=1)
+            return self._layers[gender_key]
+
+    def warm_up(self, gender: str, lods: bool = False) -> float:
+        """Load a gender's layer and run full and joints-only forward passes once; returns the seconds taken.
+
+        Pays model loading and torch's first-call overhead before the first
+        request does. With ``lods`` the simplified meshes are built too.
+        """
+        started = time.perf_counter()
+        frames = self.batch_size
+        poses = np.zeros((frames, 72), dtype=np.float32)
+        betas = np.broadcast_to(np.zeros((1, 10), dtype=np.float32), (frames, 10))
+        trans = np.zeros((frames, 3), dtype=np.float32)
+        self.forward(poses, betas, trans, gender)
+        self.forward(poses, betas, trans, gender, joints_only=True)
+        if lods:
+            for lod in SMPL_LOD_VERTEX_COUNTS:
+                self.topology(gender, lod)
+        return time.perf_counter() - started
+
+    def _simplified_meshes(self, gender_key: str) -> Dict[int, Tuple[np.ndarray, np.ndarray]]:
+        """Compute (once per gender) the vertex-subset LOD meshes of the rest template."""
+        with self._lod_lock:
+            if gender_key not in self._lod_meshes:
+                layer = self._get_layer(gender_key)
+                meshes = simplify_vertex_subset(
+                    layer.v_template.detach().cpu().numpy(),
+                    layer.faces_tensor.cpu().numpy(),
+                    list(SMPL_LOD_VERTEX_COUNTS.values()),
+                )
+                self._lod_meshes[gender_key] = {lod: meshes[count] for lod, count in SMPL_LOD_VERTEX_COUNTS.items()}
+            return self._lod_meshes[gender_key]
+
+    def topology(self, gender: str, lod: int = 0) -> Dict:
+        """Return the cached face array of a gender's model (or of one of its LODs) with its id and strong ETag.
+
+        LOD topologies also carry ``vertex_ids``, the full-mesh index of every LOD
+        vertex; full-resolution vertices map onto the LOD as ``vertices[:, vertex_ids]``.
+        """
+        gender_key = self._gender_key(gender)
+        if lod and lod not in SMPL_LOD_VERTEX_COUNTS:
+            raise ValueError(f"Unsupported level of detail: {lod}")
+        if (gender_key, lod) not in self._topologies:
+            layer = self._get_layer(gender_key)
+            topology_id = f"smpl-{gender_key.lower()}"
+            if lod:
+                vertex_ids, faces = self._simplified_meshes(gender_key)[lod]
+                topology_id = f"{topology_id}-lod{lod}"
+                digest = hashlib.sha256(faces.tobytes() + vertex_ids.tobytes())
+            else:
+                vertex_ids = None
+                faces = layer.faces_tensor.cpu().numpy().astype(np.int32)
+                digest = hashlib.sha256(faces.tobytes())
+            self._topologies[(gender_key, lod)] = {
+                "id": topology_id,
+                "lod": lod,
+                "faces": faces,
+                "vertex_ids": vertex_ids,
+                "vertex_count": int(vertex_ids.shape[0]) if vertex_ids is not None else int(layer.v_template.shape[0]),
+                "etag": f'"{digest.hexdigest()}"',
+            }
+        return self._topologies[(gender_key, lod)]
+
+    def cached_topology(self, gender: str, lod: int = 0) -> Optional[Dict]:
+        """The topology if :meth:`topology` has already built it, else None."""
+        return self._topologies.get((self._gender_key(gender), lod))
+
+    @staticmethod
+    def _shared_betas(betas: np.ndarray) -> Optional[np.ndarray]:
+        """Return the (1, B) shape vector when every frame uses the same betas, else None."""
+        if betas.shape[0] == 0:
+            return None
+        if betas.strides[0] != 0 and not (betas == betas[:1]).all():
+            return None
+        return np.array(betas[:1], dtype=np.float32)
+
+    @staticmethod
+    def _pose_shaped_template(
+        layer: SMPLLayer,
+        v_shaped: torch.Tensor,
+        rest_joints: torch.Tensor,
+        rot_mats: torch.Tensor,
+        transl: torch.Tensor,
+        joints_only: bool = False,
+        vertex_ids: Optional[torch.Tensor] = None,
+    ) -> Tuple[Optional[torch.Tensor], torch.Tensor]:
+        """Pose blend shapes plus linear blend skinning for an already shaped template.
+
+        Mirrors ``smplx.lbs.lbs`` followed by the joint selection and translation
+        of ``SMPLLayer.forward``, minus the shape blend and joint regression. With
+        ``joints_only`` only the few vertices that ``VertexJointSelector`` turns into
+        extra joints are skinned and no vertices are returned. ``vertex_ids``
+        restricts the returned mesh to those vertices (an LOD subset); only they
+        and the extra-joint vertices are skinned.
+        """
+        batch = rot_mats.shape[0]
+        ident = torch.eye(3, dtype=v_shaped.dtype, device=v_shaped.device)
+        pose_feature = (rot_mats[:, 1:] - ident).reshape(batch, -1)
+        joints, transforms = batch_rigid_transform(rot_mats, rest_joints.expand(batch, -1, -1), layer.parents)
+
+        posedirs = layer.posedirs
+        lbs_weights = layer.lbs_weights
+        extra_ids = layer.vertex_joint_selector.extra_joints_idxs
+        subset = joints_only or vertex_ids is not None
+        if subset:
+            skinned_ids = extra_ids if joints_only else torch.cat([vertex_ids, extra_ids])
+            v_shaped = v_shaped[:, skinned_ids]
+            posedirs = posedirs.view(posedirs.shape[0], -1, 3)[:, skinned_ids].reshape(posedirs.shape[0], -1)
+            lbs_weights = lbs_weights[skinned_ids]
+
+        v_posed = v_shaped + torch.matmul(pose_feature, posedirs).view(batch, -1, 3)
+        skinning = torch.matmul(lbs_weights, transforms.reshape(batch, -1, 16)).view(batch, -1, 4, 4)
+        vertices = torch.einsum("bvij,bvj->bvi", skinning[:, :, :3, :3], v_posed) + skinning[:, :, :3, 3]
+
+        if subset:
+            extra_count = extra_ids.shape[0]
+            joints = torch.cat([joints, vertices[:, vertices.shape[1] - extra_count:]], dim=1)
+            vertices = None if joints_only else vertices[:, :vertices.shape[1] - extra_count]
+        else:
+            joints = layer.vertex_joint_selector(vertices, joints)
+        if layer.joint_mapper is not None:
+            joints = layer.joint_mapper(joints)
+
+        offset = transl.unsqueeze(dim=1)
+        return (vertices + offset if vertices is not None else None), joints + offset
 
     @torch.no_grad()
-    def forward(
+    def iter_forward(
         self,
         poses: np.ndarray,
         betas: np.ndarray,
         trans: np.ndarray,
         gender: str,
-    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
-        """Evaluate SMPL in chunks and return (vertices, joints, faces)."""
+        joints_only: bool = False,
+        lod: int = 0,
+    ) -> Iterator[Tuple[int, Optional[np.ndarray], np.ndarray]]:
+        """Evaluate SMPL in ``batch_size``-frame chunks, yielding (start_frame, vertices, joints) as each finishes.
+
+        When the betas are the same for every frame the shaped template and its
+        rest joints are computed once, and only pose blend shapes and skinning run
+        per chunk. ``joints_only`` skips skinning the mesh and yields None vertices;
+        ``lod`` > 0 skins and yields only the vertices of that level of detail.
+        """
 
         device = torch.device("cpu")
         layer = self._get_layer(gender).to(device)
 
         frames = poses.shape[0]
-        vertices, joints = [], []
+        vertex_ids = None
+        if lod and not joints_only:
+            vertex_ids = torch.from_numpy(self.topology(gender, lod)["vertex_ids"].astype(np.int64)).to(device)
+
+        shared_betas = self._shared_betas(betas)
+        if shared_betas is not None:
+            betas_shared = torch.from_numpy(shared_betas).to(device)
+            v_shaped = layer.v_template + blend_shapes(betas_shared, layer.shapedirs)
+            rest_joints = vertices2joints(layer.J_regressor, v_shaped)
 
-        for start in range(0, frames, SMPL_BATCH_SIZE):
-            end = min(start + SMPL_BATCH_SIZE, frames)
+        for start in range(0, frames, self.batch_size):
+            end = min(start + self.batch_size, frames)
 
             pose_chunk = torch.from_numpy(poses[start:end]).float().to(device)
-            betas_chunk = torch.from_numpy(betas[start:end]).float().to(device)
             trans_chunk = torch.from_numpy(trans[start:end]).float().to(device)
 
             global_orient_aa = pose_chunk[:, :3]
@@ -94,25 +317,181 @@ class SMPLProcessor:
             global_orient_mat = batch_rodrigues(global_orient_aa).reshape(-1, 1, 3, 3)
             body_pose_mat = batch_rodrigues(body_pose_aa.reshape(-1, 3)).reshape(-1, body_pose_aa.shape[1] // 3, 3, 3)
 
-            output = layer(
-                global_orient=global_orient_mat,
-                body_pose=body_pose_mat,
-                betas=betas_chunk,
-                transl=trans_chunk,
-            )
+            if shared_betas is None:
+                betas_chunk = torch.from_numpy(np.ascontiguousarray(betas[start:end])).float().to(device)
+                if not joints_only and vertex_ids is None:
+                    output = layer(
+                        global_orient=global_orient_mat,
+                        body_pose=body_pose_mat,
+                        betas=betas_chunk,
+                        transl=trans_chunk,
+                    )
+                    yield start, output.vertices.cpu().numpy(), output.joints.cpu().numpy()
+                    continue
+                chunk_shaped = layer.v_template + blend_shapes(betas_chunk, layer.shapedirs)
+                chunk_rest_joints = vertices2joints(layer.J_regressor, chunk_shaped)
+            else:
+                chunk_shaped, chunk_rest_joints = v_shaped, rest_joints
 
-            vertices.append(output.vertices.cpu().numpy())
-            joints.append(output.joints.cpu().numpy())
+            rot_mats = torch.cat([global_orient_mat, body_pose_mat], dim=1)
+            vertices, joints = self._pose_shaped_template(
+                layer, chunk_shaped, chunk_rest_joints, rot_mats, trans_chunk, joints_only, vertex_ids
+            )
+            yield start, vertices.cpu().numpy() if vertices is not None else None, joints.cpu().numpy()
 
-        vertices_np = np.concatenate(vertices, axis=0).astype(np.float32)
-        joints_np = np.concatenate(joints, axis=0).astype(np.float32)
-        faces_np = layer.faces_tensor.cpu().numpy().astype(np.int32)
-        return vertices_np, joints_np, faces_np
+    def forward(
+        self,
+        poses: np.ndarray,
+        betas: np.ndarray,
+        trans: np.ndarray,
+        gender: str,
+        joints_only: bool = False,
+        lod: int = 0,
+        out_vertices: Optional[np.ndarray] = None,
+        out_joints: Optional[np.ndarray] = None,
+    ) -> Tuple[Optional[np.ndarray], np.ndarray, np.ndarray]:
+        """Evaluate SMPL in chunks and return (vertices, joints, faces); vertices are None when joints_only.
+
+        Each chunk is written straight into preallocated float32 outputs, so peak
+        memory is the result plus one chunk of temporaries. ``out_vertices`` and
+        ``out_joints`` let the caller supply those outputs (e.g. an ``np.memmap``);
+        they must be float32 with one row per frame.
+        """
+        frames = poses.shape[0]
+        for name, out in (("out_vertices", out_vertices), ("out_joints", out_joints)):
+            if out is not None and (out.dtype != np.float32 or out.shape[0] != frames):
+                raise ValueError(f"{name} must be a float32 array with {frames} frames.")
+
+        vertices_np, joints_np = out_vertices, out_joints
+        for start, vertices_chunk, joints_chunk in self.iter_forward(poses, betas, trans, gender, joints_only, lod):
+            end = start + joints_chunk.shape[0]
+            if joints_np is None:
+                joints_np = np.empty((frames,) + joints_chunk.shape[1:], dtype=np.float32)
+            joints_np[start:end] = joints_chunk
+            if vertices_chunk is not None:
+                if vertices_np is None:
+                    vertices_np = np.empty((frames,) + vertices_chunk.shape[1:], dtype=np.float32)
+                vertices_np[start:end] = vertices_chunk
+
+        if joints_np is None:
+            raise ValueError("SMPL sequence contains no frames.")
+        return vertices_np if not joints_only else None, joints_np, self.topology(gender, lod)["faces"]
 
 
 processor = SMPLProcessor(SMPL_MODEL_DIR)
+result_cache = ResultCache(
+    max_entries=SMPL_CACHE_MAX_ENTRIES,
+    max_memory_bytes=SMPL_CACHE_MAX_BYTES,
+    disk_dir=Path(SMPL_CACHE_DIR) if SMPL_CACHE_DIR else None,
+    max_disk_bytes=SMPL_CACHE_DISK_MAX_BYTES,
+)
+sequence_store = SequenceStore(
+    max_entries=SMPL_SEQUENCE_STORE_MAX_ENTRIES,
+    max_memory_bytes=SMPL_SEQUENCE_STORE_MAX_BYTES,
+    ttl=SMPL_SEQUENCE_STORE_TTL,
+)
+worker_pool = WorkerPool(max_workers=SMPL_WORKER_THREADS, max_queue=SMPL_WORKER_QUEUE_SIZE)
+
+
+def _fused_forward(key: Tuple, requests: List[Tuple[np.ndarray, np.ndarray, np.ndarray]]) -> List[Tuple]:
+    """Run one SMPL forward pass over the concatenated frames of several requests and split it back.
+
+    Returns (vertices, joints, faces, topology_id) per request.
+    """
+    gender, joints_only, lod = key[:3]
+    if len(requests) == 1:
+        vertices, joints, faces = processor.forward(*requests[0], gender, joints_only, lod)
+        return [(vertices, joints, faces, processor.topology(gender, lod)["id"])]
+
+    vertices, joints, faces = processor.forward(
+        np.concatenate([poses for poses, _, _ in requests]),
+        np.concatenate([betas for _, betas, _ in requests]),
+        np.concatenate([trans for _, _, trans in requests]),
+        gender,
+        joints_only,
+        lod,
+    )
+    topology_id = processor.topology(gender, lod)["id"]
+    outputs = []
+    start = 0
+    for poses, _, _ in requests:
+        end = start + poses.shape[0]
+        # Copies, so a cached result does not pin the whole fused batch in memory.
+        vertices_slice = vertices[start:end].copy() if vertices is not None else None
+        outputs.append((vertices_slice, joints[start:end].copy(), faces, topology_id))
+        start = end
+    return outputs
+
+
+micro_batcher = MicroBatcher(
+    _fused_forward,
+    worker_pool,
+    max_wait=SMPL_MICROBATCH_MAX_WAIT_MS / 1000.0,
+    max_batch=SMPL_MICROBATCH_MAX_FRAMES,
+)
+
 
-app = FastAPI(title="SMPL Conversion Service", version="0.1.0")
+async def _forward(
+    poses: np.ndarray,
+    betas: np.ndarray,
+    trans: np.ndarray,
+    gender: str,
+    joints_only: bool = False,
+    lod: int = 0,
+) -> Tuple[Optional[np.ndarray], np.ndarray, np.ndarray, str]:
+    """``processor.forward`` on the worker pool through the micro-batcher, so concurrent short clips share a batch.
+
+    Returns (vertices, joints, faces, topology_id). Awaited from the event loop,
+    so a request waiting for its batch does not hold a worker.
+    """
+    key = (processor._gender_key(gender), joints_only, lod, poses.shape[1:], betas.shape[1:])
+    return await micro_batcher.submit(key, (poses, betas, trans), poses.shape[0])
+
+
+def _configure_evaluation() -> None:
+    """Apply the persisted batch size / torch thread tuning, calibrating first when SMPL_AUTOTUNE=1 and none exists."""
+    tuning = load_tuning(SMPL_TUNING_FILE)
+    if tuning is None and SMPL_AUTOTUNE:
+        try:
+            tuning = calibrate(processor, SMPL_PROCESS_COUNT, SMPL_WORKER_THREADS)
+            save_tuning(SMPL_TUNING_FILE, tuning)
+            print(f"Calibrated SMPL evaluation: batch_size={tuning['batch_size']} torch_threads={tuning['torch_threads']}")
+        except Exception as exc:
+            print(f"Warning: SMPL calibration failed, keeping defaults: {exc}")
+
+    settings = resolve_tuning(tuning, SMPL_PROCESS_COUNT, SMPL_WORKER_THREADS)
+    if settings["batch_size"] is not None and "SMPL_BATCH_SIZE" not in os.environ:
+        processor.batch_size = settings["batch_size"]
+    torch.set_num_threads(SMPL_TORCH_THREADS or settings["torch_threads"])
+
+
+readiness = {"ready": False, "warmed_up": {}, "errors": {}}
+
+
+def _preload_models() -> None:
+    """Load and warm up SMPL_PRELOAD_GENDERS, recording progress for /api/readyz."""
+    for gender in SMPL_PRELOAD_GENDERS:
+        try:
+            readiness["warmed_up"][gender] = round(processor.warm_up(gender, SMPL_PRELOAD_LODS), 3)
+        except Exception as exc:
+            readiness["errors"][gender] = str(exc)
+            print(f"Warning: Failed to preload SMPL {gender} model: {exc}")
+    readiness["ready"] = not readiness["errors"]
+
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    await run_in_threadpool(_configure_evaluation)
+    # Warm up in the background so /api/healthz answers while /api/readyz still reports 503.
+    preload = asyncio.ensure_future(run_in_threadpool(_preload_models))
+    yield
+    if not preload.done():
+        preload.cancel()
+
+
+app = FastAPI(title="SMPL Conversion Service", version="0.1.0", lifespan=lifespan)
+# Added first so that it sits inside CORS: browsers then see the 413 rather than a CORS failure.
+app.add_middleware(UploadSizeLimitMiddleware, max_bytes=SMPL_MAX_UPLOAD_BYTES)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
@@ -122,44 +501,6 @@ app.add_middleware(
 )
 
 
-def _decode_pickle(contents: bytes):
-    buffer = io.BytesIO(contents)
-
-    # 1) Plain pickle
-    try:
-        return pickle.load(buffer)
-    except Exception:
-        buffer.seek(0)
-
-    # 2) Joblib (handles joblib/zlib wrapped pickles)
-    try:
-        return joblib.load(buffer)
-    except Exception:
-        buffer.seek(0)
-
-    # 3) gzip-compressed pickle
-    try:
-        with gzip.GzipFile(fileobj=buffer) as gz:
-            return pickle.load(gz)
-    except Exception:
-        buffer.seek(0)
-
-    # 4) Zip archive containing a pickle (rare but easy to support)
-    try:
-        with zipfile.ZipFile(buffer) as zf:
-            for name in zf.namelist():
-                with zf.open(name) as inner:
-                    data = inner.read()
-                    try:
-                        return pickle.loads(data)
-                    except Exception:
-                        continue
-    except Exception as exc:
-        raise ValueError(f"Unable to decode pickle: {exc}") from exc
-
-    raise ValueError("Unable to decode pickle: unknown format")
-
-
 def _to_float32(array, expected_last_dim=None):
     arr = np.asarray(array, dtype=np.float32)
     if expected_last_dim and arr.shape[-1] != expected_last_dim:
@@ -189,19 +530,10 @@ def _infer_fps_from_time(time: Optional[np.ndarray]) -> Optional[float]:
     return float(np.clip(inferred_fps, 10.0, 240.0))
 
 
-def _extract_sequence_dict(raw):
-    """Some pickles wrap the sequence in a single-key dict (e.g. {'0': {...}})."""
-    if isinstance(raw, dict) and len(raw) == 1:
-        candidate = next(iter(raw.values()))
-        if isinstance(candidate, dict):
-            return candidate
-    return raw
-
-
 def _normalize_sequence(raw: dict) -> Dict[str, np.ndarray]:
     """Normalise different SMPL pickle layouts to a consistent dictionary."""
 
-    raw = _extract_sequence_dict(raw)
+    raw = extract_sequence_dict(raw)
 
     if not isinstance(raw, dict):
         raise ValueError("SMPL pickle must contain a dictionary.")
@@ -238,17 +570,19 @@ def _normalize_sequence(raw: dict) -> Dict[str, np.ndarray]:
 
     frames = poses.shape[0]
 
+    # A single shape vector is broadcast (zero-stride view) rather than repeated, so
+    # SMPLProcessor can spot it and compute the shaped template once per sequence.
     betas = raw.get("betas")
     if betas is None:
-        betas = np.zeros((frames, 10), dtype=np.float32)
+        betas = np.broadcast_to(np.zeros((1, 10), dtype=np.float32), (frames, 10))
     else:
         betas = _to_float32(betas)
         if betas.ndim == 1:
-            betas = np.repeat(betas[None, :], frames, axis=0)
+            betas = np.broadcast_to(betas[None, :], (frames, betas.shape[0]))
         elif betas.shape[0] == 1:
-            betas = np.repeat(betas, frames, axis=0)
+            betas = np.broadcast_to(betas, (frames, betas.shape[1]))
         elif betas.shape[0] != frames:
-            betas = np.repeat(betas[:1], frames, axis=0)
+            betas = np.broadcast_to(betas[:1], (frames, betas.shape[1]))
 
     # Get body translation - check if "trans" is actually camera translation first
     # If cam_R exists and "trans" matches its frame count, it might be camera translation
@@ -406,6 +740,169 @@ def _normalize_sequence(raw: dict) -> Dict[str, np.ndarray]:
     }
 
 
+def _select_frames(sequence: Dict, indices) -> Dict:
+    """Copy of a normalised sequence restricted to ``indices`` (an index array or slice).
+
+    Per-frame arrays (including per-frame extrinsics) are cut down; static
+    camera parameters and metadata are shared. Broadcast betas stay broadcast.
+    """
+    frames = sequence["poses"].shape[0]
+    selected = dict(sequence)
+    for key in ("poses", "trans", "time", "verts", "joints"):
+        value = sequence.get(key)
+        if value is not None and value.shape[0] == frames:
+            selected[key] = value[indices]
+    selected_count = selected["poses"].shape[0]
+
+    betas = sequence["betas"]
+    if betas.strides[0] == 0:
+        selected["betas"] = np.broadcast_to(betas[:1], (selected_count, betas.shape[1]))
+    else:
+        selected["betas"] = betas[indices]
+
+    cam_R = sequence.get("cam_R")
+    if cam_R is not None:
+        if cam_R.ndim == 4 and cam_R.shape[0] == 1 and cam_R.shape[1] == frames:
+            selected["cam_R"] = cam_R[:, indices]
+        elif cam_R.ndim == 3 and cam_R.shape[0] == frames:
+            selected["cam_R"] = cam_R[indices]
+    cam_T = sequence.get("cam_T")
+    if cam_T is not None and cam_T.ndim == 2 and cam_T.shape[0] == frames:
+        selected["cam_T"] = cam_T[indices]
+
+    cameras = sequence.get("cameras")
+    if cameras:
+        selected["cameras"] = [
+            {
+                **camera,
+                "cam_R": camera["cam_R"][indices] if camera["cam_R"].ndim == 3 and camera["cam_R"].shape[0] == frames else camera["cam_R"],
+                "cam_T": camera["cam_T"][indices] if camera["cam_T"].ndim == 2 and camera["cam_T"].shape[0] == frames else camera["cam_T"],
+            }
+            for camera in cameras
+        ]
+    return selected
+
+
+def _frame_times(sequence: Dict) -> np.ndarray:
+    """Frame times in seconds (float64), regenerated from ``fps`` when ``time`` is unusable or not increasing."""
+    frames = sequence["poses"].shape[0]
+    source_time = np.asarray(sequence["time"], dtype=np.float64)
+    if source_time.shape[0] != frames or not bool(np.all(np.diff(source_time) > 0)):
+        source_time = np.arange(frames, dtype=np.float64) / sequence["fps"]
+    return source_time
+
+
+def _resample_sequence(sequence: Dict, target_fps: float, window: Optional[slice] = None) -> Dict:
+    """Copy of a normalised sequence resampled to ``target_fps`` before evaluation.
+
+    Poses and per-frame camera rotations are slerped, translations, per-frame
+    betas and pre-computed verts/joints interpolated linearly; broadcast betas
+    and static extrinsics are kept. ``time`` and ``fps`` describe the new
+    frames. ``window`` keeps only that slice of the resampled frames, and only
+    those are interpolated. Sequences with a single frame are only windowed.
+    """
+    frames = sequence["poses"].shape[0]
+    if frames < 2:
+        return _select_frames(sequence, window) if window is not None else sequence
+    source_time = _frame_times(sequence)
+    target_time = resample_times(source_time, target_fps)
+    if window is not None:
+        target_time = target_time[window]
+    lower, weight = interpolation_weights(source_time, target_time)
+    target_count = target_time.shape[0]
+
+    def per_frame(value, axis=0):
+        return value is not None and value.ndim > axis and value.shape[axis] == frames
+
+    def resample_extrinsics(camera: Dict) -> Dict:
+        resampled = {}
+        cam_R = camera.get("cam_R")
+        if per_frame(cam_R) and cam_R.ndim == 3:
+            resampled["cam_R"] = resample_rotation_matrices(cam_R, lower, weight).astype(np.float32)
+        elif cam_R is not None and cam_R.ndim == 4 and cam_R.shape[0] == 1 and per_frame(cam_R, axis=1):
+            resampled["cam_R"] = resample_rotation_matrices(cam_R[0], lower, weight)[None].astype(np.float32)
+        cam_T = camera.get("cam_T")
+        if per_frame(cam_T) and cam_T.ndim == 2:
+            resampled["cam_T"] = lerp(cam_T, lower, weight).astype(np.float32)
+        return resampled
+
+    resampled = dict(sequence)
+    resampled["poses"] = resample_axis_angle(sequence["poses"], lower, weight).astype(np.float32)
+    resampled["trans"] = lerp(sequence["trans"], lower, weight).astype(np.float32)
+    betas = sequence["betas"]
+    if betas.strides[0] == 0:
+        resampled["betas"] = np.broadcast_to(betas[:1], (target_count, betas.shape[1]))
+    else:
+        resampled["betas"] = lerp(betas, lower, weight).astype(np.float32)
+    for key in ("verts", "joints"):
+        if per_frame(sequence.get(key)):
+            resampled[key] = lerp(sequence[key], lower, weight).astype(np.float32)
+    resampled.update(resample_extrinsics(sequence))
+    if sequence.get("cameras"):
+        resampled["cameras"] = [{**camera, **resample_extrinsics(camera)} for camera in sequence["cameras"]]
+    resampled["time"] = target_time.astype(np.float32)
+    resampled["fps"] = float(target_fps)
+    return resampled
+
+
+def _frame_window(
+    frame_count: int, start: Optional[int], end: Optional[int], stride: Optional[int]
+) -> Tuple[slice, Dict]:
+    """Slice of the frames a ``start``/``end``/``stride`` request selects, plus its description for the response.
+
+    ``start`` is inclusive and ``end`` exclusive, both clamped to the sequence
+    like Python slices. Raises ValueError when no frame is selected.
+    """
+    window = slice(start, end, stride)
+    first, last, step = window.indices(frame_count)
+    selected = len(range(first, last, step))
+    if selected == 0:
+        raise ValueError(f"Frame window [{start}:{end}:{stride}] selects none of the {frame_count} frames.")
+    return slice(first, last, step), {"start": first, "end": last, "stride": step, "total_frames": frame_count}
+
+
+def _select_keyframes(points: np.ndarray, time: np.ndarray, tolerance: float) -> np.ndarray:
+    """Pick frames so linear interpolation of every skipped frame stays within ``tolerance``.
+
+    ``points`` is (frames, P, 3). Segments are split at their worst frame
+    (Douglas-Peucker) until every point of every skipped frame is within
+    ``tolerance`` of the time-based interpolation between the kept neighbours.
+    """
+    frames = points.shape[0]
+    if frames <= 2:
+        return np.arange(frames)
+
+    time = np.asarray(time, dtype=np.float64)
+    use_time = time.shape[0] == frames and bool(np.all(np.diff(time) > 0))
+    keep = np.zeros(frames, dtype=bool)
+    keep[0] = keep[-1] = True
+
+    stack = [(0, frames - 1)]
+    while stack:
+        first, last = stack.pop()
+        if last - first < 2:
+            continue
+        if use_time:
+            weights = (time[first + 1:last] - time[first]) / (time[last] - time[first])
+        else:
+            weights = np.arange(1, last - first, dtype=np.float64) / (last - first)
+        span = points[last] - points[first]
+        errors = np.empty(weights.shape[0], dtype=np.float64)
+        # Chunked so full-mesh inputs never materialise a whole segment's interpolation at once.
+        for offset in range(0, weights.shape[0], processor.batch_size):
+            block_weights = weights[offset:offset + processor.batch_size, None, None]
+            block = points[first + 1 + offset:first + 1 + offset + block_weights.shape[0]]
+            interpolated = points[first] + block_weights * span
+            errors[offset:offset + block_weights.shape[0]] = np.linalg.norm(interpolated - block, axis=-1).max(axis=1)
+        worst = int(np.argmax(errors))
+        if errors[worst] > tolerance:
+            split = first + 1 + worst
+            keep[split] = True
+            stack.append((first, split))
+            stack.append((split, last))
+    return np.flatnonzero(keep)
+
+
 def _broadcast_camera_sequence(array, target_frames, expected_shape):
     arr = np.asarray(array, dtype=np.float32)
     if arr.shape == expected_shape:
@@ -422,14 +919,14 @@ def _broadcast_camera_sequence(array, target_frames, expected_shape):
     return arr.astype(np.float32, copy=False)
 
 
-def _compute_projected_points(sequence: Dict[str, np.ndarray], joints: np.ndarray):
+def _sequence_camera(sequence: Dict[str, np.ndarray], frames: int) -> Optional[Dict[str, np.ndarray]]:
+    """The sequence's own camera with per-frame extrinsics for ``frames`` frames, or None if it has none."""
     cam_R = sequence.get("cam_R")
     cam_T = sequence.get("cam_T")
     intrinsic = sequence.get("intrinsicMat")
     if cam_R is None or cam_T is None or intrinsic is None:
         return None
 
-    frames, joint_count, _ = joints.shape
     try:
         cam_R = _broadcast_camera_sequence(cam_R, frames, (frames, 3, 3))
         cam_T = _broadcast_camera_sequence(cam_T, frames, (frames, 3))
@@ -440,140 +937,1061 @@ def _compute_projected_points(sequence: Dict[str, np.ndarray], joints: np.ndarra
     if intrinsic.shape != (3, 3):
         return None
 
-    distortion = sequence.get("distortion")
-    distortion_vec = np.zeros(5, dtype=np.float32)
-    if distortion is not None:
-        dist_arr = np.asarray(distortion, dtype=np.float32).flatten()
-        if dist_arr.size:
-            count = min(5, dist_arr.size)
-            distortion_vec[:count] = dist_arr[:count]
-    k1, k2, p1, p2, k3 = distortion_vec.tolist()
+    return {"cam_R": cam_R, "cam_T": cam_T, "intrinsicMat": intrinsic, "distortion": sequence.get("distortion")}
+
+
+def _compute_projected_points(sequence: Dict[str, np.ndarray], joints: np.ndarray):
+    camera = _sequence_camera(sequence, joints.shape[0])
+    if camera is None:
+        return None
+    return project_points(joints, [camera])[0]
 
-    fx = float(intrinsic[0, 0])
-    fy = float(intrinsic[1, 1])
-    cx = float(intrinsic[0, 2])
-    cy = float(intrinsic[1, 2])
 
-    joints_world = joints.astype(np.float32, copy=False)
-    joints_cam = np.einsum("fij,fnj->fni", cam_R, joints_world) + cam_T[:, None, :]
+def _compute_projected_vertices(sequence: Dict[str, np.ndarray], vertices: np.ndarray) -> Optional[np.ndarray]:
+    """Project every vertex into the sequence's camera, a few frames at a time: (frames, vertices, 2), or None."""
+    camera = _sequence_camera(sequence, vertices.shape[0])
+    if camera is None:
+        return None
+    return project_points_chunked(vertices, camera)
 
-    x = joints_cam[..., 0]
-    y = joints_cam[..., 1]
-    z = joints_cam[..., 2]
 
-    valid = z > 1e-4
-    xn = np.zeros_like(x, dtype=np.float32)
-    yn = np.zeros_like(y, dtype=np.float32)
-    xn[valid] = x[valid] / z[valid]
-    yn[valid] = y[valid] / z[valid]
+def _compute_camera_projections(sequence: Dict, joints: np.ndarray) -> Optional[np.ndarray]:
+    """Project joints into every camera of ``sequence["cameras"]`` at once: (cameras, frames, joints, 2), or None."""
+    cameras = sequence.get("cameras")
+    if not cameras:
+        return None
+    frames = joints.shape[0]
+    broadcast = [
+        {
+            **camera,
+            "cam_R": _broadcast_camera_sequence(camera["cam_R"], frames, (frames, 3, 3)),
+            "cam_T": _broadcast_camera_sequence(camera["cam_T"], frames, (frames, 3)),
+        }
+        for camera in cameras
+    ]
+    return project_points(joints, broadcast)
 
-    r2 = xn * xn + yn * yn
-    radial = 1.0 + k1 * r2 + k2 * r2 * r2 + k3 * r2 * r2 * r2
-    x_distorted = xn * radial + 2 * p1 * xn * yn + p2 * (r2 + 2 * xn * xn)
-    y_distorted = yn * radial + p1 * (r2 + 2 * yn * yn) + 2 * p2 * xn * yn
 
-    u = fx * x_distorted + cx
-    v = fy * y_distorted + cy
+def _encode_float32(array: np.ndarray) -> str:
+    # b64encode reads the array's buffer directly; contiguous float32 input is not copied first.
+    return base64.b64encode(np.ascontiguousarray(array, dtype=np.float32)).decode("ascii")
 
-    u[~valid] = np.nan
-    v[~valid] = np.nan
 
-    projected = np.stack([u, v], axis=-1).astype(np.float32, copy=False)
-    return projected
+def _encode_buffer(array: np.ndarray) -> str:
+    """Base64 of an array's raw bytes in its own dtype (e.g. quantised vertices)."""
+    return base64.b64encode(np.ascontiguousarray(array)).decode("ascii")
 
 
-def _encode_float32(array: np.ndarray) -> str:
-    return base64.b64encode(np.ascontiguousarray(array, dtype=np.float32).tobytes()).decode("ascii")
+def _busy_error(exc: WorkerPoolFull) -> HTTPException:
+    return HTTPException(status_code=503, detail=str(exc), headers={"Retry-After": SMPL_WORKER_RETRY_AFTER})
+
+
+def _merge_calibration(raw: Dict, intrinsics_data: Dict) -> None:
+    """Copy the intrinsics and extrinsics of a calibration dict into ``raw`` (extrinsics only where it has none)."""
+    # Extract intrinsics from the pickle dict
+    # Handle both "intrinsicMat" and "intrinsic" key names
+    intrinsic_value = intrinsics_data.get("intrinsicMat")
+    if intrinsic_value is None:
+        intrinsic_value = intrinsics_data.get("intrinsic")
+    if intrinsic_value is not None:
+        # Convert to numpy array if it's a list
+        if isinstance(intrinsic_value, (list, tuple)):
+            raw["intrinsicMat"] = np.array(intrinsic_value, dtype=np.float32)
+        else:
+            raw["intrinsicMat"] = _to_float32(intrinsic_value)
+
+    if "distortion" in intrinsics_data:
+        dist_value = intrinsics_data["distortion"]
+        if isinstance(dist_value, (list, tuple)):
+            raw["distortion"] = np.array(dist_value, dtype=np.float32)
+        else:
+            raw["distortion"] = _to_float32(dist_value)
+
+    if "imageSize" in intrinsics_data:
+        size_value = intrinsics_data["imageSize"]
+        if isinstance(size_value, (list, tuple)):
+            raw["imageSize"] = np.array(size_value, dtype=np.float32)
+        else:
+            raw["imageSize"] = _to_float32(size_value)
+
+    # Handle extrinsics: rotation -> cam_R, translation -> cam_T
+    # Only use if cam_R/cam_T are not already in the PKL file
+    if "rotation" in intrinsics_data and raw.get("cam_R") is None:
+        rotation_value = intrinsics_data["rotation"]
+        if isinstance(rotation_value, (list, tuple)):
+            rotation_array = np.array(rotation_value, dtype=np.float32)
+        else:
+            rotation_array = _to_float32(rotation_value)
+        # Ensure it's 3x3
+        if rotation_array.shape == (3, 3):
+            raw["cam_R"] = rotation_array
+        elif rotation_array.ndim == 2 and rotation_array.shape[1] == 3:
+            # If it's (1, 3, 3) or similar, squeeze it
+            raw["cam_R"] = rotation_array.reshape(3, 3) if rotation_array.size == 9 else rotation_array
+
+    if "translation" in intrinsics_data and raw.get("cam_T") is None:
+        translation_value = intrinsics_data["translation"]
+        if isinstance(translation_value, (list, tuple)):
+            translation_array = np.array(translation_value, dtype=np.float32)
+        else:
+            translation_array = _to_float32(translation_value)
+        # Ensure it's shape (3,)
+        if translation_array.ndim == 1 and translation_array.shape[0] == 3:
+            raw["cam_T"] = translation_array
+        elif translation_array.size == 3:
+            raw["cam_T"] = translation_array.flatten()[:3]
+
+
+def _merge_intrinsics_file(raw, intrinsics_contents: BinaryIO) -> None:
+    """Merge a separately uploaded intrinsics/extrinsics pickle into the raw sequence dict."""
+    try:
+        intrinsics_data = decode_pickle(intrinsics_contents)
+
+        # Handle both pickle format (dict with keys) and JSON-like format
+        if isinstance(intrinsics_data, dict):
+            _merge_calibration(raw, intrinsics_data)
+        else:
+            # If it's a numpy array or list, try to interpret it
+            if isinstance(intrinsics_data, np.ndarray):
+                if intrinsics_data.shape == (3, 3):
+                    raw["intrinsicMat"] = intrinsics_data
+    except Exception as e:
+        # If intrinsics file fails to load, continue without it
+        print(f"Warning: Failed to load intrinsics file: {e}")
+
+
+def _load_cameras(contents: BinaryIO) -> List[Dict]:
+    """Parse an uploaded multi-camera calibration (pickle or JSON) into a list of camera dicts.
+
+    The file holds a list of calibrations, a dict of them keyed by camera name,
+    or either of those under a ``cameras`` key. Each calibration uses the keys
+    of an intrinsics file (``intrinsicMat``, ``distortion``, ``imageSize``,
+    ``rotation``, ``translation``); ``cam_R`` (3, 3) or (frames, 3, 3) and
+    ``cam_T`` (3,) or (frames, 3) are accepted for per-frame extrinsics.
+    """
+    try:
+        data = decode_pickle(contents)
+    except ValueError:
+        contents.seek(0)
+        try:
+            data = load_json(contents)[0]
+        except ValueError as exc:
+            raise ValueError("cameras_file must be a pickle or JSON camera list") from exc
+
+    if isinstance(data, dict) and "cameras" in data:
+        data = data["cameras"]
+    if isinstance(data, dict) and data and all(isinstance(value, dict) for value in data.values()):
+        named = [(str(name), calibration) for name, calibration in data.items()]
+    elif isinstance(data, (list, tuple)) and data and all(isinstance(value, dict) for value in data):
+        named = [(str(calibration.get("name", index)), calibration) for index, calibration in enumerate(data)]
+    else:
+        raise ValueError("cameras_file must hold a list of camera calibrations")
+
+    cameras = []
+    for name, calibration in named:
+        camera: Dict = {"name": name}
+        for key in ("cam_R", "cam_T"):
+            if calibration.get(key) is not None:
+                camera[key] = _to_float32(calibration[key])
+        _merge_calibration(camera, calibration)
+        if camera.get("cam_R") is None or camera.get("cam_T") is None:
+            raise ValueError(f"Camera {name} has no rotation/translation")
+        if camera.get("intrinsicMat") is None or camera["intrinsicMat"].shape != (3, 3):
+            raise ValueError(f"Camera {name} has no 3x3 intrinsic matrix")
+        cameras.append(camera)
+    return cameras
+
+
+def _detach_memmap(value):
+    """``value``, or an in-memory copy when it is (a view of) an ``np.memmap``."""
+    base = value
+    while isinstance(base, np.ndarray) and not isinstance(base, np.memmap):
+        base = base.base
+    return np.array(value) if isinstance(base, np.memmap) else value
+
+
+def _prepare_sequence(
+    contents: BinaryIO,
+    intrinsics_contents: Optional[BinaryIO],
+    metrics: Optional[Dict] = None,
+    cameras_contents: Optional[BinaryIO] = None,
+) -> Dict:
+    """Decode an uploaded SMPL pickle (plus optional intrinsics) into a normalised sequence.
+
+    When ``metrics`` is given, the detected container format and the decode and
+    normalisation times (seconds) are recorded in it. A ``cameras_contents``
+    calibration list is stored as ``sequence["cameras"]``.
+    """
+    started = time.perf_counter()
+    raw, source_format = decode_payload(contents)
+    decoded = time.perf_counter()
+
+    # If intrinsics file is provided separately, merge it into the raw data
+    if intrinsics_contents is not None:
+        _merge_intrinsics_file(raw, intrinsics_contents)
+
+    # Copy arrays that still view a memory-mapped .npy/.npz upload, so cached results and stored
+    # handles own memory their budgets account for instead of keeping the spooled temporary file mapped.
+    sequence = {key: _detach_memmap(value) for key, value in _normalize_sequence(raw).items()}
+    if cameras_contents is not None:
+        sequence["cameras"] = _load_cameras(cameras_contents)
+    if metrics is not None:
+        metrics["format"] = source_format
+        metrics["decode"] = decoded - started
+        metrics["normalize"] = time.perf_counter() - decoded
+    return sequence
+
+
+def _server_timing(metrics: Optional[Dict]) -> str:
+    """Server-Timing header for a fresh evaluation's metrics, or a cache-hit marker when there are none."""
+    if not metrics:
+        return 'cache;desc="hit"'
+    parts = [f'decode;dur={metrics["decode"] * 1000:.1f};desc="{metrics["format"]}"']
+    for name in ("normalize", "assemble", "evaluate"):
+        if name in metrics:
+            parts.append(f"{name};dur={metrics[name] * 1000:.1f}")
+    return ", ".join(parts)
+
+
+def _keyframe_subsequence(sequence: Dict, points: np.ndarray, tolerance: float) -> Tuple[Dict, np.ndarray]:
+    keyframes = _select_keyframes(points, sequence["time"], tolerance)
+    return _select_frames(sequence, keyframes), keyframes
+
+
+async def _decimate_sequence(sequence: Dict, tolerance: float) -> Tuple[Dict, np.ndarray]:
+    """Drop frames that linear interpolation reproduces within ``tolerance`` metres on every joint.
+
+    Joints come from the cheap joints-only forward pass (or from the pickle when
+    it already carries verts/joints), so only the kept frames are skinned later.
+    The 45 SMPL joints include hand, foot and face extremity points, which keeps
+    the vertex error close to the joint bound.
+    """
+    joints = sequence.get("joints")
+    if sequence.get("verts") is None or joints is None:
+        _, joints, _, _ = await _forward(
+            sequence["poses"], sequence["betas"], sequence["trans"], sequence["gender"], joints_only=True
+        )
+    if joints.shape[0] != sequence["poses"].shape[0]:
+        raise ValueError("Cannot decimate a sequence whose joint and pose frame counts differ.")
+
+    return await worker_pool.run_admitted(_keyframe_subsequence, sequence, joints, tolerance)
+
+
+def _pop_pickle_mesh(
+    sequence: Dict, joints_only: bool, lod: int
+) -> Optional[Tuple[Optional[np.ndarray], np.ndarray, np.ndarray, Optional[str]]]:
+    """Take pre-computed verts/joints/faces out of a normalised sequence.
+
+    Returns (vertices, joints, faces, topology_id) when the pickle already holds
+    the mesh, or None when the SMPL model has to be evaluated.
+    """
+    verts = sequence.pop("verts", None)
+    joints = sequence.pop("joints", None)
+    faces = sequence.pop("faces", None)
+    if verts is None or joints is None:
+        return None
+
+    topology_id = None
+    vertices = verts.astype(np.float32, copy=False) if not joints_only else None
+    if faces is None:
+        topology = processor.topology(sequence["gender"], lod)
+        faces, topology_id = topology["faces"], topology["id"]
+        if vertices is not None and topology["vertex_ids"] is not None:
+            vertices = vertices[:, topology["vertex_ids"]]
+    return vertices, joints.astype(np.float32, copy=False), faces, topology_id
+
+
+async def _evaluate_mesh(
+    sequence: Dict, joints_only: bool, lod: int
+) -> Tuple[Optional[np.ndarray], np.ndarray, np.ndarray, Optional[str]]:
+    """(vertices, joints, faces, topology_id) of a normalised sequence: the pickle's own mesh, or the SMPL forward pass.
+
+    Pops any pre-computed verts/joints/faces out of ``sequence``.
+    """
+    if sequence.get("verts") is not None and sequence.get("joints") is not None:
+        return await worker_pool.run_admitted(_pop_pickle_mesh, sequence, joints_only, lod)
+    for key in ("verts", "joints", "faces"):
+        sequence.pop(key, None)
+    return await _forward(
+        sequence["poses"], sequence["betas"], sequence["trans"], sequence["gender"], joints_only, lod
+    )
+
+
+def _sequence_result(
+    sequence: Dict,
+    vertices: Optional[np.ndarray],
+    joints: np.ndarray,
+    faces: np.ndarray,
+    topology_id: Optional[str],
+) -> Dict:
+    """Project the joints and assemble the result dict the sequence endpoints (and the cache) use."""
+    try:
+        projected = _compute_projected_points(sequence, joints.reshape(joints.shape[0], joints.shape[1], 3))
+    except Exception:
+        projected = None
+    projected_cameras = _compute_camera_projections(sequence, joints)
+
+    return {
+        "sequence": sequence,
+        "vertices": vertices,
+        "joints": joints,
+        "faces": faces,
+        "projected": projected,
+        "projected_cameras": projected_cameras,
+        "topology_id": topology_id,
+        "keyframes": None,
+        "source_frame_count": int(joints.shape[0]),
+    }
+
+
+def _windowed_sequence(
+    contents: BinaryIO,
+    intrinsics_contents: Optional[BinaryIO],
+    metrics: Dict,
+    cameras_contents: Optional[BinaryIO] = None,
+    target_fps: Optional[float] = None,
+    frame_range: Optional[Tuple[Optional[int], Optional[int], Optional[int]]] = None,
+) -> Tuple[Dict, Optional[Dict]]:
+    """Decode and normalise an upload, then resample it and cut it to its frame window: (sequence, frame_window)."""
+    sequence = _prepare_sequence(contents, intrinsics_contents, metrics, cameras_contents)
+    frame_window = None
+    if frame_range is not None:
+        frame_count = sequence["poses"].shape[0]
+        if target_fps is not None and frame_count > 1:
+            # The window is in output frames; count them without resampling everything.
+            frame_count = resample_times(_frame_times(sequence), target_fps).shape[0]
+        window, frame_window = _frame_window(frame_count, *frame_range)
+        if target_fps is not None:
+            sequence = _resample_sequence(sequence, target_fps, window)
+        else:
+            sequence = _select_frames(sequence, window)
+    elif target_fps is not None:
+        sequence = _resample_sequence(sequence, target_fps)
+    return sequence, frame_window
+
+
+def _evaluated_result(
+    sequence: Dict,
+    mesh: Tuple[Optional[np.ndarray], np.ndarray, np.ndarray, Optional[str]],
+    keyframes: Optional[np.ndarray],
+    vertex_tolerance: Optional[float],
+) -> Dict:
+    """Result dict of an evaluated mesh, first decimated on its vertices when ``vertex_tolerance`` is set."""
+    vertices, joints, faces, topology_id = mesh
+    if vertex_tolerance is not None:
+        # Exact bound on every vertex: decimate the evaluated mesh (saves payload, not compute).
+        keyframes = _select_keyframes(vertices if vertices is not None else joints, sequence["time"], vertex_tolerance)
+        sequence = _select_frames(sequence, keyframes)
+        joints = joints[keyframes]
+        if vertices is not None:
+            vertices = vertices[keyframes]
+
+    result = _sequence_result(sequence, vertices, joints, faces, topology_id)
+    result["keyframes"] = keyframes
+    return result
+
+
+async def _evaluate_sequence(
+    contents: BinaryIO,
+    intrinsics_contents: Optional[BinaryIO],
+    joints_only: bool = False,
+    decimate_tolerance: Optional[float] = None,
+    decimate_on: str = "joints",
+    lod: int = 0,
+    cameras_contents: Optional[BinaryIO] = None,
+    target_fps: Optional[float] = None,
+    frame_range: Optional[Tuple[Optional[int], Optional[int], Optional[int]]] = None,
+) -> Dict:
+    """Decode, normalise and evaluate an uploaded SMPL sequence into the result dict the endpoint caches.
+
+    The options are those of ``/api/smpl/sequence`` (see the README). The pool
+    admits the request at decoding (raising WorkerPoolFull when it is full);
+    later stages run as admitted jobs and the forward pass goes through the
+    micro-batcher. Raises ValueError/FileNotFoundError like the endpoint expects.
+    """
+    metrics: Dict = {}
+    sequence, frame_window = await worker_pool.run(
+        _windowed_sequence, contents, intrinsics_contents, metrics, cameras_contents, target_fps, frame_range
+    )
+    started = time.perf_counter()
+    source_frame_count = int(sequence["poses"].shape[0])
+    keyframes = None
+    if decimate_tolerance is not None and decimate_on == "joints":
+        sequence, keyframes = await _decimate_sequence(sequence, decimate_tolerance)
+
+    mesh = await _evaluate_mesh(sequence, joints_only, lod)
+
+    vertex_tolerance = decimate_tolerance if decimate_on == "vertices" else None
+    result = await worker_pool.run_admitted(_evaluated_result, sequence, mesh, keyframes, vertex_tolerance)
+    result["source_frame_count"] = source_frame_count
+    result["frame_window"] = frame_window
+    metrics["evaluate"] = time.perf_counter() - started
+    result["metrics"] = metrics
+    return result
+
+
+def _evaluate_sequence_batch(
+    uploads: List[Tuple[BinaryIO, Optional[BinaryIO]]],
+    joints_only: bool = False,
+    lod: int = 0,
+) -> List[Union[Dict, Exception]]:
+    """Evaluate many uploads, running the SMPL forward pass once per gender over their concatenated frames.
+
+    Fusing short clips keeps every ``processor.batch_size`` chunk full instead of
+    paying one mostly empty chunk per file. Returns one entry per upload, in
+    order: the same result dict as :func:`_evaluate_sequence`, or the exception
+    that file raised (failures do not affect the other files).
+    """
+    results: List[Union[Dict, Exception, None]] = [None] * len(uploads)
+    groups: Dict[Tuple, List[Tuple[int, Dict]]] = {}
+    for index, (contents, intrinsics_contents) in enumerate(uploads):
+        try:
+            sequence = _prepare_sequence(contents, intrinsics_contents)
+            mesh = _pop_pickle_mesh(sequence, joints_only, lod)
+            if mesh is not None:
+                results[index] = _sequence_result(sequence, *mesh)
+                continue
+        except Exception as exc:
+            results[index] = exc
+            continue
+        # Only sequences with matching parameter layouts can share a batch.
+        group = (processor._gender_key(sequence["gender"]), sequence["poses"].shape[1:], sequence["betas"].shape[1:])
+        groups.setdefault(group, []).append((index, sequence))
+
+    for (gender, _, _), members in groups.items():
+        try:
+            vertices, joints, faces = processor.forward(
+                np.concatenate([sequence["poses"] for _, sequence in members]),
+                np.concatenate([sequence["betas"] for _, sequence in members]),
+                np.concatenate([sequence["trans"] for _, sequence in members]),
+                gender,
+                joints_only,
+                lod,
+            )
+            topology_id = processor.topology(gender, lod)["id"]
+        except Exception as exc:
+            for index, _ in members:
+                results[index] = exc
+            continue
+
+        start = 0
+        for index, sequence in members:
+            end = start + sequence["poses"].shape[0]
+            # Copies, so a cached result does not pin the whole concatenated batch in memory.
+            results[index] = _sequence_result(
+                sequence,
+                vertices[start:end].copy() if vertices is not None else None,
+                joints[start:end].copy(),
+                faces,
+                topology_id,
+            )
+            start = end
+    return results
+
+
+def _wants_binary(request: Request, response_format: Optional[str]) -> bool:
+    """Negotiate the response encoding from ?format= first, then the Accept header."""
+    if response_format is not None:
+        if response_format not in {"json", "binary"}:
+            raise HTTPException(status_code=400, detail=f"Unsupported response format: {response_format}")
+        return response_format == "binary"
+    return SMPL_BINARY_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def _camera_metadata(sequence: Dict, projected_shape: Optional[Tuple[int, ...]]) -> Dict:
+    metadata = {}
+    for key in ("cam_R", "cam_T", "intrinsicMat", "distortion", "imageSize"):
+        if sequence.get(key) is not None:
+            metadata[key] = sequence[key].astype(float).tolist()
+    if projected_shape is not None:
+        metadata["projected_shape"] = [int(dim) for dim in projected_shape]
+        if sequence.get("imageSize") is not None:
+            metadata["projected_image_size"] = sequence["imageSize"].astype(float).tolist()
+    if sequence.get("cameras"):
+        metadata["cameras"] = [_camera_description(camera) for camera in sequence["cameras"]]
+    return metadata
+
+
+def _camera_description(camera: Dict) -> Dict:
+    """Name and intrinsics of one camera of a multi-camera calibration, for response metadata."""
+    description = {"name": camera["name"]}
+    for key in ("intrinsicMat", "distortion", "imageSize"):
+        if camera.get(key) is not None:
+            description[key] = camera[key].astype(float).tolist()
+    return description
+
+
+def _sequence_metadata(
+    sequence: Dict,
+    name: Optional[str],
+    frame_count: int,
+    vertex_count: int,
+    joint_count: int,
+    topology_id: Optional[str],
+    projected_shape: Optional[Tuple[int, ...]],
+) -> Dict:
+    """Scalar fields shared by the JSON, binary and streaming sequence responses."""
+    metadata = {
+        "name": name,
+        "fps": sequence["fps"],
+        "frame_count": int(frame_count),
+        "vertex_count": int(vertex_count),
+        "joint_count": int(joint_count),
+        "gender": sequence["gender"],
+        "skeleton_edges": SMPL_SKELETON_EDGES,
+    }
+    if topology_id is not None:
+        metadata["topology_id"] = topology_id
+        metadata["topology_url"] = f"/api/smpl/topology/{topology_id}"
+    metadata.update(_camera_metadata(sequence, projected_shape))
+    return metadata
+
+
+async def _upload_digests(
+    contents: BinaryIO, intrinsics_contents: Optional[BinaryIO]
+) -> Optional[Tuple[Optional[bytes], Optional[bytes]]]:
+    """SHA-256 of an upload and its intrinsics, hashed off the event loop (None when the cache is off)."""
+    if not result_cache.enabled:
+        return None
+    return await run_in_threadpool(lambda: (upload_digest(contents), upload_digest(intrinsics_contents)))
+
+
+def _sequence_cache_key(digests: Optional[Tuple[Optional[bytes], Optional[bytes]]], **options) -> Optional[str]:
+    """Result cache key for an upload's digests; options that change the evaluation are folded in when set."""
+    if digests is None:
+        return None
+    parts = list(digests)
+    variant = ",".join(f"{key}={value}" for key, value in sorted(options.items()) if value)
+    if variant:
+        parts.append(hashlib.sha256(variant.encode("utf-8")).digest())
+    return ResultCache.make_key_from_digests(*parts)
+
+
+async def _cached_result(cache_key: Optional[str]) -> Optional[Dict]:
+    """Result cache lookup off the event loop (a disk hit unpickles the whole result)."""
+    if cache_key is None:
+        return None
+    return await run_in_threadpool(result_cache.get, cache_key)
+
+
+async def _cache_result(cache_key: Optional[str], result: Dict) -> None:
+    """Store an evaluated result on the worker pool (the disk tier pickles it and sweeps its directory)."""
+    if cache_key is not None:
+        await worker_pool.run_admitted(result_cache.put, cache_key, result)
+
+
+def _required_upload(upload: UploadFile) -> BinaryIO:
+    contents = upload_file(upload)
+    if contents is None:
+        raise HTTPException(status_code=400, detail=f"Uploaded file {upload.filename} is empty.")
+    return contents
+
+
+def _sequence_content(
+    result: Dict,
+    name: Optional[str],
+    binary: bool,
+    include_faces: bool = True,
+    vertex_encoding: str = "float32",
+    projected_vertices: Optional[np.ndarray] = None,
+) -> Union[Dict, Tuple[Dict, Dict[str, np.ndarray]]]:
+    """Body of a sequence response: the JSON dict, or (header, arrays) for the binary encoding.
+
+    ``projected_vertices`` (see :func:`_project_result_vertices`) is added to binary responses.
+    """
+    sequence = result["sequence"]
+    vertices = result["vertices"]
+    joints = result["joints"]
+    faces = result["faces"]
+    projected = result["projected"]
+    projected_cameras = result.get("projected_cameras")
+    topology_id = result.get("topology_id")
+    # Faces that did not come from the SMPL model have no topology resource to point at.
+    if topology_id is None:
+        include_faces = True
+    # Joints-only results carry no mesh at all.
+    joints_only = vertices is None
+    if joints_only:
+        include_faces = False
+        topology_id = None
+
+    metadata = _sequence_metadata(
+        sequence,
+        name,
+        joints.shape[0],
+        vertices.shape[1] if not joints_only else 0,
+        joints.shape[1],
+        topology_id,
+        projected.shape if projected is not None else None,
+    )
+    keyframes = result.get("keyframes")
+    if keyframes is not None:
+        metadata["source_frame_count"] = result["source_frame_count"]
+    if result.get("frame_window") is not None:
+        metadata["frame_window"] = result["frame_window"]
+    if projected_cameras is not None:
+        metadata["projected_cameras_shape"] = [int(dim) for dim in projected_cameras.shape]
+    if joints_only:
+        metadata["joints_only"] = True
+    else:
+        vertices, vertices_encoding = encode_vertices(vertices, vertex_encoding)
+        if vertices_encoding is not None:
+            metadata["vertices_encoding"] = vertices_encoding
+
+    if binary:
+        arrays = {"time": sequence["time"].astype(np.float32, copy=False)}
+        if include_faces:
+            arrays["faces"] = faces.astype(np.int32, copy=False)
+        if not joints_only:
+            arrays["vertices"] = vertices
+        arrays["joints"] = joints.astype(np.float32, copy=False)
+        if projected is not None:
+            arrays["projected_joints"] = projected
+        if projected_cameras is not None:
+            arrays["projected_cameras"] = projected_cameras
+        if projected_vertices is not None:
+            arrays["projected_vertices"] = projected_vertices
+        if keyframes is not None:
+            arrays["keyframe_indices"] = keyframes.astype(np.int32)
+        return metadata, arrays
+
+    response = {
+        **metadata,
+        "time": sequence["time"].astype(float).tolist(),
+        "joints": _encode_float32(joints),
+    }
+    if not joints_only:
+        response["vertices"] = _encode_buffer(vertices)
+    if include_faces:
+        response["faces"] = faces.tolist()
+    if projected is not None:
+        response["projected_joints"] = _encode_float32(projected)
+    if projected_cameras is not None:
+        response["projected_cameras"] = _encode_float32(projected_cameras)
+    if keyframes is not None:
+        response["keyframe_indices"] = keyframes.tolist()
+    return response
+
+
+async def _topology(gender: str, lod: int) -> Dict:
+    """``processor.topology`` from the event loop: a cached topology directly, a first build on the worker pool.
+
+    Building a level of detail simplifies the mesh, which takes seconds.
+    """
+    topology = processor.cached_topology(gender, lod)
+    if topology is None:
+        topology = await worker_pool.run(processor.topology, gender, lod)
+    return topology
+
+
+async def _project_result_vertices(result: Dict, admitted: bool) -> Optional[np.ndarray]:
+    """:func:`_compute_projected_vertices` of a result, on the worker pool (None without a mesh or camera).
+
+    ``admitted`` says whether the request already passed the pool's admission
+    (it evaluated the sequence); only a request that did no pool work yet, such
+    as a cache hit, can still be turned away here.
+    """
+    if result["vertices"] is None:
+        return None
+    run = worker_pool.run_admitted if admitted else worker_pool.run
+    try:
+        return await run(_compute_projected_vertices, result["sequence"], result["vertices"])
+    except WorkerPoolFull as exc:
+        raise _busy_error(exc) from exc
+
+
+def _build_sequence_response(
+    result: Dict,
+    name: Optional[str],
+    binary: bool,
+    include_faces: bool = True,
+    vertex_encoding: str = "float32",
+    projected_vertices: Optional[np.ndarray] = None,
+) -> Response:
+    content = _sequence_content(result, name, binary, include_faces, vertex_encoding, projected_vertices)
+    if binary:
+        return Response(
+            content=encode_binary(*content),
+            media_type=SMPL_BINARY_MEDIA_TYPE,
+            headers={"Vary": "Accept"},
+        )
+    return JSONResponse(content, headers={"Vary": "Accept"})
 
 
 @app.post("/api/smpl/sequence")
 async def upload_smpl_sequence(
+    request: Request,
     file: UploadFile = File(...),
-    intrinsics_file: Optional[UploadFile] = File(None)
+    intrinsics_file: Optional[UploadFile] = File(None),
+    cameras_file: Optional[UploadFile] = File(None),
+    response_format: Optional[str] = Query(None, alias="format"),
+    include_faces: bool = Query(True),
+    joints_only: bool = Query(False),
+    vertex_encoding: str = Query("float32"),
+    decimate_tolerance: Optional[float] = Query(None, gt=0),
+    decimate_on: str = Query("joints"),
+    lod: int = Query(0, ge=0, le=max(SMPL_LOD_VERTEX_COUNTS)),
+    project_vertices: bool = Query(False),
+    target_fps: Optional[float] = Query(None, gt=0, le=1000),
+    start: Optional[int] = Query(None, ge=0),
+    end: Optional[int] = Query(None, ge=0),
+    stride: Optional[int] = Query(None, ge=1),
+):
+    """Evaluate an SMPL pickle. Responds with JSON by default, or with the binary
+    framing from ``smpl_service.binary_format`` when ``?format=binary`` is passed or
+    the Accept header lists ``application/vnd.opencap.smpl-sequence``.
+
+    The other query options (encodings, decimation, levels of detail, cameras,
+    resampling, frame windows) are documented in the README's API and feature
+    sections."""
+    binary = _wants_binary(request, response_format)
+    if vertex_encoding not in VERTEX_ENCODINGS:
+        raise HTTPException(status_code=400, detail=f"Unsupported vertex encoding: {vertex_encoding}")
+    if decimate_on not in {"joints", "vertices"}:
+        raise HTTPException(status_code=400, detail=f"Unsupported decimation target: {decimate_on}")
+    if decimate_tolerance is None:
+        decimate_on = None
+    if project_vertices and not binary:
+        raise HTTPException(status_code=400, detail="project_vertices requires the binary response format.")
+    if joints_only:
+        lod = 0
+    contents = _required_upload(file)
+    intrinsics_contents = upload_file(intrinsics_file)
+    cameras_contents = upload_file(cameras_file)
+    digests = await _upload_digests(contents, intrinsics_contents)
+    cameras_digest = None
+    if digests is not None and cameras_contents is not None:
+        cameras_digest = (await run_in_threadpool(upload_digest, cameras_contents)).hex()
+
+    frame_range = (start, end, stride) if (start, end, stride) != (None, None, None) else None
+    shared_options = {
+        "decimate_tolerance": decimate_tolerance,
+        "decimate_on": decimate_on,
+        "cameras": cameras_digest,
+        "target_fps": target_fps,
+        "frame_range": frame_range,
+    }
+    cache_key = _sequence_cache_key(digests, joints_only=joints_only, lod=lod, **shared_options)
+    result = await _cached_result(cache_key)
+    metrics = None
+    if result is None and joints_only:
+        # A cached full evaluation already has the joints; just drop the mesh.
+        full_key = _sequence_cache_key(digests, **shared_options)
+        full_result = await _cached_result(full_key)
+        if full_result is not None:
+            result = {**full_result, "vertices": None}
+    if result is None:
+        try:
+            result = await _evaluate_sequence(
+                contents,
+                intrinsics_contents,
+                joints_only,
+                decimate_tolerance,
+                decimate_on,
+                lod,
+                cameras_contents,
+                target_fps,
+                frame_range,
+            )
+        except WorkerPoolFull as exc:
+            raise _busy_error(exc) from exc
+        except ValueError as exc:
+            raise HTTPException(status_code=400, detail=str(exc)) from exc
+        except FileNotFoundError as exc:
+            raise HTTPException(status_code=500, detail=str(exc)) from exc
+        except Exception as exc:  # pragma: no cover - protect against unexpected runtime errors
+            raise HTTPException(status_code=500, detail=f"Failed to evaluate SMPL sequence: {exc}") from exc
+        metrics = result["metrics"]
+        await _cache_result(cache_key, result)
+
+    projected_vertices = await _project_result_vertices(result, metrics is not None) if project_vertices else None
+    response = await run_in_threadpool(
+        _build_sequence_response, result, file.filename, binary, include_faces, vertex_encoding, projected_vertices
+    )
+    response.headers["Server-Timing"] = _server_timing(metrics)
+    return response
+
+
+def _batch_error_entry(name: Optional[str], exc: Exception) -> Dict:
+    """Per-file failure of a batch, with the status the single-file endpoint would have answered."""
+    if isinstance(exc, ValueError):
+        return {"name": name, "status": 400, "error": str(exc)}
+    if isinstance(exc, FileNotFoundError):
+        return {"name": name, "status": 500, "error": str(exc)}
+    return {"name": name, "status": 500, "error": f"Failed to evaluate SMPL sequence: {exc}"}
+
+
+def _build_batch_response(
+    results: List[Union[Dict, Exception]],
+    names: List[Optional[str]],
+    binary: bool,
+    include_faces: bool,
+    vertex_encoding: str,
+) -> Response:
+    entries = []
+    for result, name in zip(results, names):
+        if isinstance(result, Exception):
+            error = _batch_error_entry(name, result)
+            entries.append((error, {}) if binary else error)
+        else:
+            entries.append(_sequence_content(result, name, binary, include_faces, vertex_encoding))
+
+    if binary:
+        body = b"".join(encode_stream_frame(header, arrays) for header, arrays in entries)
+        return Response(content=body, media_type=SMPL_BINARY_STREAM_MEDIA_TYPE, headers={"Vary": "Accept"})
+    return JSONResponse({"count": len(entries), "results": entries}, headers={"Vary": "Accept"})
+
+
+@app.post("/api/smpl/sequence/batch")
+async def upload_smpl_sequence_batch(
+    request: Request,
+    files: List[UploadFile] = File(...),
+    intrinsics_files: Optional[List[UploadFile]] = File(None),
+    response_format: Optional[str] = Query(None, alias="format"),
+    include_faces: bool = Query(True),
+    joints_only: bool = Query(False),
+    vertex_encoding: str = Query("float32"),
+    lod: int = Query(0, ge=0, le=max(SMPL_LOD_VERTEX_COUNTS)),
 ):
-    contents = await file.read()
+    """Evaluate many SMPL pickles in one request.
+
+    ``intrinsics_files`` is optional; when given it must have one part per
+    entry of ``files`` (an empty part means "no intrinsics" for that file).
+    Sequences are grouped by gender and their frames concatenated so the SMPL
+    layers run full ``processor.batch_size`` batches. The JSON response is
+    ``{"count", "results"}`` with one entry per file, in upload order, shaped
+    like the ``/api/smpl/sequence`` response; with ``format=binary`` the body is
+    one length-prefixed binary payload per file, as in the streaming endpoint.
+    Files that fail carry ``status`` and ``error`` instead of data.
+    """
+    binary = _wants_binary(request, response_format)
+    if vertex_encoding not in VERTEX_ENCODINGS:
+        raise HTTPException(status_code=400, detail=f"Unsupported vertex encoding: {vertex_encoding}")
+    if len(files) > SMPL_BATCH_MAX_FILES:
+        raise HTTPException(status_code=400, detail=f"At most {SMPL_BATCH_MAX_FILES} files per batch.")
+    intrinsics_files = intrinsics_files or []
+    if intrinsics_files and len(intrinsics_files) != len(files):
+        raise HTTPException(status_code=400, detail="intrinsics_files must have one part per sequence file.")
+    if joints_only:
+        lod = 0
+
+    uploads = []
+    cache_keys = []
+    for index, upload in enumerate(files):
+        contents = _required_upload(upload)
+        intrinsics_contents = upload_file(intrinsics_files[index]) if intrinsics_files else None
+        uploads.append((contents, intrinsics_contents))
+        digests = await _upload_digests(contents, intrinsics_contents)
+        cache_keys.append(_sequence_cache_key(digests, joints_only=joints_only, lod=lod))
+    results = [await _cached_result(key) for key in cache_keys]
+    missing = [index for index, result in enumerate(results) if result is None]
+    if missing:
+        try:
+            evaluated = await worker_pool.run(
+                _evaluate_sequence_batch, [uploads[index] for index in missing], joints_only, lod
+            )
+        except WorkerPoolFull as exc:
+            raise _busy_error(exc) from exc
+        for index, result in zip(missing, evaluated):
+            results[index] = result
+            if not isinstance(result, Exception):
+                await _cache_result(cache_keys[index], result)
+
+    names = [upload.filename for upload in files]
+    return await run_in_threadpool(_build_batch_response, results, names, binary, include_faces, vertex_encoding)
+
+
+def _slice_camera_frames(sequence: Dict, start: int, end: int, frames: int) -> Dict:
+    """Shallow copy of ``sequence`` with per-frame extrinsics cut down to frames [start, end)."""
+    sliced = dict(sequence)
+    cam_R = sequence.get("cam_R")
+    if cam_R is not None:
+        if cam_R.ndim == 4 and cam_R.shape[0] == 1 and cam_R.shape[1] == frames:
+            sliced["cam_R"] = cam_R[0, start:end]
+        elif cam_R.ndim == 3 and cam_R.shape[0] == frames:
+            sliced["cam_R"] = cam_R[start:end]
+    cam_T = sequence.get("cam_T")
+    if cam_T is not None and cam_T.ndim == 2 and cam_T.shape[0] == frames:
+        sliced["cam_T"] = cam_T[start:end]
+    return sliced
+
+
+def _iter_result_chunks(result: Dict) -> Iterator[Tuple[int, np.ndarray, np.ndarray, Optional[np.ndarray]]]:
+    """Replay an already evaluated (e.g. cached) result in chunks of the SMPL batch size."""
+    vertices, joints, projected = result["vertices"], result["joints"], result["projected"]
+    for start in range(0, vertices.shape[0], processor.batch_size):
+        end = start + processor.batch_size
+        yield start, vertices[start:end], joints[start:end], projected[start:end] if projected is not None else None
+
+
+def _iter_sequence_chunks(
+    sequence: Dict,
+    verts: Optional[np.ndarray],
+    joints: Optional[np.ndarray],
+    vertex_ids: Optional[np.ndarray] = None,
+    lod: int = 0,
+) -> Iterator[Tuple[int, np.ndarray, np.ndarray, Optional[np.ndarray]]]:
+    """Evaluate a normalised sequence chunk by chunk, projecting each chunk as it is produced.
+
+    ``vertex_ids`` cuts pickle-provided vertices down to an LOD subset; model
+    evaluation skins only the ``lod`` subset in the first place.
+    """
+    if verts is not None and joints is not None:
+        frames = verts.shape[0]
+        if vertex_ids is not None:
+            verts = verts[:, vertex_ids]
+        source = (
+            (start, verts[start:start + processor.batch_size], joints[start:start + processor.batch_size])
+            for start in range(0, frames, processor.batch_size)
+        )
+    else:
+        frames = sequence["poses"].shape[0]
+        source = processor.iter_forward(
+            sequence["poses"], sequence["betas"], sequence["trans"], sequence["gender"], lod=lod
+        )
+
+    for start, vertices_chunk, joints_chunk in source:
+        vertices_chunk = vertices_chunk.astype(np.float32, copy=False)
+        joints_chunk = joints_chunk.astype(np.float32, copy=False)
+        end = start + vertices_chunk.shape[0]
+        try:
+            projected = _compute_projected_points(_slice_camera_frames(sequence, start, end, frames), joints_chunk)
+        except Exception:
+            projected = None
+        yield start, vertices_chunk, joints_chunk, projected
+
+
+def _collect_chunks_into_cache(chunks, frame_count: int, result_fields: Dict, cache_key: str):
+    """Pass chunks through unchanged and store the assembled result once the stream completes."""
+    vertices = joints = projected = None
+    for start, vertices_chunk, joints_chunk, projected_chunk in chunks:
+        end = start + vertices_chunk.shape[0]
+        if vertices is None:
+            vertices = np.empty((frame_count,) + vertices_chunk.shape[1:], dtype=np.float32)
+            joints = np.empty((frame_count,) + joints_chunk.shape[1:], dtype=np.float32)
+            if projected_chunk is not None:
+                projected = np.empty((frame_count,) + projected_chunk.shape[1:], dtype=np.float32)
+        vertices[start:end] = vertices_chunk
+        joints[start:end] = joints_chunk
+        if projected is not None and projected_chunk is not None:
+            projected[start:end] = projected_chunk
+        yield start, vertices_chunk, joints_chunk, projected_chunk
+
+    if vertices is not None:
+        result_cache.put(cache_key, {**result_fields, "vertices": vertices, "joints": joints, "projected": projected})
+
+
+def _encode_stream_message(message: Dict, arrays: Dict[str, np.ndarray], binary: bool) -> bytes:
+    if binary:
+        return encode_stream_frame(message, arrays)
+    for key, array in arrays.items():
+        message[key] = array.tolist() if key in ("time", "faces") else _encode_float32(array)
+    return (json.dumps(message, separators=(",", ":")) + "\n").encode("utf-8")
+
+
+def _sequence_stream(
+    chunks,
+    sequence: Dict,
+    name: Optional[str],
+    frame_count: int,
+    faces: np.ndarray,
+    topology_id: Optional[str],
+    include_faces: bool,
+    binary: bool,
+) -> Iterator[bytes]:
+    """Yield a header message, one message per evaluated chunk, then an end (or error) message."""
+    header_sent = False
     try:
-        raw = _decode_pickle(contents)
-        
-        # If intrinsics file is provided separately, merge it into the raw data
-        if intrinsics_file is not None:
-            intrinsics_contents = await intrinsics_file.read()
-            try:
-                intrinsics_data = _decode_pickle(intrinsics_contents)
-                
-                # Handle both pickle format (dict with keys) and JSON-like format
-                if isinstance(intrinsics_data, dict):
-                    # Extract intrinsics from the pickle dict
-                    # Handle both "intrinsicMat" and "intrinsic" key names
-                    intrinsic_value = intrinsics_data.get("intrinsicMat") or intrinsics_data.get("intrinsic")
-                    if intrinsic_value is not None:
-                        # Convert to numpy array if it's a list
-                        if isinstance(intrinsic_value, (list, tuple)):
-                            raw["intrinsicMat"] = np.array(intrinsic_value, dtype=np.float32)
-                        else:
-                            raw["intrinsicMat"] = _to_float32(intrinsic_value)
-                    
-                    if "distortion" in intrinsics_data:
-                        dist_value = intrinsics_data["distortion"]
-                        if isinstance(dist_value, (list, tuple)):
-                            raw["distortion"] = np.array(dist_value, dtype=np.float32)
-                        else:
-                            raw["distortion"] = _to_float32(dist_value)
-                    
-                    if "imageSize" in intrinsics_data:
-                        size_value = intrinsics_data["imageSize"]
-                        if isinstance(size_value, (list, tuple)):
-                            raw["imageSize"] = np.array(size_value, dtype=np.float32)
-                        else:
-                            raw["imageSize"] = _to_float32(size_value)
-                    
-                    # Handle extrinsics: rotation -> cam_R, translation -> cam_T
-                    # Only use if cam_R/cam_T are not already in the PKL file
-                    if "rotation" in intrinsics_data and raw.get("cam_R") is None:
-                        rotation_value = intrinsics_data["rotation"]
-                        if isinstance(rotation_value, (list, tuple)):
-                            rotation_array = np.array(rotation_value, dtype=np.float32)
-                        else:
-                            rotation_array = _to_float32(rotation_value)
-                        # Ensure it's 3x3
-                        if rotation_array.shape == (3, 3):
-                            raw["cam_R"] = rotation_array
-                        elif rotation_array.ndim == 2 and rotation_array.shape[1] == 3:
-                            # If it's (1, 3, 3) or similar, squeeze it
-                            raw["cam_R"] = rotation_array.reshape(3, 3) if rotation_array.size == 9 else rotation_array
-                    
-                    if "translation" in intrinsics_data and raw.get("cam_T") is None:
-                        translation_value = intrinsics_data["translation"]
-                        if isinstance(translation_value, (list, tuple)):
-                            translation_array = np.array(translation_value, dtype=np.float32)
-                        else:
-                            translation_array = _to_float32(translation_value)
-                        # Ensure it's shape (3,)
-                        if translation_array.ndim == 1 and translation_array.shape[0] == 3:
-                            raw["cam_T"] = translation_array
-                        elif translation_array.size == 3:
-                            raw["cam_T"] = translation_array.flatten()[:3]
-                else:
-                    # If it's a numpy array or list, try to interpret it
-                    if isinstance(intrinsics_data, np.ndarray):
-                        if intrinsics_data.shape == (3, 3):
-                            raw["intrinsicMat"] = intrinsics_data
-            except Exception as e:
-                # If intrinsics file fails to load, continue without it
-                print(f"Warning: Failed to load intrinsics file: {e}")
-        
-        sequence = _normalize_sequence(raw)
-        verts = sequence.pop("verts", None)
-        joints = sequence.pop("joints", None)
-        faces = sequence.pop("faces", None)
-
-        if verts is not None and joints is not None:
-            vertices = verts.astype(np.float32)
-            joints = joints.astype(np.float32)
-            if faces is None:
-                _, _, faces = processor.forward(sequence["poses"], sequence["betas"], sequence["trans"], sequence["gender"])
+        for start, vertices_chunk, joints_chunk, projected_chunk in chunks:
+            if not header_sent:
+                projected_shape = (frame_count,) + projected_chunk.shape[1:] if projected_chunk is not None else None
+                metadata = _sequence_metadata(
+                    sequence,
+                    name,
+                    frame_count,
+                    vertices_chunk.shape[1],
+                    joints_chunk.shape[1],
+                    topology_id,
+                    projected_shape,
+                )
+                arrays = {"time": sequence["time"].astype(np.float32, copy=False)}
+                if include_faces or topology_id is None:
+                    arrays["faces"] = faces.astype(np.int32, copy=False)
+                yield _encode_stream_message({"type": "header", **metadata}, arrays, binary)
+                header_sent = True
+
+            arrays = {"vertices": vertices_chunk, "joints": joints_chunk}
+            if projected_chunk is not None:
+                arrays["projected_joints"] = projected_chunk
+            message = {"type": "chunk", "start": int(start), "frame_count": int(vertices_chunk.shape[0])}
+            yield _encode_stream_message(message, arrays, binary)
+    except Exception as exc:
+        message = {"type": "error", "detail": f"Failed to evaluate SMPL sequence: {exc}"}
+        yield _encode_stream_message(message, {}, binary)
+        return
+    yield _encode_stream_message({"type": "end"}, {}, binary)
+
+
+@app.post("/api/smpl/sequence/stream")
+async def stream_smpl_sequence(
+    request: Request,
+    file: UploadFile = File(...),
+    intrinsics_file: Optional[UploadFile] = File(None),
+    response_format: Optional[str] = Query(None, alias="format"),
+    include_faces: bool = Query(True),
+    lod: int = Query(0, ge=0, le=max(SMPL_LOD_VERTEX_COUNTS)),
+):
+    """Progressive variant of ``/api/smpl/sequence``.
+
+    Emits newline-delimited JSON (or length-prefixed binary messages with
+    ``format=binary``): a ``header`` message with the sequence metadata, time and
+    faces, one ``chunk`` message per ``processor.batch_size`` frames as soon
+    as it is skinned, and a final ``end`` message. Failures after the header
+    has been sent are reported as an ``error`` message. ``lod`` works as for
+    ``/api/smpl/sequence``.
+    """
+    binary = _wants_binary(request, response_format)
+    contents = _required_upload(file)
+    intrinsics_contents = upload_file(intrinsics_file)
+
+    cache_key = _sequence_cache_key(await _upload_digests(contents, intrinsics_contents), lod=lod)
+    result = await _cached_result(cache_key)
+    metrics = None
+    try:
+        if result is not None:
+            sequence = result["sequence"]
+            frame_count = result["vertices"].shape[0]
+            faces, topology_id = result["faces"], result.get("topology_id")
+            chunks = _iter_result_chunks(result)
         else:
-            vertices, joints, faces = processor.forward(sequence["poses"], sequence["betas"], sequence["trans"], sequence["gender"])
+            metrics = {}
+            sequence = await worker_pool.run(_prepare_sequence, contents, intrinsics_contents, metrics)
+            verts = sequence.pop("verts", None)
+            joints = sequence.pop("joints", None)
+            faces = sequence.pop("faces", None)
+            topology_id = None
+            vertex_ids = None
+            if verts is not None and joints is not None:
+                frame_count = verts.shape[0]
+                if faces is None:
+                    topology = await _topology(sequence["gender"], lod)
+                    faces, topology_id, vertex_ids = topology["faces"], topology["id"], topology["vertex_ids"]
+            else:
+                frame_count = sequence["poses"].shape[0]
+                topology = await _topology(sequence["gender"], lod)
+                faces, topology_id = topology["faces"], topology["id"]
+            if frame_count == 0:
+                raise ValueError("SMPL sequence contains no frames.")
+
+            chunks = _iter_sequence_chunks(sequence, verts, joints, vertex_ids, lod)
+            if cache_key is not None:
+                result_fields = {"sequence": sequence, "faces": faces, "topology_id": topology_id}
+                chunks = _collect_chunks_into_cache(chunks, frame_count, result_fields, cache_key)
+
+        stream = _sequence_stream(chunks, sequence, file.filename, frame_count, faces, topology_id, include_faces, binary)
+        body = worker_pool.iterate(stream, idle_timeout=SMPL_STREAM_IDLE_TIMEOUT)
+    except WorkerPoolFull as exc:
+        raise _busy_error(exc) from exc
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except FileNotFoundError as exc:
@@ -581,336 +1999,521 @@ async def upload_smpl_sequence(
     except Exception as exc:  # pragma: no cover - protect against unexpected runtime errors
         raise HTTPException(status_code=500, detail=f"Failed to evaluate SMPL sequence: {exc}") from exc
 
+    media_type = SMPL_BINARY_STREAM_MEDIA_TYPE if binary else "application/x-ndjson"
+    headers = {"Vary": "Accept", "Server-Timing": _server_timing(metrics)}
+    return StreamingResponse(body, media_type=media_type, headers=headers)
+
+
+@app.get("/api/smpl/topology/{topology_id}")
+async def get_topology(
+    topology_id: str,
+    request: Request,
+    response_format: Optional[str] = Query(None, alias="format"),
+):
+    """Serve the face array of an SMPL model (``smpl-<gender>``) or of one of its
+    simplified meshes (``smpl-<gender>-lod<n>``) once so sequence responses can
+    reference it. LOD topologies include ``source_vertex_ids``, the full-mesh
+    index of each of their vertices."""
+    binary = _wants_binary(request, response_format)
+    model, _, variant = topology_id.partition("-")
+    gender, _, lod_suffix = variant.partition("-")
+    lod = 0
+    if lod_suffix:
+        level = lod_suffix[len("lod"):]
+        lod = int(level) if lod_suffix.startswith("lod") and level.isdigit() else -1
+    if model != "smpl" or gender.upper() not in {"MALE", "FEMALE", "NEUTRAL"} or (
+        lod != 0 and lod not in SMPL_LOD_VERTEX_COUNTS
+    ):
+        raise HTTPException(status_code=404, detail=f"Unknown topology: {topology_id}")
+
     try:
-        projected = _compute_projected_points(sequence, joints.reshape(vertices.shape[0], joints.shape[1], 3))
-    except Exception:
-        projected = None
+        topology = await _topology(gender, lod)
+    except WorkerPoolFull as exc:
+        raise _busy_error(exc) from exc
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
 
-    response = {
+    headers = {
+        "ETag": topology["etag"],
+        "Cache-Control": "public, max-age=86400",
+        "Vary": "Accept",
+    }
+    if_none_match = request.headers.get("if-none-match", "")
+    if topology["etag"] in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+        return Response(status_code=304, headers=headers)
+
+    faces = topology["faces"]
+    metadata = {
+        "id": topology["id"],
+        "vertex_count": topology["vertex_count"],
+        "face_count": int(faces.shape[0]),
+    }
+    arrays = {"faces": faces}
+    if topology["vertex_ids"] is not None:
+        metadata["lod"] = topology["lod"]
+        arrays["source_vertex_ids"] = topology["vertex_ids"]
+    if binary:
+        return Response(
+            content=encode_binary(metadata, arrays),
+            media_type=SMPL_BINARY_MEDIA_TYPE,
+            headers=headers,
+        )
+    return JSONResponse({**metadata, **{key: array.tolist() for key, array in arrays.items()}}, headers=headers)
+
+
+@app.get("/api/smpl/cache")
+def cache_stats():
+    """Hit/miss counters and occupancy of the sequence result cache."""
+    return result_cache.stats()
+
+
+def _store_sequence(
+    contents: BinaryIO,
+    name: Optional[str],
+    intrinsics_contents: Optional[BinaryIO],
+    cameras_contents: Optional[BinaryIO],
+    target_fps: Optional[float],
+) -> Tuple[Optional[str], Dict]:
+    """Decode and normalise an upload once and keep it in ``sequence_store``; returns (id, sequence)."""
+    sequence = _prepare_sequence(contents, intrinsics_contents, None, cameras_contents)
+    if target_fps is not None:
+        sequence = _resample_sequence(sequence, target_fps)
+    return sequence_store.add({"name": name, "sequence": sequence, "outputs": {}}), sequence
+
+
+def _with_camera(sequence: Dict, camera_name: str) -> Dict:
+    """Copy of ``sequence`` whose own camera is the named camera of its calibration list."""
+    for camera in sequence.get("cameras") or []:
+        if camera["name"] == camera_name:
+            view = dict(sequence)
+            for key in ("cam_R", "cam_T", "intrinsicMat", "distortion", "imageSize"):
+                view[key] = camera.get(key)
+            return view
+    raise ValueError(f"Unknown camera: {camera_name}")
+
+
+def _stored_view_window(
+    sequence: Dict,
+    camera_name: Optional[str],
+    frame_range: Optional[Tuple[Optional[int], Optional[int], Optional[int]]],
+) -> Tuple[Dict, Optional[slice], Optional[Dict]]:
+    """A stored sequence seen from ``camera_name``, and its viewed frame window: (sequence, window, frame_window)."""
+    if camera_name is not None:
+        sequence = _with_camera(sequence, camera_name)
+    window = frame_window = None
+    if frame_range is not None:
+        window, frame_window = _frame_window(sequence["poses"].shape[0], *frame_range)
+    return sequence, window, frame_window
+
+
+async def _stored_sequence_view(
+    sequence_id: str,
+    entry: Dict,
+    joints_only: bool,
+    lod: int,
+    frame_range: Optional[Tuple[Optional[int], Optional[int], Optional[int]]],
+    camera_name: Optional[str],
+) -> Dict:
+    """Result dict for a view of a stored sequence.
+
+    Model outputs are kept in the entry once the whole sequence has been
+    evaluated at a level of detail; later views (windows, cameras, encodings,
+    joints-only) slice them. A window of a sequence without stored outputs is
+    evaluated on its own, so paging through a long capture never skins it whole.
+    The pool admits the view when it picks the camera and window (raising
+    WorkerPoolFull when it is full); the forward pass then goes through the
+    micro-batcher and the projections run as admitted worker pool jobs.
+    """
+    sequence, window, frame_window = await worker_pool.run(
+        _stored_view_window, entry["sequence"], camera_name, frame_range
+    )
+
+    outputs = entry["outputs"].get((joints_only, lod))
+    if outputs is None and joints_only:
+        outputs = entry["outputs"].get((False, lod))
+    if outputs is None and window is None:
+        view = dict(sequence)
+        outputs = await _evaluate_mesh(view, joints_only, lod)
+        sequence_store.put(sequence_id, {**entry, "outputs": {**entry["outputs"], (joints_only, lod): outputs}})
+
+    if outputs is not None:
+        vertices, joints, faces, topology_id = outputs
+        view = _select_frames(sequence, window) if window is not None else dict(sequence)
+        for key in ("verts", "joints", "faces"):
+            view.pop(key, None)
+        if joints_only:
+            vertices = None
+        if window is not None:
+            joints = joints[window]
+            vertices = vertices[window] if vertices is not None else None
+    else:
+        view = _select_frames(sequence, window)
+        vertices, joints, faces, topology_id = await _evaluate_mesh(view, joints_only, lod)
+
+    result = await worker_pool.run_admitted(_sequence_result, view, vertices, joints, faces, topology_id)
+    result["frame_window"] = frame_window
+    return result
+
+
+@app.post("/api/smpl/sequences", status_code=201)
+async def create_sequence_handle(
+    file: UploadFile = File(...),
+    intrinsics_file: Optional[UploadFile] = File(None),
+    cameras_file: Optional[UploadFile] = File(None),
+    target_fps: Optional[float] = Query(None, gt=0, le=1000),
+):
+    """Upload a sequence once and get an id for ``GET /api/smpl/sequences/{id}`` views.
+
+    The upload is decoded, normalised (and resampled to ``target_fps``) here;
+    the normalised arrays, and the model outputs once a view has evaluated the
+    whole sequence, stay in memory until the handle is idle for
+    ``SMPL_SEQUENCE_STORE_TTL`` seconds or is evicted as least recently used.
+    """
+    if not sequence_store.enabled:
+        raise HTTPException(status_code=404, detail="Sequence handles are disabled.")
+    contents = _required_upload(file)
+    try:
+        sequence_id, sequence = await worker_pool.run(
+            _store_sequence,
+            contents,
+            file.filename,
+            upload_file(intrinsics_file),
+            upload_file(cameras_file),
+            target_fps,
+        )
+    except WorkerPoolFull as exc:
+        raise _busy_error(exc) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except Exception as exc:  # pragma: no cover - protect against unexpected runtime errors
+        raise HTTPException(status_code=500, detail=f"Failed to store SMPL sequence: {exc}") from exc
+    if sequence_id is None:
+        raise HTTPException(status_code=413, detail="Sequence is too large for the sequence store.")
+
+    return {
+        "id": sequence_id,
+        "url": f"/api/smpl/sequences/{sequence_id}",
         "name": file.filename,
+        "frame_count": int(sequence["poses"].shape[0]),
         "fps": sequence["fps"],
-        "frame_count": int(vertices.shape[0]),
-        "vertex_count": int(vertices.shape[1]),
-        "joint_count": int(joints.shape[1]),
         "gender": sequence["gender"],
-        "time": sequence["time"].astype(float).tolist(),
-        "faces": faces.tolist(),
-        "vertices": _encode_float32(vertices),
-        "joints": _encode_float32(joints),
-        "skeleton_edges": SMPL_SKELETON_EDGES,
+        "cameras": [camera["name"] for camera in sequence.get("cameras") or []],
+        "ttl_seconds": sequence_store.ttl,
     }
-    if sequence.get("cam_R") is not None:
-        response["cam_R"] = sequence["cam_R"].astype(float).tolist()
-    if sequence.get("cam_T") is not None:
-        response["cam_T"] = sequence["cam_T"].astype(float).tolist()
-    if sequence.get("intrinsicMat") is not None:
-        response["intrinsicMat"] = sequence["intrinsicMat"].astype(float).tolist()
-    if sequence.get("distortion") is not None:
-        response["distortion"] = sequence["distortion"].astype(float).tolist()
-    if sequence.get("imageSize") is not None:
-        response["imageSize"] = sequence["imageSize"].astype(float).tolist()
-    if projected is not None:
-        response["projected_joints"] = _encode_float32(projected)
-        response["projected_shape"] = [int(projected.shape[0]), int(projected.shape[1]), int(projected.shape[2])]
-        image_size = sequence.get("imageSize")
-        if image_size is not None:
-            response["projected_image_size"] = sequence["imageSize"].astype(float).tolist()
-    return JSONResponse(response)
 
 
-@app.post("/api/smpl/skeleton")
-async def upload_skeleton_sequence(file: UploadFile = File(...), intrinsics_file: Optional[UploadFile] = File(None)):
-    """Handle skeleton-only sequences (joints without mesh) from JSON or PKL files."""
-    contents = await file.read()
-    filename = file.filename.lower()
-    
+@app.get("/api/smpl/sequences")
+def sequence_store_stats():
+    """Occupancy and hit/expiry counters of the sequence handle store."""
+    return sequence_store.stats()
+
+
+@app.get("/api/smpl/sequences/{sequence_id}")
+async def get_sequence_view(
+    sequence_id: str,
+    request: Request,
+    response_format: Optional[str] = Query(None, alias="format"),
+    include_faces: bool = Query(True),
+    joints_only: bool = Query(False),
+    vertex_encoding: str = Query("float32"),
+    lod: int = Query(0, ge=0, le=max(SMPL_LOD_VERTEX_COUNTS)),
+    start: Optional[int] = Query(None, ge=0),
+    end: Optional[int] = Query(None, ge=0),
+    stride: Optional[int] = Query(None, ge=1),
+    camera: Optional[str] = Query(None),
+    project_vertices: bool = Query(False),
+):
+    """A view of an uploaded sequence, shaped like the ``/api/smpl/sequence`` response.
+
+    Accepts that endpoint's ``format``, ``include_faces``, ``joints_only``,
+    ``vertex_encoding``, ``lod``, ``start``/``end``/``stride`` and
+    ``project_vertices``; ``camera`` names a camera of the upload's
+    ``cameras_file`` to use for ``projected_joints``. Nothing is re-uploaded or
+    re-decoded.
+    """
+    binary = _wants_binary(request, response_format)
+    if vertex_encoding not in VERTEX_ENCODINGS:
+        raise HTTPException(status_code=400, detail=f"Unsupported vertex encoding: {vertex_encoding}")
+    if project_vertices and not binary:
+        raise HTTPException(status_code=400, detail="project_vertices requires the binary response format.")
+    if joints_only:
+        lod = 0
+    entry = sequence_store.get(sequence_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail=f"Unknown or expired sequence: {sequence_id}")
+
+    frame_range = (start, end, stride) if (start, end, stride) != (None, None, None) else None
     try:
-        if filename.endswith('.json'):
-            import json
-            raw_data = json.loads(contents.decode('utf-8'))
-            
-            # Extract joints from OpenCap JSON format
-            if not isinstance(raw_data, dict) or 'bodies' not in raw_data:
-                raise ValueError("JSON must contain a 'bodies' field")
-            
-            time = raw_data.get('time', [])
-            if not time:
-                raise ValueError("JSON must contain a 'time' field")
-            
-            frames = len(time)
-            bodies = raw_data['bodies']
-            
-            # Extract body positions as joints (each body segment becomes a joint)
-            body_names = sorted(bodies.keys())
-            joint_count = len(body_names)
-            
-            if joint_count == 0:
-                raise ValueError("No bodies found in JSON")
-            
-            # Build joints array: (frames, joints, 3)
-            joints = np.zeros((frames, joint_count, 3), dtype=np.float32)
-            
-            for joint_idx, body_name in enumerate(body_names):
-                body = bodies[body_name]
-                if 'translation' in body and isinstance(body['translation'], list):
-                    for frame_idx, translation in enumerate(body['translation']):
-                        if frame_idx < frames and isinstance(translation, (list, tuple)) and len(translation) >= 3:
-                            joints[frame_idx, joint_idx, :] = translation[:3]
-            
-            # Create skeleton edges from body hierarchy (simple chain for now)
-            skeleton_edges = []
-            # Simple parent-child relationships based on naming (can be improved)
-            for i in range(len(body_names) - 1):
-                skeleton_edges.append([i, i + 1])
-            
-            # Calculate FPS safely
-            fps_value = raw_data.get('fps')
-            if fps_value is not None:
-                # Ensure fps is a number, not a dict or other type
-                try:
-                    fps = float(fps_value)
-                except (TypeError, ValueError):
-                    fps = None
-            else:
+        result = await _stored_sequence_view(sequence_id, entry, joints_only, lod, frame_range, camera)
+    except WorkerPoolFull as exc:
+        raise _busy_error(exc) from exc
+    except ValueError as exc:
+        raise HTTPException(status_code=400, detail=str(exc)) from exc
+    except FileNotFoundError as exc:
+        raise HTTPException(status_code=500, detail=str(exc)) from exc
+    except Exception as exc:  # pragma: no cover - protect against unexpected runtime errors
+        raise HTTPException(status_code=500, detail=f"Failed to evaluate SMPL sequence: {exc}") from exc
+
+    projected_vertices = await _project_result_vertices(result, True) if project_vertices else None
+    return await run_in_threadpool(
+        _build_sequence_response, result, entry["name"], binary, include_faces, vertex_encoding, projected_vertices
+    )
+
+
+@app.delete("/api/smpl/sequences/{sequence_id}", status_code=204)
+def delete_sequence_handle(sequence_id: str):
+    """Drop an uploaded sequence before its TTL runs out."""
+    if not sequence_store.delete(sequence_id):
+        raise HTTPException(status_code=404, detail=f"Unknown or expired sequence: {sequence_id}")
+    return Response(status_code=204)
+
+
+def _evaluate_skeleton(
+    contents: BinaryIO,
+    name: str,
+    intrinsics_contents: Optional[BinaryIO],
+    cameras_contents: Optional[BinaryIO] = None,
+    metrics: Optional[Dict] = None,
+) -> Dict:
+    """Parse a skeleton-only JSON/PKL upload into the JSON response payload.
+
+    A ``cameras_contents`` calibration list adds the joints projected into every
+    camera. When ``metrics`` is given, the parser (``format``) and the time spent
+    parsing the upload (``decode``) and assembling the joint arrays
+    (``assemble``) are recorded in it.
+    """
+    filename = name.lower()
+    keypoint_confidence = None
+    started = time.perf_counter()
+
+    if filename.endswith('.json'):
+        raw_data, source_format = load_json(contents)
+        decoded = time.perf_counter()
+        
+        # Extract joints from OpenCap JSON format
+        if not isinstance(raw_data, dict) or 'bodies' not in raw_data:
+            raise ValueError("JSON must contain a 'bodies' field")
+        
+        time_list = raw_data.get('time', [])
+        if not time_list:
+            raise ValueError("JSON must contain a 'time' field")
+        
+        frames = len(time_list)
+        bodies = raw_data['bodies']
+        
+        # Extract body positions as joints (each body segment becomes a joint)
+        body_names = sorted(bodies.keys())
+        joint_count = len(body_names)
+        
+        if joint_count == 0:
+            raise ValueError("No bodies found in JSON")
+        
+        # Build joints array: (frames, joints, 3)
+        joints = opencap_joints(bodies, body_names, frames)
+        
+        # Create skeleton edges from body hierarchy (simple chain for now)
+        skeleton_edges = []
+        # Simple parent-child relationships based on naming (can be improved)
+        for i in range(len(body_names) - 1):
+            skeleton_edges.append([i, i + 1])
+        
+        # Calculate FPS safely
+        fps_value = raw_data.get('fps')
+        if fps_value is not None:
+            # Ensure fps is a number, not a dict or other type
+            try:
+                fps = float(fps_value)
+            except (TypeError, ValueError):
                 fps = None
-            
-            # If fps is not available, infer from time array
-            if fps is None and len(time) > 1:
-                try:
-                    # Ensure time values are numbers
-                    time_values = [float(t) for t in time[:2] if isinstance(t, (int, float, str))]
-                    if len(time_values) >= 2 and time_values[1] > time_values[0]:
-                        fps = 1.0 / (time_values[1] - time_values[0])
-                    else:
-                        fps = 60.0
-                except (TypeError, ValueError, ZeroDivisionError):
+        else:
+            fps = None
+        
+        # If fps is not available, infer from time array
+        if fps is None and len(time_list) > 1:
+            try:
+                # Ensure time values are numbers
+                first_times = [float(t) for t in time_list[:2] if isinstance(t, (int, float, str))]
+                if len(first_times) >= 2 and first_times[1] > first_times[0]:
+                    fps = 1.0 / (first_times[1] - first_times[0])
+                else:
                     fps = 60.0
-            else:
-                fps = fps if fps is not None else 60.0
+            except (TypeError, ValueError, ZeroDivisionError):
+                fps = 60.0
+        else:
+            fps = fps if fps is not None else 60.0
+        
+        # Convert time array to float32; if some values can't be converted, use generated times
+        time_array = time_values(time_list, frames)
+        if time_array is None:
+            time_array = np.arange(frames, dtype=np.float32) / float(fps)
+        
+    elif filename.endswith('.pkl') or filename.endswith('.pickle'):
+        raw_data, source_format = decode_payload(contents)
+        decoded = time.perf_counter()
+        
+        # Handle PKL as list of frames
+        if isinstance(raw_data, list):
+            frames = len(raw_data)
+            if frames == 0:
+                raise ValueError("PKL file is empty")
             
-            # Convert time array to float32, handling any non-numeric values
-            try:
-                time_array = np.array([float(t) for t in time if isinstance(t, (int, float, str))], dtype=np.float32)
-                if len(time_array) != frames:
-                    # If some time values couldn't be converted, use generated times
-                    time_array = np.arange(frames, dtype=np.float32) / float(fps)
-            except (TypeError, ValueError):
-                time_array = np.arange(frames, dtype=np.float32) / float(fps)
+            # OpenPose-style dicts (pose_keypoints_2d/3d) or plain per-frame arrays
+            joints, keypoint_confidence, _ = openpose_keypoints(raw_data)
+            joint_count = joints.shape[1]
             
-        elif filename.endswith('.pkl') or filename.endswith('.pickle'):
-            raw_data = _decode_pickle(contents)
+            # Default skeleton edges (simple chain)
+            skeleton_edges = [[i, i + 1] for i in range(joint_count - 1)]
             
-            # Handle PKL as list of frames
-            if isinstance(raw_data, list):
-                frames = len(raw_data)
-                if frames == 0:
-                    raise ValueError("PKL file is empty")
-                
-                # Check if frames contain dicts (e.g., OpenPose format with pose_keypoints_2d)
-                first_frame_with_data = None
-                frame_format = None  # 'array', 'dict_2d', 'dict_3d'
-                
-                for frame_data in raw_data:
-                    if frame_data:
-                        # Handle case where frame_data is a list containing a dict
-                        actual_frame = frame_data
-                        if isinstance(frame_data, list) and len(frame_data) > 0 and isinstance(frame_data[0], dict):
-                            actual_frame = frame_data[0]
-                        
-                        if isinstance(actual_frame, dict):
-                            # Check for OpenPose-style dict with pose_keypoints_2d
-                            if 'pose_keypoints_2d' in actual_frame:
-                                keypoints = actual_frame['pose_keypoints_2d']
-                                if isinstance(keypoints, list) and len(keypoints) > 0:
-                                    # OpenPose format: [x1, y1, conf1, x2, y2, conf2, ...]
-                                    joint_count = len(keypoints) // 3
-                                    frame_format = 'dict_2d'
-                                    first_frame_with_data = np.array(keypoints, dtype=np.float32).reshape(joint_count, 3)
-                                    break
-                            elif 'pose_keypoints_3d' in actual_frame:
-                                keypoints = actual_frame['pose_keypoints_3d']
-                                if isinstance(keypoints, list) and len(keypoints) > 0:
-                                    # 3D keypoints: [x1, y1, z1, x2, y2, z2, ...]
-                                    joint_count = len(keypoints) // 3
-                                    frame_format = 'dict_3d'
-                                    first_frame_with_data = np.array(keypoints, dtype=np.float32).reshape(joint_count, 3)
-                                    break
-                        elif isinstance(frame_data, (list, tuple)) and len(frame_data) > 0:
-                            # Try to convert to array
-                            try:
-                                frame_array = np.array(frame_data, dtype=np.float32)
-                                if frame_array.ndim == 2:
-                                    joint_count = frame_array.shape[0]
-                                    frame_format = 'array_2d'
-                                    first_frame_with_data = frame_array
-                                    break
-                                elif frame_array.ndim == 1:
-                                    joint_count = frame_array.shape[0] // 3
-                                    frame_format = 'array_1d'
-                                    first_frame_with_data = frame_array.reshape(joint_count, 3)
-                                    break
-                            except (TypeError, ValueError):
-                                # Skip frames that can't be converted
-                                continue
-                
-                if first_frame_with_data is None:
-                    raise ValueError("No valid frame data found in PKL")
+            fps = 60.0
+            time_array = np.arange(frames, dtype=np.float32) / float(fps)
+        else:
+            raise ValueError("PKL file must contain a list of frames")
+    else:
+        raise ValueError(f"Unsupported file format: {filename}")
+
+    if metrics is not None:
+        metrics["format"] = source_format
+        metrics["decode"] = decoded - started
+        metrics["assemble"] = time.perf_counter() - decoded
+    
+    # Handle intrinsics file if provided
+    cam_R = None
+    cam_T = None
+    intrinsic_mat = None
+    distortion = None
+    image_size = None
+    
+    if intrinsics_contents is not None:
+        try:
+            intrinsics_data = decode_pickle(intrinsics_contents)
+            if isinstance(intrinsics_data, dict):
+                intrinsic_value = intrinsics_data.get("intrinsicMat")
+                if intrinsic_value is None:
+                    intrinsic_value = intrinsics_data.get("intrinsic")
+                if intrinsic_value is not None:
+                    intrinsic_mat = np.array(intrinsic_value, dtype=np.float32) if isinstance(intrinsic_value, (list, tuple)) else _to_float32(intrinsic_value)
                 
-                # Build joints array
-                joints = np.zeros((frames, joint_count, 3), dtype=np.float32)
+                if "distortion" in intrinsics_data:
+                    dist_value = intrinsics_data["distortion"]
+                    distortion = np.array(dist_value, dtype=np.float32) if isinstance(dist_value, (list, tuple)) else _to_float32(dist_value)
                 
-                for frame_idx, frame_data in enumerate(raw_data):
-                    if not frame_data:
-                        continue
-                    
-                    try:
-                        # Handle case where frame_data is a list containing a dict
-                        actual_frame = frame_data
-                        if isinstance(frame_data, list) and len(frame_data) > 0 and isinstance(frame_data[0], dict):
-                            actual_frame = frame_data[0]
-                        
-                        if frame_format == 'dict_2d':
-                            # Extract 2D keypoints and pad Z with 0
-                            if isinstance(actual_frame, dict) and 'pose_keypoints_2d' in actual_frame:
-                                keypoints = actual_frame['pose_keypoints_2d']
-                                if isinstance(keypoints, list) and len(keypoints) >= joint_count * 3:
-                                    keypoint_array = np.array(keypoints[:joint_count * 3], dtype=np.float32)
-                                    # Reshape to (joint_count, 3) where 3rd is confidence
-                                    keypoints_2d = keypoint_array.reshape(joint_count, 3)
-                                    # Use x, y, and set z to 0 (or could use confidence as z)
-                                    joints[frame_idx, :, 0] = keypoints_2d[:, 0]  # x
-                                    joints[frame_idx, :, 1] = keypoints_2d[:, 1]  # y
-                                    joints[frame_idx, :, 2] = 0.0  # z (2D keypoints)
-                        elif frame_format == 'dict_3d':
-                            # Extract 3D keypoints
-                            if isinstance(actual_frame, dict) and 'pose_keypoints_3d' in actual_frame:
-                                keypoints = actual_frame['pose_keypoints_3d']
-                                if isinstance(keypoints, list) and len(keypoints) >= joint_count * 3:
-                                    keypoint_array = np.array(keypoints[:joint_count * 3], dtype=np.float32)
-                                    joints[frame_idx] = keypoint_array.reshape(joint_count, 3)
-                        elif frame_format in ('array_2d', 'array_1d'):
-                            # Original array format handling
-                            if isinstance(frame_data, (list, tuple)) and len(frame_data) > 0:
-                                frame_array = np.array(frame_data, dtype=np.float32)
-                                if frame_array.ndim == 2:
-                                    joints[frame_idx] = frame_array[:joint_count, :3]
-                                elif frame_array.ndim == 1:
-                                    joints[frame_idx] = frame_array[:joint_count * 3].reshape(joint_count, 3)
-                    except (TypeError, ValueError) as e:
-                        # Skip frames that can't be processed
-                        continue
+                if "imageSize" in intrinsics_data:
+                    size_value = intrinsics_data["imageSize"]
+                    image_size = np.array(size_value, dtype=np.float32) if isinstance(size_value, (list, tuple)) else _to_float32(size_value)
                 
-                # Default skeleton edges (simple chain)
-                skeleton_edges = [[i, i + 1] for i in range(joint_count - 1)]
+                if "rotation" in intrinsics_data:
+                    rotation_value = intrinsics_data["rotation"]
+                    rotation_array = np.array(rotation_value, dtype=np.float32) if isinstance(rotation_value, (list, tuple)) else _to_float32(rotation_value)
+                    if rotation_array.shape == (3, 3):
+                        cam_R = rotation_array
                 
-                fps = 60.0
-                time_array = np.arange(frames, dtype=np.float32) / float(fps)
-            else:
-                raise ValueError("PKL file must contain a list of frames")
-        else:
-            raise ValueError(f"Unsupported file format: {filename}")
-        
-        # Handle intrinsics file if provided
-        cam_R = None
-        cam_T = None
-        intrinsic_mat = None
-        distortion = None
-        image_size = None
-        
-        if intrinsics_file is not None:
-            intrinsics_contents = await intrinsics_file.read()
-            try:
-                intrinsics_data = _decode_pickle(intrinsics_contents)
-                if isinstance(intrinsics_data, dict):
-                    intrinsic_value = intrinsics_data.get("intrinsicMat") or intrinsics_data.get("intrinsic")
-                    if intrinsic_value is not None:
-                        intrinsic_mat = np.array(intrinsic_value, dtype=np.float32) if isinstance(intrinsic_value, (list, tuple)) else _to_float32(intrinsic_value)
-                    
-                    if "distortion" in intrinsics_data:
-                        dist_value = intrinsics_data["distortion"]
-                        distortion = np.array(dist_value, dtype=np.float32) if isinstance(dist_value, (list, tuple)) else _to_float32(dist_value)
-                    
-                    if "imageSize" in intrinsics_data:
-                        size_value = intrinsics_data["imageSize"]
-                        image_size = np.array(size_value, dtype=np.float32) if isinstance(size_value, (list, tuple)) else _to_float32(size_value)
-                    
-                    if "rotation" in intrinsics_data:
-                        rotation_value = intrinsics_data["rotation"]
-                        rotation_array = np.array(rotation_value, dtype=np.float32) if isinstance(rotation_value, (list, tuple)) else _to_float32(rotation_value)
-                        if rotation_array.shape == (3, 3):
-                            cam_R = rotation_array
-                    
-                    if "translation" in intrinsics_data:
-                        translation_value = intrinsics_data["translation"]
-                        translation_array = np.array(translation_value, dtype=np.float32) if isinstance(translation_value, (list, tuple)) else _to_float32(translation_value)
-                        if translation_array.ndim == 1 and translation_array.shape[0] == 3:
-                            cam_T = translation_array
-            except Exception as e:
-                print(f"Warning: Failed to load intrinsics file: {e}")
-        
-        # Compute projected points if we have camera data
-        projected = None
-        if cam_R is not None and cam_T is not None and intrinsic_mat is not None:
-            try:
-                sequence_dict = {
-                    "cam_R": cam_R,
-                    "cam_T": cam_T,
-                    "intrinsicMat": intrinsic_mat,
-                    "distortion": distortion if distortion is not None else np.zeros(5, dtype=np.float32),
-                    "imageSize": image_size
-                }
-                projected = _compute_projected_points(sequence_dict, joints)
-            except Exception:
-                projected = None
-        
-        # Flatten joints for response
-        joints_flat = joints.reshape(-1, 3).astype(np.float32)
-        
-        response = {
-            "name": file.filename,
-            "fps": float(fps),
-            "frame_count": int(frames),
-            "joint_count": int(joint_count),
-            "vertex_count": 0,  # Skeleton-only, no vertices
-            "gender": "neutral",
-            "time": time_array.astype(float).tolist(),
-            "faces": [],  # No mesh faces
-            "vertices": "",  # Empty - skeleton only
-            "joints": _encode_float32(joints_flat),
-            "skeleton_edges": skeleton_edges,
-        }
-        
-        if cam_R is not None:
-            response["cam_R"] = cam_R.astype(float).tolist()
-        if cam_T is not None:
-            response["cam_T"] = cam_T.astype(float).tolist()
-        if intrinsic_mat is not None:
-            response["intrinsicMat"] = intrinsic_mat.astype(float).tolist()
-        if distortion is not None:
-            response["distortion"] = distortion.astype(float).tolist()
+                if "translation" in intrinsics_data:
+                    translation_value = intrinsics_data["translation"]
+                    translation_array = np.array(translation_value, dtype=np.float32) if isinstance(translation_value, (list, tuple)) else _to_float32(translation_value)
+                    if translation_array.ndim == 1 and translation_array.shape[0] == 3:
+                        cam_T = translation_array
+        except Exception as e:
+            print(f"Warning: Failed to load intrinsics file: {e}")
+    
+    # Compute projected points if we have camera data
+    projected = None
+    if cam_R is not None and cam_T is not None and intrinsic_mat is not None:
+        try:
+            sequence_dict = {
+                "cam_R": cam_R,
+                "cam_T": cam_T,
+                "intrinsicMat": intrinsic_mat,
+                "distortion": distortion if distortion is not None else np.zeros(5, dtype=np.float32),
+                "imageSize": image_size
+            }
+            projected = _compute_projected_points(sequence_dict, joints)
+        except Exception:
+            projected = None
+
+    cameras = _load_cameras(cameras_contents) if cameras_contents is not None else None
+    projected_cameras = _compute_camera_projections({"cameras": cameras}, joints)
+    
+    # Flatten joints for response
+    joints_flat = joints.reshape(-1, 3).astype(np.float32)
+    
+    response = {
+        "name": name,
+        "fps": float(fps),
+        "frame_count": int(frames),
+        "joint_count": int(joint_count),
+        "vertex_count": 0,  # Skeleton-only, no vertices
+        "gender": "neutral",
+        "time": time_array.astype(float).tolist(),
+        "faces": [],  # No mesh faces
+        "vertices": "",  # Empty - skeleton only
+        "joints": _encode_float32(joints_flat),
+        "skeleton_edges": skeleton_edges,
+    }
+    if keypoint_confidence is not None:
+        # Per-frame keypoint confidence, (frames, joints), kept apart from the xyz joints.
+        response["keypoint_confidence"] = _encode_float32(keypoint_confidence)
+    
+    if cam_R is not None:
+        response["cam_R"] = cam_R.astype(float).tolist()
+    if cam_T is not None:
+        response["cam_T"] = cam_T.astype(float).tolist()
+    if intrinsic_mat is not None:
+        response["intrinsicMat"] = intrinsic_mat.astype(float).tolist()
+    if distortion is not None:
+        response["distortion"] = distortion.astype(float).tolist()
+    if image_size is not None:
+        response["imageSize"] = image_size.astype(float).tolist()
+    if projected is not None:
+        response["projected_joints"] = _encode_float32(projected)
+        response["projected_shape"] = [int(projected.shape[0]), int(projected.shape[1]), int(projected.shape[2])]
         if image_size is not None:
-            response["imageSize"] = image_size.astype(float).tolist()
-        if projected is not None:
-            response["projected_joints"] = _encode_float32(projected)
-            response["projected_shape"] = [int(projected.shape[0]), int(projected.shape[1]), int(projected.shape[2])]
-            if image_size is not None:
-                response["projected_image_size"] = image_size.astype(float).tolist()
-        
-        return JSONResponse(response)
-        
+            response["projected_image_size"] = image_size.astype(float).tolist()
+    if projected_cameras is not None:
+        response["cameras"] = [_camera_description(camera) for camera in cameras]
+        response["projected_cameras"] = _encode_float32(projected_cameras)
+        response["projected_cameras_shape"] = [int(dim) for dim in projected_cameras.shape]
+    
+    return response
+
+
+@app.post("/api/smpl/skeleton")
+async def upload_skeleton_sequence(
+    file: UploadFile = File(...),
+    intrinsics_file: Optional[UploadFile] = File(None),
+    cameras_file: Optional[UploadFile] = File(None),
+):
+    """Handle skeleton-only sequences (joints without mesh) from JSON or PKL files.
+
+    A ``cameras_file`` with a list of camera calibrations adds
+    ``projected_cameras`` (cameras, frames, joints, 2)."""
+    contents = _required_upload(file)
+    intrinsics_contents = upload_file(intrinsics_file)
+    cameras_contents = upload_file(cameras_file)
+
+    metrics: Dict = {}
+    try:
+        response = await worker_pool.run(
+            _evaluate_skeleton, contents, file.filename, intrinsics_contents, cameras_contents, metrics
+        )
+    except WorkerPoolFull as exc:
+        raise _busy_error(exc) from exc
     except ValueError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
     except Exception as exc:
         raise HTTPException(status_code=500, detail=f"Failed to process skeleton sequence: {exc}") from exc
 
+    return await run_in_threadpool(
+        JSONResponse, response, headers={"Server-Timing": _server_timing(metrics)}
+    )
+
 
 @app.post("/api/smpl/extract-intrinsics")
-async def extract_intrinsics(intrinsics_file: UploadFile = File(...)):
+def extract_intrinsics(intrinsics_file: UploadFile = File(...)):
     """Extract camera intrinsics and extrinsics from a pickle file."""
-    contents = await intrinsics_file.read()
+    contents = _required_upload(intrinsics_file)
     
     try:
-        raw_data = _decode_pickle(contents)
+        raw_data = decode_pickle(contents)
         
         if not isinstance(raw_data, dict):
             raise ValueError("Intrinsics file must contain a dictionary")
@@ -1057,11 +2660,30 @@ async def extract_intrinsics(intrinsics_file: UploadFile = File(...)):
         raise HTTPException(status_code=400, detail=f"Failed to extract intrinsics: {str(e)}")
 
 
+@app.get("/api/smpl/batching")
+def batching_stats():
+    """Batch-fill metrics of the cross-request micro-batcher."""
+    return micro_batcher.stats()
+
+
+@app.get("/api/smpl/workers")
+def worker_stats():
+    """Occupancy and rejection counters of the SMPL worker pool, plus the applied evaluation tuning."""
+    return {**worker_pool.stats(), "smpl_batch_size": processor.batch_size, "torch_threads": torch.get_num_threads()}
+
+
 @app.get("/api/healthz")
 def health_check():
     return {"status": "ok"}
 
 
+@app.get("/api/readyz")
+def readiness_check():
+    """Ready once the preloaded SMPL layers are loaded and warmed up; 503 before that or if preloading failed."""
+    body = {"status": "ready" if readiness["ready"] else "not ready", **readiness}
+    return JSONResponse(body, status_code=200 if readiness["ready"] else 503)
+
+
 if __name__ == "__main__":  # pragma: no cover
     import uvicorn
 
@@ -0,0 +1,140 @@
+"""Vertex-subset level-of-detail meshes for SMPL topologies.
+
+Simplification uses quadric-error half-edge collapses: a vertex is only ever
+merged into one of its neighbours, so every LOD vertex *is* a vertex of the
+full mesh. A sequence evaluated at full resolution therefore maps onto a LOD
+by indexing its vertex axis with the returned ``vertex_ids``. That also lets
+the SMPL evaluation skin only those vertices.
+"""
+
+import heapq
+from typing import Dict, List, Sequence, Set, Tuple
+
+import numpy as np
+
+
+def _face_quadrics(vertices: np.ndarray, faces: np.ndarray) -> np.ndarray:
+    """Area-weighted plane quadrics, one 4x4 matrix per face."""
+    v0, v1, v2 = (vertices[faces[:, i]] for i in range(3))
+    normals = np.cross(v1 - v0, v2 - v0)
+    double_area = np.linalg.norm(normals, axis=1)
+    safe = np.where(double_area > 0, double_area, 1.0)
+    unit = normals / safe[:, None]
+    planes = np.concatenate([unit, -np.einsum("ij,ij->i", unit, v0)[:, None]], axis=1)
+    return planes[:, :, None] * planes[:, None, :] * (double_area / 2.0)[:, None, None]
+
+
+def simplify_vertex_subset(
+    vertices: np.ndarray,
+    faces: np.ndarray,
+    target_vertex_counts: Sequence[int],
+) -> Dict[int, Tuple[np.ndarray, np.ndarray]]:
+    """Simplify a closed triangle mesh to each requested vertex count.
+
+    Returns ``{target: (vertex_ids, faces)}`` where ``vertex_ids`` indexes the
+    original vertices and ``faces`` indexes into ``vertex_ids``. Collapses that
+    would flip a face or break the edge link condition are skipped, so a target
+    may end up with slightly more vertices than requested.
+    """
+    vertices = np.asarray(vertices, dtype=np.float64)
+    faces = np.array(faces, dtype=np.int64)
+    vertex_total = vertices.shape[0]
+
+    quadrics = np.zeros((vertex_total, 4, 4), dtype=np.float64)
+    face_quadrics = _face_quadrics(vertices, faces)
+    for corner in range(3):
+        np.add.at(quadrics, faces[:, corner], face_quadrics)
+
+    homogeneous = np.concatenate([vertices, np.ones((vertex_total, 1))], axis=1)
+    vertex_faces: List[Set[int]] = [set() for _ in range(vertex_total)]
+    for face_index, triangle in enumerate(faces):
+        for vertex in triangle:
+            vertex_faces[vertex].add(face_index)
+    face_alive = np.ones(faces.shape[0], dtype=bool)
+    alive = np.ones(vertex_total, dtype=bool)
+    version = np.zeros(vertex_total, dtype=np.int64)
+    heap: List[Tuple[float, int, int, int, int]] = []
+
+    def neighbours(vertex: int) -> Set[int]:
+        result = set(faces[list(vertex_faces[vertex])].ravel().tolist())
+        result.discard(vertex)
+        return result
+
+    def push_edges(vertex: int) -> None:
+        others = np.fromiter(neighbours(vertex), dtype=np.int64)
+        if others.size == 0:
+            return
+        combined = quadrics[others] + quadrics[vertex]
+        # Cost of moving each neighbour onto ``vertex`` and of moving ``vertex`` onto each neighbour.
+        into_vertex = np.einsum("j,kjl,l->k", homogeneous[vertex], combined, homogeneous[vertex])
+        onto_other = np.einsum("kj,kjl,kl->k", homogeneous[others], combined, homogeneous[others])
+        for other, cost_in, cost_out in zip(others.tolist(), into_vertex.tolist(), onto_other.tolist()):
+            heapq.heappush(heap, (cost_in, other, vertex, version[other], version[vertex]))
+            heapq.heappush(heap, (cost_out, vertex, other, version[vertex], version[other]))
+
+    def can_collapse(source: int, target: int) -> bool:
+        shared = [face for face in vertex_faces[source] if target in faces[face]]
+        if not shared:
+            return False
+        # Link condition: the only common neighbours are the apexes of the shared faces.
+        if len(neighbours(source) & neighbours(target)) != len(shared):
+            return False
+        for face in vertex_faces[source]:
+            if face in shared:
+                continue
+            triangle = faces[face]
+            before = homogeneous[triangle, :3]
+            after = before.copy()
+            after[triangle == source] = homogeneous[target, :3]
+            normal_before = np.cross(before[1] - before[0], before[2] - before[0])
+            normal_after = np.cross(after[1] - after[0], after[2] - after[0])
+            if np.dot(normal_before, normal_after) <= 0:
+                return False
+        return True
+
+    for vertex in range(vertex_total):
+        push_edges(vertex)
+
+    results: Dict[int, Tuple[np.ndarray, np.ndarray]] = {}
+    remaining = sorted(set(int(count) for count in target_vertex_counts), reverse=True)
+    alive_count = vertex_total
+
+    def snapshot() -> Tuple[np.ndarray, np.ndarray]:
+        vertex_ids = np.flatnonzero(alive)
+        remap = np.full(vertex_total, -1, dtype=np.int64)
+        remap[vertex_ids] = np.arange(vertex_ids.size)
+        return vertex_ids.astype(np.int32), remap[faces[face_alive]].astype(np.int32)
+
+    while remaining and heap:
+        while remaining and alive_count <= remaining[0]:
+            results[remaining.pop(0)] = snapshot()
+        if not remaining:
+            break
+
+        _, source, target, source_version, target_version = heapq.heappop(heap)
+        if not (alive[source] and alive[target]):
+            continue
+        if version[source] != source_version or version[target] != target_version:
+            continue
+        if not can_collapse(source, target):
+            continue
+
+        for face in list(vertex_faces[source]):
+            triangle = faces[face]
+            if target in triangle:
+                face_alive[face] = False
+                for vertex in triangle:
+                    vertex_faces[vertex].discard(face)
+            else:
+                triangle[triangle == source] = target
+                vertex_faces[target].add(face)
+        vertex_faces[source].clear()
+        quadrics[target] += quadrics[source]
+        alive[source] = False
+        alive_count -= 1
+        version[target] += 1
+        push_edges(target)
+
+    for count in remaining:
+        results[count] = snapshot()
+    return results
@@ -0,0 +1,162 @@
+"""Pinhole projection with OpenCV-style distortion for one or more calibrated cameras.
+
+A camera is a dict with ``cam_R`` (frames, 3, 3), ``cam_T`` (frames, 3),
+``intrinsicMat`` (3, 3) and ``distortion`` (5,) as ``k1, k2, p1, p2, k3``.
+All cameras are projected together: the extrinsics, focal lengths, principal
+points and distortion coefficients are stacked along a leading camera axis,
+so every view is computed in the same vectorised pass. Points behind a camera
+(``z <= 1e-4``) project to NaN.
+
+:func:`project_points_chunked` projects large point sets (full meshes) through
+one camera a few frames at a time, writing into a preallocated output with
+in-place arithmetic on reused scratch buffers, so its temporary memory does not
+grow with the sequence length.
+"""
+
+from typing import Dict, Optional, Sequence
+
+import numpy as np
+
+
+_MIN_DEPTH = 1e-4
+_CHUNK_FRAMES = 32
+
+
+def distortion_coefficients(distortion: Optional[np.ndarray]) -> np.ndarray:
+    """The first five distortion coefficients as float32, zero-padded (no distortion when None)."""
+    coefficients = np.zeros(5, dtype=np.float32)
+    if distortion is not None:
+        values = np.asarray(distortion, dtype=np.float32).flatten()
+        count = min(5, values.size)
+        coefficients[:count] = values[:count]
+    return coefficients
+
+
+def project_points(points: np.ndarray, cameras: Sequence[Dict[str, np.ndarray]]) -> np.ndarray:
+    """Project (frames, points, 3) world points into every camera: (cameras, frames, points, 2) float32."""
+    points = points.astype(np.float32, copy=False)
+    rotations = np.stack([camera["cam_R"] for camera in cameras]).astype(np.float32, copy=False)
+    translations = np.stack([camera["cam_T"] for camera in cameras]).astype(np.float32, copy=False)
+    intrinsics = np.stack([camera["intrinsicMat"] for camera in cameras]).astype(np.float32, copy=False)
+    coefficients = np.stack([distortion_coefficients(camera.get("distortion")) for camera in cameras])
+
+    # Per-camera scalars broadcast against (cameras, frames, points).
+    k1, k2, p1, p2, k3 = (coefficients[:, index, None, None] for index in range(5))
+    fx = intrinsics[:, 0, 0, None, None]
+    fy = intrinsics[:, 1, 1, None, None]
+    cx = intrinsics[:, 0, 2, None, None]
+    cy = intrinsics[:, 1, 2, None, None]
+
+    points_cam = np.einsum("cfij,fnj->cfni", rotations, points) + translations[:, :, None, :]
+    x = points_cam[..., 0]
+    y = points_cam[..., 1]
+    z = points_cam[..., 2]
+
+    valid = z > _MIN_DEPTH
+    xn = np.zeros_like(x)
+    yn = np.zeros_like(y)
+    xn[valid] = x[valid] / z[valid]
+    yn[valid] = y[valid] / z[valid]
+
+    r2 = xn * xn + yn * yn
+    radial = 1.0 + k1 * r2 + k2 * r2 * r2 + k3 * r2 * r2 * r2
+    x_distorted = xn * radial + 2 * p1 * xn * yn + p2 * (r2 + 2 * xn * xn)
+    y_distorted = yn * radial + p1 * (r2 + 2 * yn * yn) + 2 * p2 * xn * yn
+
+    u = fx * x_distorted + cx
+    v = fy * y_distorted + cy
+    u[~valid] = np.nan
+    v[~valid] = np.nan
+    return np.stack([u, v], axis=-1).astype(np.float32, copy=False)
+
+
+def project_points_chunked(
+    points: np.ndarray,
+    camera: Dict[str, np.ndarray],
+    out: Optional[np.ndarray] = None,
+    chunk_frames: int = _CHUNK_FRAMES,
+) -> np.ndarray:
+    """Project (frames, points, 3) world points into one camera: (frames, points, 2) float32.
+
+    Frames are processed ``chunk_frames`` at a time. Scratch buffers are sized
+    for one chunk and reused, and every step (including the distortion
+    polynomial, evaluated in Horner form) writes into them in place, so peak
+    temporary memory is about ten floats per point per chunk frame.
+    """
+    frames, count, _ = points.shape
+    if out is None:
+        out = np.empty((frames, count, 2), dtype=np.float32)
+    rotations_t = np.asarray(camera["cam_R"], dtype=np.float32).transpose(0, 2, 1)
+    translations = np.asarray(camera["cam_T"], dtype=np.float32)
+    intrinsic = np.asarray(camera["intrinsicMat"], dtype=np.float32)
+    k1, k2, p1, p2, k3 = distortion_coefficients(camera.get("distortion")).tolist()
+    fx, fy, cx, cy = (float(value) for value in (intrinsic[0, 0], intrinsic[1, 1], intrinsic[0, 2], intrinsic[1, 2]))
+
+    size = max(1, min(chunk_frames, frames))
+    points_cam_buffer = np.empty((size, count, 3), dtype=np.float32)
+    xn_buffer, yn_buffer, r2_buffer, radial_buffer, xy_buffer, scratch_buffer = (
+        np.empty((size, count), dtype=np.float32) for _ in range(6)
+    )
+    valid_buffer = np.empty((size, count), dtype=bool)
+    invalid_buffer = np.empty((size, count), dtype=bool)
+
+    for start in range(0, frames, size):
+        end = min(start + size, frames)
+        n = end - start
+        points_cam = points_cam_buffer[:n]
+        xn, yn, r2, radial, xy, scratch = (
+            buffer[:n] for buffer in (xn_buffer, yn_buffer, r2_buffer, radial_buffer, xy_buffer, scratch_buffer)
+        )
+        valid, invalid = valid_buffer[:n], invalid_buffer[:n]
+
+        np.matmul(points[start:end], rotations_t[start:end], out=points_cam)
+        points_cam += translations[start:end, None, :]
+        x, y, z = points_cam[..., 0], points_cam[..., 1], points_cam[..., 2]
+
+        np.greater(z, _MIN_DEPTH, out=valid)
+        np.logical_not(valid, out=invalid)
+        xn.fill(0.0)
+        yn.fill(0.0)
+        np.divide(x, z, out=xn, where=valid)
+        np.divide(y, z, out=yn, where=valid)
+
+        np.multiply(xn, xn, out=r2)
+        np.multiply(yn, yn, out=scratch)
+        r2 += scratch
+        np.multiply(xn, yn, out=xy)
+        # radial = 1 + k1 r2 + k2 r2^2 + k3 r2^3
+        np.multiply(r2, k3, out=radial)
+        radial += k2
+        radial *= r2
+        radial += k1
+        radial *= r2
+        radial += 1.0
+
+        u = out[start:end, :, 0]
+        v = out[start:end, :, 1]
+        # x' = xn radial + 2 p1 xn yn + p2 (r2 + 2 xn^2)
+        np.multiply(xn, xn, out=scratch)
+        scratch *= 2.0
+        scratch += r2
+        scratch *= p2
+        np.multiply(xn, radial, out=u)
+        u += scratch
+        np.multiply(xy, 2.0 * p1, out=scratch)
+        u += scratch
+        # y' = yn radial + p1 (r2 + 2 yn^2) + 2 p2 xn yn
+        np.multiply(yn, yn, out=scratch)
+        scratch *= 2.0
+        scratch += r2
+        scratch *= p1
+        np.multiply(yn, radial, out=v)
+        v += scratch
+        np.multiply(xy, 2.0 * p2, out=scratch)
+        v += scratch
+
+        u *= fx
+        u += cx
+        v *= fy
+        v += cy
+        np.copyto(u, np.nan, where=invalid)
+        np.copyto(v, np.nan, where=invalid)
+    return out
@@ -0,0 +1,140 @@
+"""Temporal resampling of SMPL sequences to a target frame rate.
+
+Rotations (axis-angle poses, camera rotation matrices) are converted to unit
+quaternions and interpolated with spherical linear interpolation; positions,
+shape coefficients and camera translations are interpolated linearly. Every
+function is vectorised over frames and joints, and works in float64 internally.
+Quaternions are stored as ``(w, x, y, z)``.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+
+_SMALL_ANGLE = 1e-6
+_FRAME_TOLERANCE = 1e-3
+
+
+def resample_times(source_time: np.ndarray, fps: float) -> np.ndarray:
+    """Timestamps at ``fps`` covering ``source_time[0]`` to ``source_time[-1]``.
+
+    The last frame is kept when the duration falls short of a whole number of
+    target frames by less than ``_FRAME_TOLERANCE`` (float32 timestamps).
+    """
+    start = float(source_time[0])
+    duration = float(source_time[-1]) - start
+    count = int(np.floor(duration * fps + _FRAME_TOLERANCE)) + 1
+    return start + np.arange(count, dtype=np.float64) / fps
+
+
+def interpolation_weights(source_time: np.ndarray, target_time: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """For each target time, the index of the source frame before it and the weight of the frame after it.
+
+    ``source_time`` must be strictly increasing and hold at least two frames.
+    Targets outside the source range are clamped to its ends.
+    """
+    source_time = np.asarray(source_time, dtype=np.float64)
+    lower = np.clip(np.searchsorted(source_time, target_time, side="right") - 1, 0, source_time.shape[0] - 2)
+    span = source_time[lower + 1] - source_time[lower]
+    weight = np.clip((target_time - source_time[lower]) / span, 0.0, 1.0)
+    return lower, weight
+
+
+def lerp(values: np.ndarray, lower: np.ndarray, weight: np.ndarray) -> np.ndarray:
+    """Linear interpolation of per-frame ``values`` (frames, ...) at the given positions."""
+    values = np.asarray(values, dtype=np.float64)
+    weight = weight.reshape((-1,) + (1,) * (values.ndim - 1))
+    return values[lower] * (1.0 - weight) + values[lower + 1] * weight
+
+
+def axis_angle_to_quaternion(axis_angle: np.ndarray) -> np.ndarray:
+    axis_angle = np.asarray(axis_angle, dtype=np.float64)
+    angle = np.linalg.norm(axis_angle, axis=-1, keepdims=True)
+    half = 0.5 * angle
+    # sin(angle / 2) / angle, with its Taylor expansion near zero.
+    small = angle < _SMALL_ANGLE
+    scale = np.where(small, 0.5 - angle * angle / 48.0, np.sin(half) / np.where(small, 1.0, angle))
+    return np.concatenate([np.cos(half), axis_angle * scale], axis=-1)
+
+
+def quaternion_to_axis_angle(quaternion: np.ndarray) -> np.ndarray:
+    quaternion = quaternion / np.linalg.norm(quaternion, axis=-1, keepdims=True)
+    # The w >= 0 representative gives angles in [0, pi].
+    quaternion = np.where(quaternion[..., :1] < 0, -quaternion, quaternion)
+    w = quaternion[..., :1]
+    xyz = quaternion[..., 1:]
+    sin_half = np.linalg.norm(xyz, axis=-1, keepdims=True)
+    angle = 2.0 * np.arctan2(sin_half, w)
+    small = sin_half < _SMALL_ANGLE
+    scale = np.where(small, 2.0 / np.maximum(w, _SMALL_ANGLE), angle / np.where(small, 1.0, sin_half))
+    return xyz * scale
+
+
+def matrix_to_quaternion(matrix: np.ndarray) -> np.ndarray:
+    """Unit quaternions of (..., 3, 3) rotation matrices.
+
+    Each of the four standard formulas is evaluated and, per matrix, the one
+    with the largest (most stable) leading term is kept.
+    """
+    m = np.asarray(matrix, dtype=np.float64)
+    m00, m01, m02 = m[..., 0, 0], m[..., 0, 1], m[..., 0, 2]
+    m10, m11, m12 = m[..., 1, 0], m[..., 1, 1], m[..., 1, 2]
+    m20, m21, m22 = m[..., 2, 0], m[..., 2, 1], m[..., 2, 2]
+    candidates = np.stack(
+        [
+            np.stack([1.0 + m00 + m11 + m22, m21 - m12, m02 - m20, m10 - m01], axis=-1),
+            np.stack([m21 - m12, 1.0 + m00 - m11 - m22, m01 + m10, m02 + m20], axis=-1),
+            np.stack([m02 - m20, m01 + m10, 1.0 - m00 + m11 - m22, m12 + m21], axis=-1),
+            np.stack([m10 - m01, m02 + m20, m12 + m21, 1.0 - m00 - m11 + m22], axis=-1),
+        ],
+        axis=-2,
+    )
+    best = np.argmax(np.diagonal(candidates, axis1=-2, axis2=-1), axis=-1)
+    quaternion = np.take_along_axis(candidates, best[..., None, None], axis=-2)[..., 0, :]
+    return quaternion / np.linalg.norm(quaternion, axis=-1, keepdims=True)
+
+
+def quaternion_to_matrix(quaternion: np.ndarray) -> np.ndarray:
+    quaternion = quaternion / np.linalg.norm(quaternion, axis=-1, keepdims=True)
+    w, x, y, z = (quaternion[..., index] for index in range(4))
+    return np.stack(
+        [
+            np.stack([1 - 2 * (y * y + z * z), 2 * (x * y - w * z), 2 * (x * z + w * y)], axis=-1),
+            np.stack([2 * (x * y + w * z), 1 - 2 * (x * x + z * z), 2 * (y * z - w * x)], axis=-1),
+            np.stack([2 * (x * z - w * y), 2 * (y * z + w * x), 1 - 2 * (x * x + y * y)], axis=-1),
+        ],
+        axis=-2,
+    )
+
+
+def slerp(quaternions: np.ndarray, lower: np.ndarray, weight: np.ndarray) -> np.ndarray:
+    """Spherical linear interpolation of per-frame unit quaternions (frames, ..., 4), along the shorter arc."""
+    start = quaternions[lower]
+    end = quaternions[lower + 1]
+    weight = weight.reshape((-1,) + (1,) * (quaternions.ndim - 1))
+    dot = np.sum(start * end, axis=-1, keepdims=True)
+    end = np.where(dot < 0, -end, end)
+    dot = np.clip(np.abs(dot), 0.0, 1.0)
+    theta = np.arccos(dot)
+    sin_theta = np.sin(theta)
+    # Nearly identical rotations fall back to normalised linear interpolation.
+    small = sin_theta < _SMALL_ANGLE
+    safe_sin = np.where(small, 1.0, sin_theta)
+    start_scale = np.where(small, 1.0 - weight, np.sin((1.0 - weight) * theta) / safe_sin)
+    end_scale = np.where(small, weight, np.sin(weight * theta) / safe_sin)
+    result = start * start_scale + end * end_scale
+    return result / np.linalg.norm(result, axis=-1, keepdims=True)
+
+
+def resample_axis_angle(axis_angle: np.ndarray, lower: np.ndarray, weight: np.ndarray) -> np.ndarray:
+    """Slerp (frames, joints * 3) or (frames, joints, 3) axis-angle rotations; returns the input layout."""
+    shape = axis_angle.shape
+    quaternions = axis_angle_to_quaternion(np.asarray(axis_angle).reshape(shape[0], -1, 3))
+    resampled = quaternion_to_axis_angle(slerp(quaternions, lower, weight))
+    return resampled.reshape((lower.shape[0],) + shape[1:])
+
+
+def resample_rotation_matrices(matrices: np.ndarray, lower: np.ndarray, weight: np.ndarray) -> np.ndarray:
+    """Slerp per-frame (frames, ..., 3, 3) rotation matrices."""
+    return quaternion_to_matrix(slerp(matrix_to_quaternion(matrices), lower, weight))
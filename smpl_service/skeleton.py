@@ -0,0 +1,200 @@
+"""Bulk parsing of skeleton-only uploads (OpenCap JSON, OpenPose-style PKL) for ``/api/smpl/skeleton``.
+
+Per-body translation lists and per-frame keypoint lists are gathered and
+converted to arrays in one call instead of being copied frame by frame; only
+malformed (ragged) input falls back to a row loop. ``orjson`` is used for JSON
+parsing when it is installed.
+"""
+
+import json
+from typing import Any, BinaryIO, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def load_json(handle: BinaryIO) -> Tuple[Any, str]:
+    """Parse a JSON upload and return ``(data, parser)``.
+
+    orjson rejects the ``NaN``/``Infinity`` literals the standard library
+    accepts, so such documents are re-parsed with ``json``.
+    """
+    if orjson is not None:
+        payload = handle.read()
+        try:
+            return orjson.loads(payload), "orjson"
+        except orjson.JSONDecodeError:
+            return json.loads(payload), "json"
+    return json.load(handle), "json"
+
+
+def _translation_rows(translation: List, frames: int) -> np.ndarray:
+    """Row-by-row fallback for ragged lists: rows that are not 3+ element sequences stay zero."""
+    rows = np.zeros((min(len(translation), frames), 3), dtype=np.float32)
+    for frame_idx, value in enumerate(translation[:frames]):
+        if isinstance(value, (list, tuple)) and len(value) >= 3:
+            rows[frame_idx] = value[:3]
+    return rows
+
+
+def opencap_joints(bodies: Dict[str, Dict], body_names: List[str], frames: int) -> np.ndarray:
+    """(frames, bodies, 3) float32 positions from each body's ``translation`` list.
+
+    Frames beyond a body's list, and bodies without a translation list, are zero.
+    """
+    joints = np.zeros((frames, len(body_names), 3), dtype=np.float32)
+    for joint_idx, body_name in enumerate(body_names):
+        body = bodies[body_name]
+        translation = body.get("translation") if isinstance(body, dict) else None
+        if not isinstance(translation, list) or not translation:
+            continue
+        try:
+            rows = np.asarray(translation[:frames], dtype=np.float32)
+        except (TypeError, ValueError):
+            rows = None
+        if rows is None or rows.ndim != 2 or rows.shape[1] < 3:
+            rows = _translation_rows(translation, frames)
+        joints[:rows.shape[0], joint_idx] = rows[:, :3]
+    return joints
+
+
+def time_values(time: List, frames: int) -> Optional[np.ndarray]:
+    """The ``time`` list as float32, or None when it holds entries that are not numbers."""
+    try:
+        values = np.asarray(time, dtype=np.float32)
+    except (TypeError, ValueError):
+        return None
+    if values.ndim != 1 or values.shape[0] != frames:
+        return None
+    return values
+
+
+def _frame_record(frame_data: Any) -> Any:
+    # Some exports wrap each frame's dict in a one-person list.
+    if isinstance(frame_data, list) and frame_data and isinstance(frame_data[0], dict):
+        return frame_data[0]
+    return frame_data
+
+
+def _classify_frames(frames: Sequence) -> Optional[Tuple[str, int]]:
+    """``(layout, joint_count)`` from the first frame with data, or None.
+
+    Layouts: ``dict_2d`` (``pose_keypoints_2d`` as x, y, confidence triples),
+    ``dict_3d`` (``pose_keypoints_3d`` as x, y, z triples), ``array_2d``
+    (joints x channels) and ``array_1d`` (flat x, y, z).
+    """
+    for frame_data in frames:
+        if not frame_data:
+            continue
+        record = _frame_record(frame_data)
+        if isinstance(record, dict):
+            for layout, key in (("dict_2d", "pose_keypoints_2d"), ("dict_3d", "pose_keypoints_3d")):
+                if key in record:
+                    keypoints = record[key]
+                    if isinstance(keypoints, list) and len(keypoints) > 0:
+                        return layout, len(keypoints) // 3
+                    break
+        elif isinstance(frame_data, (list, tuple)):
+            try:
+                frame_array = np.array(frame_data, dtype=np.float32)
+            except (TypeError, ValueError):
+                continue
+            if frame_array.ndim == 2:
+                return "array_2d", frame_array.shape[0]
+            if frame_array.ndim == 1:
+                return "array_1d", frame_array.shape[0] // 3
+    return None
+
+
+def _gather_rows(frames: Sequence, layout: str, joint_count: int) -> Tuple[List[int], List[Any]]:
+    """Indices and raw rows of the frames that carry data in ``layout``, in one pass."""
+    indices, rows = [], []
+    if layout in ("dict_2d", "dict_3d"):
+        key = "pose_keypoints_2d" if layout == "dict_2d" else "pose_keypoints_3d"
+        width = joint_count * 3
+        for frame_idx, frame_data in enumerate(frames):
+            if not frame_data:
+                continue
+            record = _frame_record(frame_data)
+            if isinstance(record, dict):
+                keypoints = record.get(key)
+                if isinstance(keypoints, list) and len(keypoints) >= width:
+                    indices.append(frame_idx)
+                    rows.append(keypoints if len(keypoints) == width else keypoints[:width])
+    else:
+        for frame_idx, frame_data in enumerate(frames):
+            if frame_data and isinstance(frame_data, (list, tuple)):
+                indices.append(frame_idx)
+                rows.append(frame_data)
+    return indices, rows
+
+
+def _frame_points(row: Any, layout: str, joint_count: int) -> np.ndarray:
+    """One frame as a (joint_count, 3) array; raises TypeError/ValueError when it does not fit."""
+    frame_array = np.array(row, dtype=np.float32)
+    if layout in ("dict_2d", "dict_3d") or frame_array.ndim == 1:
+        return frame_array[:joint_count * 3].reshape(joint_count, 3)
+    if frame_array.ndim == 2:
+        points = frame_array[:joint_count, :3]
+        if points.shape != (joint_count, 3):
+            raise ValueError("frame has too few joints or channels")
+        return points
+    raise ValueError("frame is not a keypoint array")
+
+
+def _stack_points(rows: List[Any], layout: str, joint_count: int) -> Optional[np.ndarray]:
+    """All rows as one (rows, joint_count, 3) array, or None when they are ragged or malformed."""
+    try:
+        values = np.array(rows, dtype=np.float32)
+    except (TypeError, ValueError):
+        return None
+    if values.ndim == 2 and values.shape[1] >= joint_count * 3:
+        return values[:, :joint_count * 3].reshape(len(rows), joint_count, 3)
+    if layout == "array_2d" and values.ndim == 3 and values.shape[1] >= joint_count and values.shape[2] >= 3:
+        return values[:, :joint_count, :3]
+    return None
+
+
+def openpose_keypoints(frames: Sequence) -> Tuple[np.ndarray, Optional[np.ndarray], str]:
+    """Gather a list of per-frame keypoints into ``(joints, confidence, layout)``.
+
+    ``joints`` is (frames, joints, 3) float32. For ``pose_keypoints_2d`` the z
+    channel is 0 and the third value of each triple is returned separately as
+    ``confidence`` (frames, joints); other layouts have no confidence (None).
+    Frames without usable keypoints are left at zero (confidence 0). The layout
+    is classified once from the first frame with data, and the matching rows
+    are converted in a single ``np.array`` call; only ragged input is converted
+    frame by frame.
+    """
+    classified = _classify_frames(frames)
+    if classified is None:
+        raise ValueError("No valid frame data found in PKL")
+    layout, joint_count = classified
+
+    frame_count = len(frames)
+    joints = np.zeros((frame_count, joint_count, 3), dtype=np.float32)
+    indices, rows = _gather_rows(frames, layout, joint_count)
+    points = _stack_points(rows, layout, joint_count) if rows else None
+    if points is None and rows:
+        kept, kept_points = [], []
+        for frame_idx, row in zip(indices, rows):
+            try:
+                kept_points.append(_frame_points(row, layout, joint_count))
+            except (TypeError, ValueError):
+                continue
+            kept.append(frame_idx)
+        indices = kept
+        points = np.stack(kept_points) if kept_points else None
+    if points is not None:
+        joints[indices] = points
+
+    confidence = None
+    if layout == "dict_2d":
+        confidence = np.zeros((frame_count, joint_count), dtype=np.float32)
+        confidence[indices] = joints[indices, :, 2]
+        joints[:, :, 2] = 0.0
+    return joints, confidence, layout
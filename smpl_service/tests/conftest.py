@@ -0,0 +1,29 @@
+import pickle
+
+import numpy as np
+import pytest
+
+_VERTEX_COUNT = 6890
+_PARENTS = [-1, 0, 0, 0, 1, 2, 3, 4, 5, 6, 7, 8, 9, 9, 9, 12, 13, 14, 16, 17, 18, 19, 20, 21]
+
+
+@pytest.fixture(scope="session")
+def smpl_model_dir(tmp_path_factory):
+    """A directory with a random neutral model in the SMPL pickle layout (the real models cannot be redistributed)."""
+    rng = np.random.default_rng(0)
+    weights = rng.random((_VERTEX_COUNT, 24))
+    regressor = rng.random((24, _VERTEX_COUNT))
+    parents = np.array(_PARENTS)
+    model = {
+        "v_template": rng.normal(scale=0.3, size=(_VERTEX_COUNT, 3)),
+        "shapedirs": rng.normal(scale=0.01, size=(_VERTEX_COUNT, 3, 10)),
+        "posedirs": rng.normal(scale=0.001, size=(_VERTEX_COUNT, 3, 207)),
+        "J_regressor": regressor / regressor.sum(axis=1, keepdims=True),
+        "weights": weights / weights.sum(axis=1, keepdims=True),
+        "kintree_table": np.stack([np.where(parents < 0, 4294967295, parents), np.arange(24)]).astype(np.int64),
+        "f": rng.integers(0, _VERTEX_COUNT, size=(13776, 3)).astype(np.int64),
+    }
+    model_dir = tmp_path_factory.mktemp("smpl")
+    with open(model_dir / "SMPL_NEUTRAL.pkl", "wb") as handle:
+        pickle.dump(model, handle)
+    return model_dir
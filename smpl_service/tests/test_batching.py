@@ -0,0 +1,73 @@
+import asyncio
+import threading
+
+from smpl_service.batching import MicroBatcher
+from smpl_service.workers import WorkerPool
+
+
+def _recording_fuse(calls):
+    def fuse(key, items):
+        calls.append((key, list(items)))
+        return [item * 10 for item in items]
+
+    return fuse
+
+
+async def _with_busy_workers(pool, scenario):
+    """Occupy every worker until ``scenario`` has queued its jobs, then let them go."""
+    release = threading.Event()
+    blockers = [pool.submit(release.wait) for _ in range(pool.max_workers)]
+    await asyncio.sleep(0.05)
+    pending = asyncio.ensure_future(scenario())
+    await asyncio.sleep(0.05)
+    release.set()
+    await asyncio.gather(*blockers)
+    return await pending
+
+
+def test_fuses_more_jobs_than_there_are_workers():
+    calls = []
+
+    async def scenario():
+        pool = WorkerPool(max_workers=2, max_queue=0)
+        batcher = MicroBatcher(_recording_fuse(calls), pool, max_wait=0.0, max_batch=512)
+        jobs = lambda: asyncio.gather(*(batcher.submit("neutral", index, 30) for index in range(8)))
+        results = await _with_busy_workers(pool, jobs)
+        return results, batcher.stats()
+
+    results, stats = asyncio.run(scenario())
+    assert results == [index * 10 for index in range(8)]
+    # Every job arrived while both workers were busy, so one worker ran them all together.
+    assert calls == [("neutral", list(range(8)))]
+    assert stats["batches"] == 1 and stats["mean_jobs_per_batch"] == 8
+
+
+def test_lone_job_runs_without_waiting():
+    calls = []
+
+    async def scenario():
+        pool = WorkerPool(max_workers=2, max_queue=0)
+        batcher = MicroBatcher(_recording_fuse(calls), pool, max_wait=0.0, max_batch=512)
+        return await batcher.submit("neutral", 1, 30), batcher.stats()
+
+    result, stats = asyncio.run(scenario())
+    assert result == 10 and calls == [("neutral", [1])]
+    assert stats["mean_wait_ms"] < 50
+
+
+def test_batches_split_by_key_and_size():
+    calls = []
+
+    async def scenario():
+        pool = WorkerPool(max_workers=1, max_queue=0)
+        batcher = MicroBatcher(_recording_fuse(calls), pool, max_wait=0.0, max_batch=100)
+        jobs = lambda: asyncio.gather(
+            *(batcher.submit("male", index, 40) for index in range(5)),
+            batcher.submit("female", 7, 40),
+            batcher.submit("male", 9, 150),
+        )
+        return await _with_busy_workers(pool, jobs)
+
+    results = asyncio.run(scenario())
+    assert results == [0, 10, 20, 30, 40, 70, 90]
+    assert sorted(calls) == [("female", [7]), ("male", [0, 1]), ("male", [2, 3]), ("male", [4]), ("male", [9])]
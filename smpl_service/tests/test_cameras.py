@@ -0,0 +1,54 @@
+import io
+import json
+import pickle
+
+import numpy as np
+
+from smpl_service.main import _compute_camera_projections, _load_cameras
+
+
+def _calibrations():
+    intrinsic = np.array([[1000.0, 0.0, 960.0], [0.0, 1000.0, 540.0], [0.0, 0.0, 1.0]])
+    return [
+        {
+            "name": "Cam0",
+            "intrinsicMat": intrinsic,
+            "distortion": np.array([[0.1, -0.05, 0.001, 0.002, 0.0]]),
+            "imageSize": np.array([[1080.0], [1920.0]]),
+            "rotation": np.eye(3),
+            "translation": np.array([[0.0], [0.0], [3.0]]),
+        },
+        {
+            "name": "Cam1",
+            "intrinsicMat": intrinsic * np.array([[1.1], [1.1], [1.0]]),
+            "distortion": np.zeros((1, 5)),
+            "imageSize": np.array([[1080.0], [1920.0]]),
+            "rotation": np.array([[0.0, 0.0, -1.0], [0.0, 1.0, 0.0], [1.0, 0.0, 0.0]]),
+            "translation": np.array([[0.2], [0.0], [4.0]]),
+        },
+    ]
+
+
+def _as_json(calibrations):
+    return [{key: value.tolist() if isinstance(value, np.ndarray) else value for key, value in camera.items()} for camera in calibrations]
+
+
+def test_pickled_calibration_list_with_numpy_arrays():
+    cameras = _load_cameras(io.BytesIO(pickle.dumps(_calibrations())))
+
+    assert [camera["name"] for camera in cameras] == ["Cam0", "Cam1"]
+    for camera in cameras:
+        assert camera["intrinsicMat"].shape == (3, 3)
+        assert camera["cam_R"].shape == (3, 3)
+        assert camera["cam_T"].shape == (3,)
+        assert camera["distortion"].dtype == np.float32
+
+
+def test_pickled_and_json_calibrations_project_identically():
+    joints = np.random.default_rng(0).normal(scale=0.3, size=(12, 45, 3)).astype(np.float32)
+    from_pickle = _load_cameras(io.BytesIO(pickle.dumps(_calibrations())))
+    from_json = _load_cameras(io.BytesIO(json.dumps(_as_json(_calibrations())).encode()))
+
+    projected = _compute_camera_projections({"cameras": from_pickle}, joints)
+    assert projected.shape == (2, 12, 45, 2)
+    np.testing.assert_array_equal(projected, _compute_camera_projections({"cameras": from_json}, joints))
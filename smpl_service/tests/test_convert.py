@@ -0,0 +1,25 @@
+import pickle
+import subprocess
+import sys
+
+import numpy as np
+
+from smpl_service.convert import convert_file
+
+
+def test_convert_unwraps_and_stores_float32(tmp_path):
+    sequence = {"poses": np.zeros((4, 72)), "trans": np.ones((4, 3)), "gender": "female", "fps": 30.0, "meta": object()}
+    source = tmp_path / "trial.pkl"
+    source.write_bytes(pickle.dumps({"0": sequence}))
+
+    convert_file(source, tmp_path / "trial.npz")
+    with np.load(tmp_path / "trial.npz") as converted:
+        assert sorted(converted.files) == ["fps", "gender", "poses", "trans"]
+        assert converted["poses"].dtype == np.float32
+        assert str(converted["gender"]) == "female"
+
+
+def test_convert_does_not_load_the_service():
+    code = "import sys, smpl_service.convert; print(sorted({'torch', 'fastapi', 'smpl_service.main'} & set(sys.modules)))"
+    output = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True).stdout
+    assert output.strip() == "[]"
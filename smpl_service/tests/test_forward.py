@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+import torch
+from smplx.lbs import batch_rodrigues
+
+from smpl_service.main import SMPLProcessor
+
+_FRAMES = 70
+
+
+@pytest.fixture(scope="module")
+def processor(smpl_model_dir):
+    # Chunks of 32 frames, so 70 frames end with a partial chunk.
+    return SMPLProcessor(smpl_model_dir, batch_size=32)
+
+
+def _inputs(frames):
+    rng = np.random.default_rng(3)
+    poses = rng.normal(scale=0.3, size=(frames, 72)).astype(np.float32)
+    trans = rng.normal(size=(frames, 3)).astype(np.float32)
+    return poses, trans
+
+
+def _reference(processor, poses, betas, trans):
+    """The plain ``SMPLLayer`` forward pass over all frames at once."""
+    layer = processor._get_layer("neutral")
+    rot_mats = batch_rodrigues(torch.from_numpy(poses).reshape(-1, 3)).reshape(poses.shape[0], 24, 3, 3)
+    with torch.no_grad():
+        output = layer(
+            global_orient=rot_mats[:, :1],
+            body_pose=rot_mats[:, 1:],
+            betas=torch.from_numpy(np.ascontiguousarray(betas, dtype=np.float32)),
+            transl=torch.from_numpy(trans),
+        )
+    return output.vertices.numpy(), output.joints.numpy()
+
+
+@pytest.mark.parametrize("layout", ["broadcast", "repeated", "per-frame"])
+def test_forward_matches_the_smpl_layer(processor, layout):
+    poses, trans = _inputs(_FRAMES)
+    shape = np.random.default_rng(4).normal(size=(1, 10)).astype(np.float32)
+    if layout == "broadcast":
+        betas = np.broadcast_to(shape, (_FRAMES, 10))
+    elif layout == "repeated":
+        betas = np.repeat(shape, _FRAMES, axis=0)
+    else:
+        betas = shape + np.linspace(0.0, 1.0, _FRAMES, dtype=np.float32)[:, None]
+    assert (processor._shared_betas(betas) is None) == (layout == "per-frame")
+
+    vertices, joints, _ = processor.forward(poses, betas, trans, "neutral")
+    expected_vertices, expected_joints = _reference(processor, poses, betas, trans)
+    np.testing.assert_allclose(vertices, expected_vertices, rtol=0, atol=5e-7)
+    np.testing.assert_allclose(joints, expected_joints, rtol=0, atol=5e-7)
+
+
+@pytest.mark.parametrize("layout", ["broadcast", "per-frame"])
+def test_joints_only_matches_the_full_joints(processor, layout):
+    poses, trans = _inputs(_FRAMES)
+    betas = np.random.default_rng(5).normal(size=(_FRAMES, 10)).astype(np.float32)
+    if layout == "broadcast":
+        betas = np.broadcast_to(betas[:1], (_FRAMES, 10))
+
+    _, full_joints, _ = processor.forward(poses, betas, trans, "neutral")
+    vertices, joints, _ = processor.forward(poses, betas, trans, "neutral", joints_only=True)
+    assert vertices is None
+    np.testing.assert_allclose(joints, full_joints, rtol=0, atol=5e-7)
+
+
+@pytest.mark.parametrize("lod", [1, 2])
+def test_lod_vertices_are_the_full_vertices_at_their_ids(processor, lod):
+    poses, trans = _inputs(_FRAMES)
+    betas = np.broadcast_to(np.random.default_rng(6).normal(size=(1, 10)).astype(np.float32), (_FRAMES, 10))
+
+    full_vertices, full_joints, _ = processor.forward(poses, betas, trans, "neutral")
+    vertices, joints, _ = processor.forward(poses, betas, trans, "neutral", lod=lod)
+    vertex_ids = processor.topology("neutral", lod)["vertex_ids"]
+    assert vertices.shape == (_FRAMES, vertex_ids.shape[0], 3)
+    np.testing.assert_allclose(vertices, full_vertices[:, vertex_ids], rtol=0, atol=5e-7)
+    np.testing.assert_allclose(joints, full_joints, rtol=0, atol=5e-7)
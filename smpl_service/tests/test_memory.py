@@ -0,0 +1,60 @@
+import tracemalloc
+
+import numpy as np
+
+from smpl_service.main import SMPLProcessor, _encode_float32
+
+_FRAMES = 256
+
+
+def _traced_peak(fn):
+    """Peak bytes of Python/numpy allocations made while ``fn`` runs (torch's own buffers are not traced)."""
+    tracemalloc.start()
+    try:
+        fn()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def _inputs(frames):
+    rng = np.random.default_rng(1)
+    poses = rng.normal(scale=0.2, size=(frames, 72)).astype(np.float32)
+    betas = np.broadcast_to(np.zeros((1, 10), dtype=np.float32), (frames, 10))
+    trans = np.zeros((frames, 3), dtype=np.float32)
+    return poses, betas, trans
+
+
+def test_forward_allocates_the_outputs_once(smpl_model_dir):
+    processor = SMPLProcessor(smpl_model_dir, batch_size=32)
+    poses, betas, trans = _inputs(_FRAMES)
+    processor.forward(poses, betas, trans, "neutral")  # load the layer outside the measurement
+
+    result = {}
+    peak = _traced_peak(lambda: result.update(zip(("vertices", "joints", "faces"), processor.forward(poses, betas, trans, "neutral"))))
+    output_bytes = result["vertices"].nbytes + result["joints"].nbytes
+    # Concatenating chunks and casting the result would need two more copies of the vertices.
+    assert result["vertices"].dtype == np.float32 and result["vertices"].shape == (_FRAMES, 6890, 3)
+    assert peak < 1.25 * output_bytes
+
+
+def test_forward_into_caller_buffers_allocates_no_outputs(smpl_model_dir):
+    processor = SMPLProcessor(smpl_model_dir, batch_size=32)
+    poses, betas, trans = _inputs(_FRAMES)
+    expected_vertices, expected_joints, _ = processor.forward(poses, betas, trans, "neutral")
+    out_vertices = np.empty_like(expected_vertices)
+    out_joints = np.empty_like(expected_joints)
+
+    peak = _traced_peak(
+        lambda: processor.forward(poses, betas, trans, "neutral", out_vertices=out_vertices, out_joints=out_joints)
+    )
+    assert peak < 0.1 * out_vertices.nbytes
+    np.testing.assert_array_equal(out_vertices, expected_vertices)
+    np.testing.assert_array_equal(out_joints, expected_joints)
+
+
+def test_float32_encoding_does_not_copy_the_array():
+    vertices = np.random.default_rng(2).random((_FRAMES, 6890, 3), dtype=np.float32)
+    peak = _traced_peak(lambda: _encode_float32(vertices))
+    # The base64 bytes and their str decoding (4/3 of the array each); a tobytes() copy would add another 1x.
+    assert peak < 2.9 * vertices.nbytes
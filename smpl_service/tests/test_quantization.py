@@ -0,0 +1,58 @@
+import numpy as np
+import pytest
+
+from smpl_service.quantization import decode_vertices, delta_decode, delta_encode, encode_vertices
+
+
+def _walking_vertices(frames=60, points=500, seed=0):
+    """A smooth, mesh-sized trajectory: a random point cloud drifting ~2 m with small per-frame jitter."""
+    rng = np.random.default_rng(seed)
+    cloud = rng.normal(scale=[0.3, 0.8, 0.2], size=(points, 3))
+    drift = np.linspace([0.0, 0.9, 0.0], [2.0, 0.9, 0.5], frames)[:, None, :]
+    jitter = rng.normal(scale=0.005, size=(frames, points, 3))
+    return (cloud[None] + drift + jitter).astype(np.float32)
+
+
+def test_float32_encoding_is_the_identity():
+    vertices = _walking_vertices()
+    buffer, params = encode_vertices(vertices, "float32")
+    assert params is None
+    np.testing.assert_array_equal(decode_vertices(buffer, params), vertices)
+
+
+@pytest.mark.parametrize("encoding", ["int16", "int16-delta"])
+def test_int16_round_trip_is_bounded_by_max_error(encoding):
+    vertices = _walking_vertices()
+    buffer, params = encode_vertices(vertices, encoding)
+    decoded = decode_vertices(buffer, params)
+
+    assert params["scheme"] == encoding
+    assert decoded.dtype == np.float32 and decoded.shape == vertices.shape
+    error = np.abs(decoded.astype(np.float64) - vertices.astype(np.float64)).max()
+    assert error <= params["max_error"]
+    # The bound is tight: within a few float32 ulps of half a quantisation step.
+    assert params["max_error"] < max(params["scale"]) / 2.0 + 1e-6
+
+
+def test_int16_and_int16_delta_decode_identically():
+    vertices = _walking_vertices()
+    plain = decode_vertices(*encode_vertices(vertices, "int16"))
+    delta = decode_vertices(*encode_vertices(vertices, "int16-delta"))
+    np.testing.assert_array_equal(plain, delta)
+
+
+def test_delta_coding_wraps_around_int16():
+    quantized = np.array([[[-32768, 32767, 0]], [[32767, -32768, 1]], [[0, 0, -32768]]], dtype=np.int16)
+    np.testing.assert_array_equal(delta_decode(delta_encode(quantized)), quantized)
+
+
+def test_flat_axis_and_empty_sequence():
+    vertices = _walking_vertices(frames=5, points=20)
+    vertices[..., 2] = 1.25
+    decoded = decode_vertices(*encode_vertices(vertices, "int16"))
+    np.testing.assert_array_equal(decoded[..., 2], vertices[..., 2])
+
+    empty = np.zeros((0, 20, 3), dtype=np.float32)
+    buffer, params = encode_vertices(empty, "int16-delta")
+    assert decode_vertices(buffer, params).shape == (0, 20, 3)
+    assert params["max_error"] == 0.0
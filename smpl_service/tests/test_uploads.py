@@ -0,0 +1,40 @@
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from smpl_service.main import _prepare_sequence, app
+from smpl_service.uploads import UploadSizeLimitMiddleware
+
+
+def test_oversized_upload_response_carries_cors_headers():
+    # The service's middleware stack, in the same order, with a small upload limit.
+    limited = FastAPI()
+
+    @limited.post("/upload")
+    def upload():
+        return {}
+
+    for middleware in reversed(app.user_middleware):
+        kwargs = dict(middleware.kwargs)
+        if middleware.cls is UploadSizeLimitMiddleware:
+            kwargs["max_bytes"] = 1000
+        limited.add_middleware(middleware.cls, *middleware.args, **kwargs)
+
+    client = TestClient(limited)
+    response = client.post("/upload", content=b"x" * 5000, headers={"Origin": "http://viewer.example"})
+    assert response.status_code == 413
+    assert response.headers["access-control-allow-origin"] == "http://viewer.example"
+    assert client.post("/upload", content=b"x" * 10, headers={"Origin": "http://viewer.example"}).status_code == 200
+
+
+def test_prepared_npz_sequence_does_not_view_the_upload(tmp_path):
+    source = tmp_path / "trial.npz"
+    np.savez(source, poses=np.zeros((8, 72), np.float32), trans=np.ones((8, 3), np.float32), fps=30.0)
+
+    with open(source, "rb") as handle:
+        sequence = _prepare_sequence(handle, None)
+
+    for key, value in sequence.items():
+        while isinstance(value, np.ndarray):
+            assert not isinstance(value, np.memmap), key
+            value = value.base
@@ -0,0 +1,47 @@
+import asyncio
+import itertools
+import time
+
+from smpl_service.workers import WorkerPool
+
+
+def _frames():
+    for index in itertools.count():
+        time.sleep(0.001)
+        yield index
+
+
+async def _wait_for_idle(pool, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while pool.stats()["in_flight"] and time.monotonic() < deadline:
+        await asyncio.sleep(0.05)
+    return pool.stats()["in_flight"]
+
+
+def test_unread_stream_frees_its_worker():
+    async def scenario():
+        pool = WorkerPool(max_workers=1, max_queue=0)
+        pool.iterate(_frames(), buffer_size=2, idle_timeout=0.2)  # never consumed
+        assert await _wait_for_idle(pool) == 0
+        assert await pool.run(lambda: "free") == "free"
+
+    asyncio.run(scenario())
+
+
+def test_stream_closed_after_first_item_frees_its_worker():
+    async def scenario():
+        pool = WorkerPool(max_workers=1, max_queue=0)
+        stream = pool.iterate(_frames(), buffer_size=2)
+        assert await stream.__anext__() == 0
+        await stream.aclose()
+        assert await _wait_for_idle(pool) == 0
+
+    asyncio.run(scenario())
+
+
+def test_stream_yields_everything_in_order():
+    async def scenario():
+        pool = WorkerPool(max_workers=1, max_queue=0)
+        return [item async for item in pool.iterate(iter(range(20)), buffer_size=3)]
+
+    assert asyncio.run(scenario()) == list(range(20))
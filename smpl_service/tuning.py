@@ -0,0 +1,170 @@
+"""Calibration of the SMPL batch size and torch intra-op thread count.
+
+Each uvicorn process runs ``worker_threads`` concurrent SMPL jobs and every job
+spawns ``torch_threads`` intra-op threads, so the useful thread count per job
+is bounded by ``cpu_count // (processes * worker_threads)``. The calibration
+benchmarks ``SMPLProcessor.forward`` for every batch size and every thread
+count within that budget, then stores the fastest combination as JSON. The
+service applies it on startup, rescaling the thread count when it runs with a
+different process or worker layout than the one it was calibrated for.
+
+Run it separately with::
+
+    python -m smpl_service.tuning --processes 4 --worker-threads 2
+"""
+
+import argparse
+import json
+import os
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import torch
+
+
+DEFAULT_BATCH_SIZES = (32, 64, 128, 256, 512)
+_BENCHMARK_REPEATS = 3
+
+
+def thread_budget(processes: int, worker_threads: int, cpu_count: Optional[int] = None) -> int:
+    """Intra-op threads each concurrent SMPL job can use without oversubscribing the host."""
+    cpu_count = cpu_count or os.cpu_count() or 1
+    return max(1, cpu_count // max(1, processes * worker_threads))
+
+
+def _thread_candidates(budget: int) -> List[int]:
+    candidates = {budget}
+    threads = 1
+    while threads < budget:
+        candidates.add(threads)
+        threads *= 2
+    return sorted(candidates)
+
+
+def calibrate(
+    processor,
+    processes: int,
+    worker_threads: int,
+    batch_sizes: Sequence[int] = DEFAULT_BATCH_SIZES,
+    gender: str = "neutral",
+) -> Dict:
+    """Benchmark ``processor.forward`` and return the best configuration with all measurements.
+
+    Uses a synthetic sequence of ``2 * max(batch_sizes)`` frames with a shared
+    shape vector (the common OpenCap case) and keeps the best of a few runs per
+    combination. The processor's batch size and torch's thread count are
+    restored afterwards.
+    """
+    frames = 2 * max(batch_sizes)
+    rng = np.random.default_rng(0)
+    poses = (rng.standard_normal((frames, 72)) * 0.2).astype(np.float32)
+    betas = np.broadcast_to(np.zeros((1, 10), dtype=np.float32), (frames, 10))
+    trans = np.zeros((frames, 3), dtype=np.float32)
+
+    budget = thread_budget(processes, worker_threads)
+    original_batch_size = processor.batch_size
+    original_threads = torch.get_num_threads()
+    measurements = []
+    try:
+        processor.forward(poses[:batch_sizes[0]], betas[:batch_sizes[0]], trans[:batch_sizes[0]], gender)
+        for threads in _thread_candidates(budget):
+            torch.set_num_threads(threads)
+            for batch_size in batch_sizes:
+                processor.batch_size = int(batch_size)
+                best = float("inf")
+                for _ in range(_BENCHMARK_REPEATS):
+                    started = time.perf_counter()
+                    processor.forward(poses, betas, trans, gender)
+                    best = min(best, time.perf_counter() - started)
+                measurements.append({
+                    "torch_threads": threads,
+                    "batch_size": int(batch_size),
+                    "frames_per_second": frames / best,
+                })
+    finally:
+        processor.batch_size = original_batch_size
+        torch.set_num_threads(original_threads)
+
+    fastest = max(measurements, key=lambda item: item["frames_per_second"])
+    return {
+        "batch_size": fastest["batch_size"],
+        "torch_threads": fastest["torch_threads"],
+        "frames_per_second": fastest["frames_per_second"],
+        "cpu_count": os.cpu_count(),
+        "processes": processes,
+        "worker_threads": worker_threads,
+        "torch_version": torch.__version__,
+        "calibrated_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "measurements": measurements,
+    }
+
+
+def save_tuning(path: Path, tuning: Dict) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    tmp_path.write_text(json.dumps(tuning, indent=2))
+    os.replace(tmp_path, path)
+
+
+def load_tuning(path: Path) -> Optional[Dict]:
+    if not path.exists():
+        return None
+    try:
+        return json.loads(path.read_text())
+    except Exception as exc:
+        print(f"Warning: Ignoring unreadable SMPL tuning file {path}: {exc}")
+        return None
+
+
+def resolve_tuning(tuning: Optional[Dict], processes: int, worker_threads: int) -> Dict[str, Optional[int]]:
+    """Batch size and torch thread count to use for this process's layout.
+
+    A calibration made for another CPU count or process/worker layout keeps its
+    batch size, but its thread count is capped at the current per-job budget.
+    """
+    budget = thread_budget(processes, worker_threads)
+    if tuning is None:
+        return {"batch_size": None, "torch_threads": budget}
+
+    threads = int(tuning["torch_threads"])
+    same_layout = (
+        tuning.get("cpu_count") == os.cpu_count()
+        and tuning.get("processes") == processes
+        and tuning.get("worker_threads") == worker_threads
+    )
+    if not same_layout:
+        print(
+            "Warning: SMPL tuning was calibrated for "
+            f"{tuning.get('processes')}x{tuning.get('worker_threads')} workers on {tuning.get('cpu_count')} CPUs; "
+            f"capping torch threads at {budget}."
+        )
+        threads = min(threads, budget)
+    return {"batch_size": int(tuning["batch_size"]), "torch_threads": max(1, threads)}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Benchmark SMPL evaluation and store the fastest configuration.")
+    parser.add_argument("--output", type=Path, default=None, help="Tuning file (default: SMPL_TUNING_FILE).")
+    parser.add_argument("--processes", type=int, default=None, help="uvicorn worker processes per host.")
+    parser.add_argument("--worker-threads", type=int, default=None, help="SMPL worker threads per process.")
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=list(DEFAULT_BATCH_SIZES))
+    parser.add_argument("--gender", default="neutral")
+    args = parser.parse_args(argv)
+
+    # Imported here so that importing this module from the service stays cheap and acyclic.
+    from smpl_service import main as service
+
+    processes = args.processes or service.SMPL_PROCESS_COUNT
+    worker_threads = args.worker_threads or service.SMPL_WORKER_THREADS
+    output = args.output or service.SMPL_TUNING_FILE
+    tuning = calibrate(service.processor, processes, worker_threads, args.batch_sizes, args.gender)
+    save_tuning(output, tuning)
+    for item in tuning["measurements"]:
+        print(f"threads={item['torch_threads']:<3} batch={item['batch_size']:<4} {item['frames_per_second']:10.1f} frames/s")
+    print(f"Best: batch_size={tuning['batch_size']} torch_threads={tuning['torch_threads']} -> {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+import hashlib
+from typing import BinaryIO, Optional
+
+from fastapi import HTTPException, UploadFile
+from fastapi.responses import JSONResponse
+
+_HASH_CHUNK_BYTES = 4 * 1024 * 1024
+
+
+class UploadSizeLimitMiddleware:
+    """Reject request bodies larger than ``max_bytes`` with 413 before they are parsed.
+
+    A declared Content-Length over the limit is refused without reading the body;
+    otherwise the body is counted as it streams in (chunked uploads included) and
+    the request fails as soon as the limit is crossed, before the multipart
+    parser has spooled the rest.
+    """
+
+    def __init__(self, app, max_bytes: int):
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or self.max_bytes <= 0:
+            await self.app(scope, receive, send)
+            return
+
+        detail = f"Upload exceeds the {self.max_bytes} byte limit."
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > self.max_bytes:
+            await JSONResponse({"detail": detail}, status_code=413)(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > self.max_bytes:
+                    raise HTTPException(status_code=413, detail=detail)
+            return message
+
+        await self.app(scope, limited_receive, send)
+
+
+def upload_file(upload: Optional[UploadFile]) -> Optional[BinaryIO]:
+    """The upload's spooled file, rewound, so it is decoded from there instead of being read into memory.
+
+    Starlette keeps small parts in memory and rolls larger ones over to a
+    temporary file while parsing the request. Empty parts count as absent.
+    """
+    if upload is None or upload.size == 0:
+        return None
+    upload.file.seek(0)
+    return upload.file
+
+
+def upload_digest(handle: Optional[BinaryIO]) -> Optional[bytes]:
+    """SHA-256 of a file's contents, read in chunks (None for a missing upload)."""
+    if handle is None:
+        return None
+    digest = hashlib.sha256()
+    handle.seek(0)
+    for chunk in iter(lambda: handle.read(_HASH_CHUNK_BYTES), b""):
+        digest.update(chunk)
+    handle.seek(0)
+    return digest.digest()
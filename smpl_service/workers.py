@@ -0,0 +1,157 @@
+import asyncio
+import functools
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, AsyncIterator, Callable, Dict, Iterable
+
+
+class WorkerPoolFull(RuntimeError):
+    """Raised when every worker is busy and the backlog is at capacity."""
+
+
+class WorkerPool:
+    """Thread pool for CPU-heavy SMPL work with a bounded backlog.
+
+    At most ``max_workers`` jobs run at once and at most ``max_queue`` more may
+    wait; anything beyond that is rejected immediately with :class:`WorkerPoolFull`
+    so the caller can answer 503 instead of stalling the event loop. Torch and
+    numpy release the GIL inside their kernels, so threads give real parallelism
+    for the heavy stages while keeping the loaded SMPL layers shared.
+    """
+
+    def __init__(self, max_workers: int, max_queue: int):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="smpl-worker")
+        self._slots = threading.BoundedSemaphore(max_workers + max_queue)
+        self._lock = threading.Lock()
+        self._pending = 0
+        self._rejected = 0
+        self._completed = 0
+
+    def _reserve(self) -> None:
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self._rejected += 1
+            raise WorkerPoolFull(f"SMPL workers busy ({self.max_workers} running, {self.max_queue} queued)")
+        with self._lock:
+            self._pending += 1
+
+    def _finish(self, _future=None) -> None:
+        with self._lock:
+            self._pending -= 1
+            self._completed += 1
+
+    def _release(self, _future=None) -> None:
+        self._finish()
+        self._slots.release()
+
+    def submit(self, fn: Callable, *args, **kwargs) -> "asyncio.Future":
+        """Schedule ``fn`` on the pool and return an awaitable for its result.
+
+        The slot is released when the job itself finishes, not when the awaiting
+        request goes away, so abandoned work still counts against the bound.
+        """
+        self._reserve()
+        try:
+            future = self._executor.submit(functools.partial(fn, *args, **kwargs))
+        except BaseException:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+        return asyncio.wrap_future(future)
+
+    def submit_admitted(self, fn: Callable, *args, **kwargs) -> "asyncio.Future":
+        """Like :meth:`submit`, for a later stage of work that the pool has already admitted.
+
+        The job runs on the same workers but is never rejected, so a request is
+        not turned away half way through; the extra backlog is bounded by the
+        requests already admitted.
+        """
+        with self._lock:
+            self._pending += 1
+        try:
+            future = self._executor.submit(functools.partial(fn, *args, **kwargs))
+        except BaseException:
+            self._finish()
+            raise
+        future.add_done_callback(self._finish)
+        return asyncio.wrap_future(future)
+
+    async def run(self, fn: Callable, *args, **kwargs) -> Any:
+        return await self.submit(fn, *args, **kwargs)
+
+    async def run_admitted(self, fn: Callable, *args, **kwargs) -> Any:
+        return await self.submit_admitted(fn, *args, **kwargs)
+
+    def iterate(self, iterable: Iterable, buffer_size: int = 4, idle_timeout: float = 60.0) -> AsyncIterator:
+        """Drain a (lazy, CPU-heavy) iterable on one worker and expose it asynchronously.
+
+        Admission happens here, before the caller starts a response. At most
+        ``buffer_size`` items are produced ahead of the consumer; if the consumer
+        stops early the producer is told to stop at its next item. A consumer
+        that never starts (e.g. the client went away before the response began)
+        cannot say so, so the producer also gives up, and frees its worker, once
+        the buffer has stayed full for ``idle_timeout`` seconds.
+        """
+        loop = asyncio.get_running_loop()
+        queue: "asyncio.Queue" = asyncio.Queue()
+        capacity = threading.Semaphore(buffer_size)
+        cancelled = threading.Event()
+        done = object()
+
+        def wait_for_capacity() -> bool:
+            deadline = time.monotonic() + idle_timeout
+            while not capacity.acquire(timeout=min(0.5, idle_timeout)):
+                if cancelled.is_set():
+                    return False
+                if time.monotonic() >= deadline:
+                    cancelled.set()
+                    error = TimeoutError(f"Stream consumer read nothing for {idle_timeout:g} s")
+                    loop.call_soon_threadsafe(queue.put_nowait, (done, error))
+                    return False
+            return not cancelled.is_set()
+
+        def produce():
+            try:
+                for item in iterable:
+                    if not wait_for_capacity():
+                        return
+                    loop.call_soon_threadsafe(queue.put_nowait, (item, None))
+            except BaseException as exc:  # re-raised on the consumer side
+                loop.call_soon_threadsafe(queue.put_nowait, (done, exc))
+                return
+            finally:
+                # Run the iterable's own cleanup on the thread that drove it.
+                close = getattr(iterable, "close", None)
+                if close is not None:
+                    close()
+            loop.call_soon_threadsafe(queue.put_nowait, (done, None))
+
+        self.submit(produce)
+
+        async def consume():
+            try:
+                while True:
+                    item, error = await queue.get()
+                    if item is done:
+                        if error is not None:
+                            raise error
+                        return
+                    capacity.release()
+                    yield item
+            finally:
+                cancelled.set()
+
+        return consume()
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "max_workers": self.max_workers,
+                "max_queue": self.max_queue,
+                "in_flight": self._pending,
+                "completed": self._completed,
+                "rejected": self._rejected,
+            }